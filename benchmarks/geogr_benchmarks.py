@@ -0,0 +1,75 @@
+import numpy as np
+
+from trackintel.geogr import kernels
+
+
+def _law_of_cosines(lon_1, lat_1, lon_2, lat_2, r=6371000):
+    """Distance formula used by point_haversine_dist up to trackintel 1.2.4 as reference."""
+    lon_1 = np.deg2rad(lon_1)
+    lat_1 = np.deg2rad(lat_1)
+    lon_2 = np.deg2rad(lon_2)
+    lat_2 = np.deg2rad(lat_2)
+    cos_lat_d = np.cos(lat_1 - lat_2)
+    cos_lon_d = np.cos(lon_1 - lon_2)
+    return r * np.arccos(cos_lat_d - np.cos(lat_1) * np.cos(lat_2) * (1 - cos_lon_d))
+
+
+class BM_Haversine:
+    """Benchmarks for the distance kernels compared to the law of cosines formula"""
+
+    params = [10_000, 1_000_000]
+    param_names = ["n"]
+
+    def setup(self, n):
+        rng = np.random.default_rng(0)
+        self.lon_1 = rng.uniform(8.4, 8.6, n)
+        self.lat_1 = rng.uniform(47.3, 47.4, n)
+        # steps between 1 m and 1 km
+        step = np.logspace(-5, -2, n)
+        angle = rng.uniform(0, 2 * np.pi, n)
+        self.lon_2 = self.lon_1 + step * np.cos(angle)
+        self.lat_2 = self.lat_1 + step * np.sin(angle)
+        self.coords = (self.lon_1, self.lat_1, self.lon_2, self.lat_2)
+        self.out = np.empty(n)
+        # vincenty formula is well-conditioned for all distances on the sphere -> reference
+        lon_1, lat_1, lon_2, lat_2 = map(np.deg2rad, self.coords)
+        d_lon = lon_2 - lon_1
+        num = np.hypot(
+            np.cos(lat_2) * np.sin(d_lon),
+            np.cos(lat_1) * np.sin(lat_2) - np.sin(lat_1) * np.cos(lat_2) * np.cos(d_lon),
+        )
+        den = np.sin(lat_1) * np.sin(lat_2) + np.cos(lat_1) * np.cos(lat_2) * np.cos(d_lon)
+        self.reference = 6371000 * np.arctan2(num, den)
+
+    def time_law_of_cosines(self, n):
+        _law_of_cosines(*self.coords)
+
+    def time_haversine(self, n):
+        kernels.haversine(*self.coords)
+
+    def time_haversine_out(self, n):
+        kernels.haversine(*self.coords, out=self.out)
+
+    def time_haversine_float32(self, n):
+        kernels.haversine(*self.coords, dtype=np.float32)
+
+    def time_equirectangular(self, n):
+        kernels.equirectangular(*self.coords)
+
+    def peakmem_law_of_cosines(self, n):
+        _law_of_cosines(*self.coords)
+
+    def peakmem_haversine(self, n):
+        kernels.haversine(*self.coords)
+
+    def track_max_error_law_of_cosines(self, n):
+        return np.nanmax(np.abs(_law_of_cosines(*self.coords) - self.reference))
+
+    def track_max_error_haversine(self, n):
+        return np.max(np.abs(kernels.haversine(*self.coords) - self.reference))
+
+    def track_max_error_haversine_float32(self, n):
+        return np.max(np.abs(kernels.haversine(*self.coords, dtype=np.float32) - self.reference))
+
+    def track_max_error_equirectangular(self, n):
+        return np.max(np.abs(kernels.equirectangular(*self.coords) - self.reference))
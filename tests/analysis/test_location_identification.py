@@ -11,6 +11,7 @@ from shapely.geometry import Point
 from trackintel.analysis.location_identification import (
     _freq_assign,
     _freq_transform,
+    _location_stats,
     _osna_label_timeframes,
     freq_method,
     location_identifier,
@@ -114,6 +115,16 @@ class TestPre_Filter:
         f = pre_filter_locations(example_staypoints, **default_kwargs)
         assert_index_equal(f.index, example_staypoints.index)
 
+    def test_location_stats(self, example_staypoints):
+        """Test if the statistics are broadcast to every staypoint."""
+        stats = _location_stats(example_staypoints, agg_level="user")
+        assert_index_equal(stats.index, example_staypoints.index)
+        assert stats["user_n_sp"].tolist() == [3, 3, 3, 1]
+        assert stats["user_n_loc"].tolist() == [2, 2, 2, 1]
+        assert stats["loc_n_sp"].tolist() == [2, 2, 1, 1]
+        assert stats["loc_duration"].tolist() == [pd.Timedelta("7h")] * 2 + [pd.Timedelta("40h"), pd.Timedelta("1h")]
+        assert stats["loc_period"].tolist() == [pd.Timedelta("7h")] * 2 + [pd.Timedelta("40h"), pd.Timedelta("1h")]
+
 
 @pytest.fixture
 def example_freq():
@@ -196,34 +207,53 @@ class Test_Freq_Transform:
     def test_function(self):
         """Test if groupby assign works."""
         list_dict = [
-            {"location_id": 0, "duration": 1},
-            {"location_id": 0, "duration": 1},
-            {"location_id": 1, "duration": 1},
+            {"user_id": 0, "location_id": 0, "duration": 1},
+            {"user_id": 0, "location_id": 0, "duration": 1},
+            {"user_id": 0, "location_id": 1, "duration": 1},
+            {"user_id": 1, "location_id": 0, "duration": 1},
+            {"user_id": 1, "location_id": 1, "duration": 3},
         ]
         df = pd.DataFrame(list_dict)
         freq = _freq_transform(df, "work")
-        sol = pd.Series(["work", "work", None])
+        sol = pd.Series(["work", "work", None, None, "work"], name="purpose")
         assert freq.equals(sol)
 
+    def test_missing_location(self):
+        """Test if staypoints without location get no label."""
+        list_dict = [
+            {"user_id": 0, "location_id": 0, "duration": 1},
+            {"user_id": 0, "location_id": np.nan, "duration": 5},
+        ]
+        df = pd.DataFrame(list_dict)
+        freq = _freq_transform(df, "home", "work")
+        assert freq.iloc[0] == "home"
+        assert pd.isna(freq.iloc[1])
+
 
 class Test_Freq_Assign:
     """Test help function _freq_assign."""
 
     def test_function(self):
         """Test function with simple input."""
-        dur = pd.Series([9, 0, 8, 1, 7, 6, 5])
+        dur = pd.Series([9, 0, 8, 1, 7, 6, 5], index=pd.MultiIndex.from_product([[0], range(7)]))
         labels = ("label1", "label2", "label3")
         freq_sol = np.array([labels[0], None, labels[1], None, labels[2], None, None])
         freq = _freq_assign(dur, *labels)
         assert all(freq == freq_sol)
 
     def test_more_labels_than_entries(self):
-        dur = pd.Series([9, 0])
+        dur = pd.Series([9, 0], index=pd.MultiIndex.from_product([[0], range(2)]))
         labels = ("label1", "label2", "label3")
         freq_sol = np.array([labels[0], labels[1]])
         freq = _freq_assign(dur, *labels)
         assert all(freq == freq_sol)
 
+    def test_per_user(self):
+        """Test if the labels are assigned per user and ties are resolved in index order."""
+        dur = pd.Series([1, 2, 2, 2], index=pd.MultiIndex.from_tuples([(0, 0), (0, 1), (1, 0), (1, 1)]))
+        freq = _freq_assign(dur, "home", "work")
+        assert all(freq == np.array(["work", "home", "home", "work"]))
+
 
 class TestLocation_Identifier:
     """Test function `location_identifier`"""
@@ -465,10 +495,8 @@ class Test_osna_label_timeframes:
         t2 = pd.Timestamp("2021-05-22 07:00:00")
         t3 = pd.Timestamp("2021-05-22 08:00:00")
         t4 = pd.Timestamp("2021-05-22 20:00:00")
-        assert _osna_label_timeframes(t1) == "weekend"
-        assert _osna_label_timeframes(t2) == "weekend"
-        assert _osna_label_timeframes(t3) == "weekend"
-        assert _osna_label_timeframes(t4) == "weekend"
+        labels = _osna_label_timeframes(pd.Series([t1, t2, t3, t4]))
+        assert (labels == "weekend").all()
 
     def test_weekday(self):
         """Test the different labels on a weekday."""
@@ -477,8 +505,14 @@ class Test_osna_label_timeframes:
         t3 = pd.Timestamp("2021-05-20 08:00:00")
         t4 = pd.Timestamp("2021-05-20 19:00:00")
         t5 = pd.Timestamp("2021-05-20 18:59:59")
-        assert _osna_label_timeframes(t1) == "leisure"
-        assert _osna_label_timeframes(t2) == "rest"
-        assert _osna_label_timeframes(t3) == "work"
-        assert _osna_label_timeframes(t4) == "leisure"
-        assert _osna_label_timeframes(t5) == "work"
+        labels = _osna_label_timeframes(pd.Series([t1, t2, t3, t4, t5]))
+        assert labels.tolist() == ["leisure", "rest", "work", "leisure", "work"]
+
+    def test_schedule_per_weekday(self):
+        """Test if the timeframes can be set per day of the week."""
+        thursday = pd.Timestamp("2021-05-20 15:00:00")
+        friday = pd.Timestamp("2021-05-21 15:00:00")
+        sunday = pd.Timestamp("2021-05-23 15:00:00")
+        start_leisure = [19, 19, 19, 19, 14, 19, 19]
+        labels = _osna_label_timeframes(pd.Series([thursday, friday, sunday]), weekend=[5], start_leisure=start_leisure)
+        assert labels.tolist() == ["work", "leisure", "work"]
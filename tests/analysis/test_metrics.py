@@ -1,11 +1,11 @@
 import pytest
 import numpy as np
 import pandas as pd
-from pandas.testing import assert_series_equal
+from pandas.testing import assert_frame_equal, assert_series_equal
 from shapely.geometry import Point
 
 import trackintel as ti
-from trackintel.analysis import radius_gyration, jump_length
+from trackintel.analysis import radius_gyration, jump_length, mobility_metrics
 from trackintel.geogr import point_haversine_dist
 
 
@@ -70,10 +70,24 @@ class TestRadius_gyration:
         v2 = np.sqrt(np.mean(d2**2))
         assert_series_equal(s, pd.Series([v1, v2]), check_index=False, check_names=False)
 
+    def test_antimeridian(self, staypoints):
+        """Test if the center is calculated correctly for points around the antimeridian."""
+        staypoints = staypoints.iloc[:2].set_crs(4326, allow_override=True)
+        staypoints["geom"] = [Point(179.0, 0.0), Point(-179.0, 0.0)]
+        s = radius_gyration(staypoints)
+        # center is (180, 0) and not (0, 0)
+        assert np.isclose(s.iloc[0], point_haversine_dist(179, 0, 180, 0, float_flag=True))
+
     def test_tqdm(self, staypoints):
         """Test if tqdm works fine"""
         radius_gyration(staypoints, print_progress=True)
 
+    def test_missing_user(self, staypoints, staypoints_missing_user):
+        """Test if staypoints without user are ignored."""
+        for method in ["count", "duration"]:
+            s = radius_gyration(staypoints_missing_user, method=method)
+            assert_series_equal(s, radius_gyration(staypoints, method=method), check_index_type=False)
+
     def test_staypoints_method(self, staypoints):
         """Test if staypoint method returns same result"""
         sfunc = radius_gyration(staypoints)
@@ -115,8 +129,104 @@ class TestJump_length:
         s1.index = staypoints.index
         assert_series_equal(s1, s2)
 
+    def test_missing_user(self, staypoints, staypoints_missing_user):
+        """Test if staypoints without user have no jump and don't change the jumps of the users."""
+        s = jump_length(staypoints_missing_user)
+        assert s.loc[[9, 10]].isna().all()
+        assert_series_equal(s.drop([9, 10]).sort_index(), jump_length(staypoints).sort_index())
+
     def test_staypoints_method(self, staypoints):
         """Test if staypoint method returns same result"""
         sfunc = jump_length(staypoints)
         smeth = staypoints.jump_length()
         assert_series_equal(sfunc, smeth)
+
+
+@pytest.fixture
+def staypoints_missing_user(staypoints):
+    """Staypoints with two additional staypoints without user in between the staypoints of the first user."""
+    extra = staypoints.iloc[[1, 2]].copy()
+    extra.index = [9, 10]
+    extra["user_id"] = np.nan
+    extra["geom"] = [Point(100.0, 100.0), Point(200.0, 100.0)]
+    return pd.concat([staypoints.iloc[:1], extra, staypoints.iloc[1:]])
+
+
+@pytest.fixture
+def staypoints_locs(staypoints):
+    """Staypoints with one location per unique point."""
+    staypoints["location_id"] = [0, 1, 2, 0, 0, 2]
+    return staypoints
+
+
+class TestMobility_metrics:
+    def test_radius_gyration(self, staypoints_locs):
+        """Test if radius_gyration agrees with the single metric."""
+        for method in ["count", "duration"]:
+            metrics = mobility_metrics(staypoints_locs, metrics=["radius_gyration"], method=method)
+            assert_series_equal(metrics["radius_gyration"], radius_gyration(staypoints_locs, method=method))
+
+    def test_jump_length(self, staypoints_locs):
+        """Test if jump_length is the mean jump length of the user."""
+        metrics = mobility_metrics(staypoints_locs, metrics=["jump_length"])
+        jl = jump_length(staypoints_locs).groupby(staypoints_locs["user_id"]).mean()
+        assert_series_equal(metrics["jump_length"], jl, check_names=False)
+
+    def test_k_radius_gyration(self, staypoints_locs):
+        """Test if only the k most visited locations are used."""
+        metrics = mobility_metrics(staypoints_locs, metrics=["k_radius_gyration"], k=1)
+        # user 0 visits all locations once -> first location is taken
+        assert (metrics["k_radius_gyration"] == 0).all()
+        metrics = mobility_metrics(staypoints_locs, metrics=["k_radius_gyration"], k=3)
+        assert_series_equal(metrics["k_radius_gyration"], radius_gyration(staypoints_locs), check_names=False)
+
+    def test_locations(self, staypoints_locs):
+        """Test n_locations and entropy."""
+        metrics = mobility_metrics(staypoints_locs, metrics=["n_locations", "entropy"])
+        assert metrics["n_locations"].tolist() == [3, 2]
+        entropy_1 = -(2 / 3 * np.log2(2 / 3) + 1 / 3 * np.log2(1 / 3))
+        assert np.allclose(metrics["entropy"], [np.log2(3), entropy_1])
+
+    def test_missing_location(self, staypoints_locs):
+        """Test if staypoints without location are ignored."""
+        staypoints_locs["location_id"] = [0, 1, 2, 0, 0, np.nan]
+        metrics = mobility_metrics(staypoints_locs, metrics=["n_locations", "entropy"])
+        assert metrics["n_locations"].tolist() == [3, 1]
+        assert np.allclose(metrics["entropy"], [np.log2(3), 0])
+
+    def test_waiting_time(self, staypoints_locs):
+        """Test mean and median of the staypoint durations."""
+        metrics = mobility_metrics(staypoints_locs, metrics=["waiting_time"])
+        assert metrics["waiting_time_mean"].tolist() == [4800, 2400]
+        assert metrics["waiting_time_median"].tolist() == [3600, 3600]
+
+    def test_all(self, staypoints_locs):
+        """Test if by default all metrics are returned per user."""
+        metrics = mobility_metrics(staypoints_locs)
+        assert metrics.index.name == "user_id"
+        assert metrics.index.tolist() == [0, 1]
+        assert len(metrics.columns) == 7
+
+    def test_missing_user(self, staypoints, staypoints_missing_user):
+        """Test if staypoints without user are ignored."""
+        staypoints["location_id"] = [0, 1, 2, 0, 0, 2]
+        staypoints_missing_user["location_id"] = [0, 3, 3, 1, 2, 0, 0, 2]
+        metrics = mobility_metrics(staypoints_missing_user)
+        assert_frame_equal(metrics, mobility_metrics(staypoints), check_index_type=False)
+
+    def test_unknown_metric(self, staypoints_locs):
+        """Test if unknown metric raises a ValueError"""
+        with pytest.raises(ValueError):
+            mobility_metrics(staypoints_locs, metrics=["unknown"])
+
+    def test_no_location(self, staypoints):
+        """Test if a KeyError is raised for location metrics without location_id."""
+        mobility_metrics(staypoints, metrics=["radius_gyration", "waiting_time"])
+        with pytest.raises(KeyError):
+            mobility_metrics(staypoints, metrics=["entropy"])
+
+    def test_staypoints_method(self, staypoints_locs):
+        """Test if staypoint method returns same result"""
+        mfunc = mobility_metrics(staypoints_locs)
+        mmeth = staypoints_locs.mobility_metrics()
+        pd.testing.assert_frame_equal(mfunc, mmeth)
@@ -1,14 +1,21 @@
 import datetime
 import os
+import warnings
 
 import geopandas as gpd
 import numpy as np
 import pandas as pd
-from pandas.testing import assert_series_equal
+from pandas.testing import assert_frame_equal, assert_series_equal
 import pytest
 from shapely.geometry import LineString
 
-from trackintel.analysis.modal_split import _calculate_length, calculate_modal_split
+from trackintel.analysis.modal_split import (
+    _calculate_length,
+    calculate_modal_split,
+    calculate_modal_split_cube,
+    modal_split_from_cube,
+    update_modal_split_cube,
+)
 from trackintel.geogr.distances import calculate_haversine_length
 from trackintel.io.dataset_reader import read_geolife, geolife_add_modes_to_triplegs
 
@@ -172,6 +179,21 @@ class TestModalSplit:
         assert np.isclose(modal_split.loc[0, "walk"], datetime.timedelta(hours=2).total_seconds())
         assert np.isclose(modal_split.loc[1, "walk"], datetime.timedelta(hours=2).total_seconds())
 
+    def test_duration_without_length(self, test_triplegs_modal_split, monkeypatch):
+        """Check that the duration is calculated from the timestamps only, without crs warning or length."""
+
+        def fail(tpls):
+            raise AssertionError("calculate_tripleg_stats called")
+
+        monkeypatch.setattr("trackintel.analysis.modal_split.calculate_tripleg_stats", fail)
+        tpls = test_triplegs_modal_split
+        tpls = gpd.GeoDataFrame(tpls.drop(columns="geometry"), geometry=np.asarray(tpls.geometry.values))
+        assert tpls.crs is None
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            modal_split = calculate_modal_split(tpls, metric="duration", per_user=True)
+        assert np.isclose(modal_split.loc[0, "car"], datetime.timedelta(hours=1).total_seconds())
+
     def test_modal_split_daily_count(self, test_triplegs_modal_split):
         """Check counts per user and mode binned by day"""
         tpls = test_triplegs_modal_split
@@ -208,6 +230,47 @@ class TestModalSplit:
             calculate_modal_split(test_triplegs_modal_split, metric=metric)
 
 
+class TestModalSplitCube:
+    def test_cube(self, test_triplegs_modal_split):
+        """Check the aggregation per user, day and mode."""
+        cube = calculate_modal_split_cube(test_triplegs_modal_split)
+        assert cube.index.names == ["user_id", "timestamp", "mode"]
+        t_1 = pd.Timestamp("1970-01-01 00:00:00", tz="utc")
+        assert cube.loc[(1, t_1, "walk"), "count"] == 2
+        assert cube.loc[(0, t_1, "car"), "duration"] == datetime.timedelta(hours=1).total_seconds()
+
+    def test_rollup(self, read_geolife_with_modes):
+        """Check if the cube returns the same as calculate_modal_split for all day-aligned frequencies."""
+        tpls = read_geolife_with_modes
+        cube = tpls.as_triplegs.calculate_modal_split_cube()
+        for metric in ["duration", "distance", "count"]:
+            for freq in [None, "D", "W-MON", "MS"]:
+                for per_user in [False, True]:
+                    for norm in [True, False]:
+                        kw = {"metric": metric, "freq": freq, "per_user": per_user, "norm": norm}
+                        assert_frame_equal(calculate_modal_split(tpls, **kw), modal_split_from_cube(cube, **kw))
+
+    def test_update(self, read_geolife_with_modes):
+        """Check if appending triplegs to the cube equals building the cube on all triplegs."""
+        tpls = read_geolife_with_modes
+        half = len(tpls) // 2
+        cube = calculate_modal_split_cube(tpls.iloc[:half])
+        cube = update_modal_split_cube(cube, tpls.iloc[half:])
+        assert_frame_equal(cube, calculate_modal_split_cube(tpls))
+
+    def test_freq_below_day_error(self, test_triplegs_modal_split):
+        """Check if error is raised if freq is finer than the granularity of the cube."""
+        cube = calculate_modal_split_cube(test_triplegs_modal_split)
+        with pytest.raises(ValueError):
+            modal_split_from_cube(cube, freq="H")
+
+    def test_unknown_metric_error(self, test_triplegs_modal_split):
+        """Check if error is raised if unknown metric is passed."""
+        cube = calculate_modal_split_cube(test_triplegs_modal_split)
+        with pytest.raises(ValueError):
+            modal_split_from_cube(cube, metric="unknown_metric")
+
+
 class Test_calculate_length:
     """Test help function calculate_length"""
 
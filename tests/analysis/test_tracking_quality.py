@@ -7,7 +7,7 @@ import geopandas as gpd
 from shapely.geometry import Point
 
 import trackintel as ti
-from trackintel.analysis.tracking_quality import _get_times
+from trackintel.analysis.tracking_quality import _split_overlaps
 
 
 @pytest.fixture
@@ -184,16 +184,6 @@ class TestTemporal_tracking_quality:
         with pytest.raises(KeyError):
             ti.analysis.tracking_quality.temporal_tracking_quality(locs)
 
-    def test_tracking_quality_user_error(self, testdata_sp_tpls_geolife_long):
-        """Test if the an error is raised when passing unknown 'granularity' to _get_tracking_quality_user()."""
-        sp_tpls = testdata_sp_tpls_geolife_long
-        user_0 = sp_tpls.loc[sp_tpls["user_id"] == 0]
-
-        with pytest.raises(ValueError):
-            ti.analysis.tracking_quality._get_tracking_quality_user(user_0, granularity=12345)
-        with pytest.raises(ValueError):
-            ti.analysis.tracking_quality._get_tracking_quality_user(user_0, granularity="random")
-
     def test_staypoints_accessors(self, testdata_all_geolife_long):
         """Test tracking_quality calculation from staypoints accessor."""
         sp, _, _ = testdata_all_geolife_long
@@ -356,12 +346,8 @@ class TestSplit_overlaps:
         assert (sp_res["started_at"] == [start, midnight, start, midnight, midnight]).all()
         assert (sp_res["finished_at"] == [midnight, end, midnight, end, midnight]).all()
 
-
-class TestGet_times:
-    """Test if _get_times splits correctly"""
-
     def test_midnight_ns(self):
-        """Test datetimes 1 ns around midnight."""
+        """Test if records 1 ns around midnight are split at midnight and the next full hour."""
         #  Create 3 ranges for this split t1-t2, t2-t3, t3-t4
         #     mn         mn + h
         # --  | -- ... --  |  --
@@ -371,7 +357,32 @@ class TestGet_times:
         time2 = midnight
         time3 = midnight + pd.Timedelta("1h")
         time4 = time3 + pd.Timestamp.resolution
-        times = [time1, time2, time3, time4]
-        result = (times[:-1], times[1:])
-        row = pd.Series({"index": 0, "started_at": times[0], "finished_at": times[-1]})
-        assert _get_times(row, freq="H") == result
+        sp = pd.DataFrame([{"user_id": 0, "started_at": time1, "finished_at": time4}])
+        sp_res = _split_overlaps(sp, granularity="hour")
+        assert sp_res["started_at"].tolist() == [time1, time2, time3]
+        assert sp_res["finished_at"].tolist() == [time2, time3, time4]
+
+    def test_dst_day(self):
+        """Test if days are split at local midnight over daylight saving time changes."""
+        tz = "Europe/Zurich"
+        start = pd.Timestamp("2023-03-25 12:00", tz=tz)
+        end = pd.Timestamp("2023-03-27 12:00", tz=tz)
+        sp = pd.DataFrame([{"user_id": 0, "started_at": start, "finished_at": end, "duration": end - start}])
+        sp_res = _split_overlaps(sp, granularity="day")
+        midnights = [pd.Timestamp("2023-03-26", tz=tz), pd.Timestamp("2023-03-27", tz=tz)]
+        assert sp_res["started_at"].tolist() == [start, *midnights]
+        assert sp_res["finished_at"].tolist() == [*midnights, end]
+        # the day of the change has only 23 hours
+        assert sp_res["duration"].tolist() == [pd.Timedelta("12h"), pd.Timedelta("23h"), pd.Timedelta("12h")]
+
+    def test_dst_hour(self):
+        """Test if hours are split every 60 min over ambiguous local times."""
+        tz = "Europe/Zurich"
+        start = pd.Timestamp("2023-10-29 01:30", tz=tz)
+        end = start + pd.Timedelta("3h")
+        sp = pd.DataFrame([{"user_id": 0, "started_at": start, "finished_at": end}])
+        sp_res = _split_overlaps(sp, granularity="hour")
+        assert len(sp_res) == 4
+        assert (sp_res["finished_at"] - sp_res["started_at"]).tolist() == [pd.Timedelta("30min")] + [
+            pd.Timedelta("1h")
+        ] * 2 + [pd.Timedelta("30min")]
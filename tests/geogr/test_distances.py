@@ -16,6 +16,7 @@ import trackintel as ti
 from trackintel.geogr.distances import (
     calculate_distance_matrix,
     calculate_haversine_length,
+    calculate_tripleg_stats,
     check_gdf_planar,
     get_speed_positionfixes,
     point_haversine_dist,
@@ -180,6 +181,31 @@ class TestHaversineDist:
 
         assert np.abs(d_theirs[1][0] - d_ours) < 0.01
 
+    def test_short_distance(self):
+        """Test that distances in the centimeter range are resolved."""
+        d = point_haversine_dist(8.5, 47.3, 8.5, 47.3 + 1e-7)
+        d_float = point_haversine_dist(8.5, 47.3, 8.5, 47.3 + 1e-7, float_flag=True)
+        # 1e-7 degree latitude are ~1.1 cm
+        assert np.isclose(d, 0.0111, atol=1e-4)
+        assert np.isclose(d_float, 0.0111, atol=1e-4)
+
+    def test_float32(self, geolife_sp):
+        """Test that the float32 path returns float32 and stays close to float64."""
+        x = geolife_sp.geometry.x.values
+        y = geolife_sp.geometry.y.values
+        d64 = point_haversine_dist(x[:-1], y[:-1], x[1:], y[1:])
+        d32 = point_haversine_dist(x[:-1], y[:-1], x[1:], y[1:], dtype=np.float32)
+        assert d32.dtype == np.float32
+        assert np.allclose(d32, d64, atol=2)
+
+    def test_out(self, geolife_sp):
+        """Test that the result is written into out."""
+        x = geolife_sp.geometry.x.values
+        y = geolife_sp.geometry.y.values
+        out = np.zeros(len(x) - 1)
+        d = point_haversine_dist(x[:-1], y[:-1], x[1:], y[1:], out=out)
+        assert d is out
+
 
 class TestCalculate_distance_matrix:
     """Tests for the calculate_distance_matrix() function."""
@@ -400,6 +426,88 @@ class Testcalc_haversine_length:
         assert length[0] == np.sum(point_haversine_dist(ls1[:-1, 0], ls1[:-1, 1], ls1[1:, 0], ls1[1:, 1]))
         assert length[1] == np.sum(point_haversine_dist(ls2[:-1, 0], ls2[:-1, 1], ls2[1:, 0], ls2[1:, 1]))
 
+    def test_float32(self, single_linestring):
+        """Check that the float32 path is close to the float64 length."""
+        gdf = gpd.GeoDataFrame(geometry=[single_linestring], crs="wgs84")
+        length_64 = calculate_haversine_length(gdf)
+        length_32 = calculate_haversine_length(gdf, dtype=np.float32)
+        assert np.isclose(length_64[0], 1024, rtol=0.01)
+        assert np.isclose(length_32[0], length_64[0], atol=1)
+
+
+class TestCalculate_tripleg_stats:
+    """Tests for the calculate_tripleg_stats() function."""
+
+    @pytest.fixture
+    def count_calls(self, monkeypatch):
+        """Count the calls of the length calculation."""
+        calls = []
+
+        def counted(gdf, dtype=np.float64):
+            calls.append(len(gdf))
+            return calculate_haversine_length(gdf, dtype=dtype)
+
+        monkeypatch.setattr(ti.geogr.distances, "calculate_haversine_length", counted)
+        return calls
+
+    def test_stats(self, geolife_tpls):
+        """Test that length, duration and number of vertices are correct."""
+        stats = calculate_tripleg_stats(geolife_tpls)
+        assert stats.index.equals(geolife_tpls.index)
+        assert np.allclose(stats["length"], calculate_haversine_length(geolife_tpls))
+        duration = (geolife_tpls["finished_at"] - geolife_tpls["started_at"]).dt.total_seconds()
+        assert np.allclose(stats["duration"], duration)
+        assert (stats["n_vertices"] == [len(g.coords) for g in geolife_tpls.geometry]).all()
+
+    def test_planar(self, geolife_tpls):
+        """Test that the length of planar triplegs is in the unit of the crs."""
+        tpls = geolife_tpls.set_crs(4326).to_crs(2056)
+        stats = calculate_tripleg_stats(tpls)
+        assert np.allclose(stats["length"], tpls.length)
+
+    def test_cache(self, geolife_tpls, count_calls):
+        """Test that the stats are only calculated once."""
+        stats = calculate_tripleg_stats(geolife_tpls)
+        stats["length"] = 0  # result is a copy and doesn't change the cache
+        ti.geogr.get_speed_triplegs(geolife_tpls)
+        res = geolife_tpls.calculate_stats()
+        assert len(count_calls) == 1
+        assert (res["length"] > 0).all()
+        assert "_stats_cache" not in geolife_tpls.columns
+
+    def test_invalidate_geometry(self, geolife_tpls, count_calls):
+        """Test that the cache is invalidated if geometries change."""
+        stats = calculate_tripleg_stats(geolife_tpls)
+        geom = geolife_tpls.geometry.name
+        geolife_tpls.loc[geolife_tpls.index[0], geom] = geolife_tpls.geometry.iloc[1]
+        res = calculate_tripleg_stats(geolife_tpls)
+        assert len(count_calls) == 2
+        assert res["length"].iloc[0] == stats["length"].iloc[1]
+        geolife_tpls[geom] = shapely.reverse(geolife_tpls.geometry.values)
+        calculate_tripleg_stats(geolife_tpls)
+        assert len(count_calls) == 3
+
+    def test_invalidate_timestamps(self, geolife_tpls):
+        """Test that the cache is invalidated if timestamps change."""
+        stats = calculate_tripleg_stats(geolife_tpls)
+        geolife_tpls["finished_at"] = geolife_tpls["finished_at"] + pd.Timedelta("1s")
+        res = calculate_tripleg_stats(geolife_tpls)
+        assert np.allclose(res["duration"], stats["duration"] + 1)
+        idx = geolife_tpls.index[0]
+        geolife_tpls.loc[idx, "started_at"] = geolife_tpls.loc[idx, "finished_at"]
+        res = calculate_tripleg_stats(geolife_tpls)
+        assert res.loc[idx, "duration"] == 0
+
+    def test_no_shared_cache(self, geolife_tpls, count_calls):
+        """Test that copies and GeoDataFrames are calculated again."""
+        calculate_tripleg_stats(geolife_tpls)
+        calculate_tripleg_stats(geolife_tpls.iloc[:2])
+        assert geolife_tpls.copy()._stats_cache is None
+        gdf = gpd.GeoDataFrame(geolife_tpls)
+        calculate_tripleg_stats(gdf)
+        calculate_tripleg_stats(gdf)
+        assert count_calls == [len(geolife_tpls), 2, len(geolife_tpls), len(geolife_tpls)]
+
 
 class TestSpeedPositionfixes:
     def test_positionfixes_stable(self, load_positionfixes):
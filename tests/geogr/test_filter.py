@@ -1,7 +1,10 @@
 import os
 import pytest
+import numpy as np
+import pandas as pd
 import geopandas as gpd
 from geopandas.testing import assert_geodataframe_equal
+from shapely.geometry import LineString, Point, box
 
 import trackintel as ti
 
@@ -23,6 +26,17 @@ def locs_from_geolife():
     return locs
 
 
+@pytest.fixture
+def split_area():
+    """Split tsinghua area into a western and an eastern part."""
+    extent = gpd.read_file(os.path.join("tests", "data", "area", "tsinghua.geojson"))
+    minx, miny, maxx, maxy = extent.total_bounds
+    midx = (minx + maxx) / 2
+    west = extent.clip(box(minx, miny, midx, maxy)).geometry.iloc[0]
+    east = extent.clip(box(midx, miny, maxx, maxy)).geometry.iloc[0]
+    return gpd.GeoDataFrame(geometry=[west, east], index=["west", "east"], crs=extent.crs)
+
+
 class TestSpatial_filter:
     """Tests for the spatial_filter function."""
 
@@ -119,3 +133,126 @@ class TestSpatial_filter:
         extent = gpd.read_file(os.path.join("tests", "data", "area", "tsinghua.geojson"))
         with pytest.raises(ValueError):
             locs.spatial_filter(areas=extent, method=12345)
+
+    def test_area_col(self, split_area):
+        """Test if the matched area is returned in area_col."""
+        sp_file = os.path.join("tests", "data", "geolife", "geolife_staypoints.csv")
+        sp = ti.read_staypoints_csv(sp_file, tz="utc", index_col="id", crs="epsg:4326")
+
+        within_sp = sp.spatial_filter(areas=split_area, method="within", re_project=True, area_col="area")
+        assert set(within_sp["area"]) == {"west", "east"}
+        for name in ["west", "east"]:
+            single_area = sp.spatial_filter(areas=split_area.loc[[name]], method="within", re_project=True)
+            assert (within_sp.index[within_sp["area"] == name] == single_area.index).all()
+        # area_col is only added column
+        assert_geodataframe_equal(within_sp.drop(columns="area"), sp.loc[within_sp.index], check_less_precise=True)
+
+    def test_adjacent_areas(self):
+        """Test if every area is evaluated individually for features spanning adjacent areas."""
+        areas = gpd.GeoDataFrame(geometry=[box(0, 0, 10, 10), box(10, 0, 20, 10)], index=["a", "b"])
+        tpls = gpd.GeoDataFrame(
+            geometry=[LineString([(5, 5), (15, 5)]), LineString([(1, 1), (2, 2)]), LineString([(5, 5), (25, 5)])]
+        )
+        crosses = ti.geogr.spatial_filter(tpls, areas, method="crosses", area_col="area")
+        assert crosses.index.tolist() == [0, 2]
+        assert crosses["area"].tolist() == ["a", "a"]
+        within = ti.geogr.spatial_filter(tpls, areas, method="within")
+        assert within.index.tolist() == [1]
+        # against the union of the areas the first tripleg is within and doesn't cross
+        crosses_union = ti.geogr.spatial_filter(tpls, areas.dissolve(), method="crosses")
+        assert crosses_union.index.tolist() == [2]
+        within_union = ti.geogr.spatial_filter(tpls, areas.dissolve(), method="within")
+        assert within_union.index.tolist() == [0, 1]
+
+    def test_area_col_first_match(self, split_area):
+        """Test if the first area is returned if a feature matches several areas."""
+        sp_file = os.path.join("tests", "data", "geolife", "geolife_staypoints.csv")
+        sp = ti.read_staypoints_csv(sp_file, tz="utc", index_col="id", crs="epsg:4326")
+        extent = gpd.read_file(os.path.join("tests", "data", "area", "tsinghua.geojson"))
+        areas = gpd.GeoDataFrame(
+            geometry=[extent.geometry.iloc[0], *split_area.geometry], index=["all", "west", "east"], crs=extent.crs
+        )
+        within_sp = sp.spatial_filter(areas=areas, method="within", re_project=True, area_col="area")
+        assert len(within_sp) == 13
+        assert (within_sp["area"] == "all").all()
+
+
+class TestTag_zones:
+    """Tests for the tag_zones function."""
+
+    def test_staypoints(self, split_area):
+        """Test if tag_zones agrees with spatial_filter for staypoints."""
+        sp_file = os.path.join("tests", "data", "geolife", "geolife_staypoints.csv")
+        sp = ti.read_staypoints_csv(sp_file, tz="utc", index_col="id", crs="epsg:4326")
+        sp = sp.to_crs(split_area.crs)
+
+        zones = sp.tag_zones(split_area)
+        assert zones.index.equals(sp.index)
+        within_sp = sp.spatial_filter(areas=split_area, method="within", area_col="area")
+        assert (zones.dropna() == within_sp["area"]).all()
+        assert zones.notna().sum() == len(within_sp)
+
+    def test_locations(self, locs_from_geolife, split_area):
+        """Test if locations are tagged with their center."""
+        locs = locs_from_geolife
+        zones = locs.tag_zones(split_area, re_project=True)
+        within_locs = locs.spatial_filter(areas=split_area, method="within", re_project=True, area_col="area")
+        assert (zones.dropna() == within_locs["area"]).all()
+        assert zones.notna().sum() == 12
+
+    def test_triplegs_method(self):
+        """Test the start, end and majority method for triplegs."""
+        zones = gpd.GeoDataFrame(geometry=[box(0, 0, 10, 10), box(10, 0, 20, 10)], index=[1, 2])
+        tpls = gpd.GeoDataFrame(
+            geometry=[
+                LineString([(1, 1), (11, 1), (12, 1)]),
+                LineString([(11, 1), (1, 1), (30, 1), (31, 1)]),
+                LineString([(30, 1), (31, 1)]),
+            ],
+        )
+        start = ti.geogr.tag_zones(tpls, zones, method="start")
+        end = ti.geogr.tag_zones(tpls, zones, method="end")
+        majority = ti.geogr.tag_zones(tpls, zones, method="majority")
+        assert start.tolist() == [1, 2, pd.NA]
+        assert end.tolist() == [2, pd.NA, pd.NA]
+        # outside vertices count as well
+        assert majority.tolist() == [2, pd.NA, pd.NA]
+        assert start.dtype == "Int64"
+
+    def test_majority_tie(self):
+        """Test if majority ties are resolved in favor of a zone over outside, and of the first zone."""
+        zones = gpd.GeoDataFrame(geometry=[box(0, 0, 10, 10), box(10, 0, 20, 10)], index=[1, 2])
+        tpls = gpd.GeoDataFrame(
+            geometry=[
+                LineString([(30, 1), (31, 1), (11, 1), (12, 1)]),
+                LineString([(-2, 1), (1, 1)]),
+                LineString([(11, 1), (1, 1)]),
+            ],
+        )
+        majority = ti.geogr.tag_zones(tpls, zones, method="majority")
+        assert majority.tolist() == [2, 1, 1]
+
+    def test_boundary_first_zone(self):
+        """Test if points on the boundary are tagged with the first zone."""
+        zones = gpd.GeoDataFrame(geometry=[box(0, 0, 10, 10), box(10, 0, 20, 10)], index=["a", "b"])
+        pfs = gpd.GeoDataFrame(geometry=[Point(10, 5), Point(15, 5), Point(-1, 0)])
+        assert ti.geogr.tag_zones(pfs, zones).tolist() == ["a", "b", np.nan]
+
+    def test_chunks_parallel(self, split_area):
+        """Test if the result is independent of chunksize and n_jobs."""
+        pfs, _ = ti.io.dataset_reader.read_geolife(os.path.join("tests", "data", "geolife_long"))
+        pfs = pfs.to_crs(split_area.crs)
+        zones = pfs.tag_zones(split_area)
+        zones_chunked = pfs.tag_zones(split_area, chunksize=7, n_jobs=2)
+        pd.testing.assert_series_equal(zones, zones_chunked)
+
+    def test_empty(self, split_area):
+        """Test if an empty input returns an empty Series."""
+        sp = gpd.GeoDataFrame(geometry=[], crs=split_area.crs)
+        assert len(ti.geogr.tag_zones(sp, split_area)) == 0
+
+    def test_method_error(self, split_area):
+        """Test if an error is raised when passing unknown 'method'."""
+        sp = gpd.GeoDataFrame(geometry=[], crs=split_area.crs)
+        with pytest.raises(ValueError):
+            ti.geogr.tag_zones(sp, split_area, method="within")
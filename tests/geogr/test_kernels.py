@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+from trackintel.geogr import kernels
+
+
+@pytest.fixture
+def short_segments():
+    """Pairs of points about 1 to 1000 m apart around Zurich."""
+    rng = np.random.default_rng(0)
+    n = 1000
+    lon_1 = rng.uniform(8.4, 8.6, n)
+    lat_1 = rng.uniform(47.3, 47.4, n)
+    step = np.logspace(-5, -2, n)  # in degrees
+    angle = rng.uniform(0, 2 * np.pi, n)
+    lon_2 = lon_1 + step * np.cos(angle)
+    lat_2 = lat_1 + step * np.sin(angle)
+    return lon_1, lat_1, lon_2, lat_2
+
+
+def _vincenty_sphere(lon_1, lat_1, lon_2, lat_2, r=kernels.EARTH_RADIUS):
+    """Reference great circle distance via the vincenty formula (well-conditioned for all distances)."""
+    lon_1, lat_1, lon_2, lat_2 = map(np.deg2rad, (lon_1, lat_1, lon_2, lat_2))
+    d_lon = lon_2 - lon_1
+    num = np.hypot(
+        np.cos(lat_2) * np.sin(d_lon), np.cos(lat_1) * np.sin(lat_2) - np.sin(lat_1) * np.cos(lat_2) * np.cos(d_lon)
+    )
+    den = np.sin(lat_1) * np.sin(lat_2) + np.cos(lat_1) * np.cos(lat_2) * np.cos(d_lon)
+    return r * np.arctan2(num, den)
+
+
+class TestHaversine:
+    """Tests for the haversine kernels."""
+
+    def test_short_distances(self, short_segments):
+        """Test that distances at the meter scale are accurate to the millimeter."""
+        d = kernels.haversine(*short_segments)
+        d_ref = _vincenty_sphere(*short_segments)
+        assert np.allclose(d, d_ref, rtol=0, atol=1e-3)
+
+    def test_scalar_equals_vectorized(self, short_segments):
+        """Test that the scalar and the vectorized kernel return the same results."""
+        d = kernels.haversine(*short_segments)
+        d_scalar = [kernels.haversine_scalar(*p) for p in zip(*short_segments)]
+        assert np.allclose(d, d_scalar, rtol=0, atol=1e-6)
+
+    def test_out(self, short_segments):
+        """Test that the result is written into the provided buffer."""
+        out = np.empty(len(short_segments[0]))
+        res = kernels.haversine(*short_segments, out=out)
+        assert res is out
+        assert np.array_equal(out, kernels.haversine(*short_segments))
+
+    def test_float32(self, short_segments):
+        """Test that the float32 path returns float32 with about meter accuracy."""
+        d = kernels.haversine(*short_segments, dtype=np.float32)
+        assert d.dtype == np.float32
+        assert np.allclose(d, _vincenty_sphere(*short_segments), rtol=0, atol=2)
+
+    def test_broadcasting(self):
+        """Test that scalars are broadcasted against arrays."""
+        d = kernels.haversine(0, 0, np.array([0, 1, 2]), 0)
+        assert d.shape == (3,)
+        assert d[0] == 0
+
+    def test_antipodal(self):
+        """Test that antipodal points don't produce nan."""
+        d = kernels.haversine(0, 0, 180, 0)
+        assert np.isclose(d[0], np.pi * kernels.EARTH_RADIUS)
+        assert np.isclose(kernels.haversine_scalar(0, 0, 180, 0), np.pi * kernels.EARTH_RADIUS)
+
+
+class TestEquirectangular:
+    """Tests for the equirectangular kernels."""
+
+    def test_accuracy_short_distances(self, short_segments):
+        """Test that the approximation is accurate for sub-kilometer distances."""
+        d = kernels.equirectangular(*short_segments)
+        d_ref = _vincenty_sphere(*short_segments)
+        assert np.allclose(d, d_ref, rtol=1e-3, atol=1e-3)
+
+    def test_scalar_equals_vectorized(self, short_segments):
+        """Test that the scalar and the vectorized kernel return the same results."""
+        d = kernels.equirectangular(*short_segments)
+        d_scalar = [kernels.equirectangular_scalar(*p) for p in zip(*short_segments)]
+        assert np.allclose(d, d_scalar, rtol=0, atol=1e-6)
+
+    def test_antimeridian(self):
+        """Test that the shorter way around the antimeridian is taken."""
+        d = kernels.equirectangular(179.999, 0, -179.999, 0)
+        d_ref = _vincenty_sphere(179.999, 0, -179.999, 0)
+        assert np.isclose(d[0], d_ref)
+        assert np.isclose(kernels.equirectangular_scalar(179.999, 0, -179.999, 0), d_ref)
@@ -0,0 +1,273 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+from geopandas.testing import assert_geodataframe_equal
+
+import trackintel as ti
+from trackintel.io import TrackintelDataset
+from trackintel.io.dataset import _user_bucket
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def geolife_pfs():
+    """Positionfixes of two users read from the geolife data."""
+    pfs, _ = ti.io.read_geolife(os.path.join("tests", "data", "geolife_long"))
+    return pfs
+
+
+@pytest.fixture
+def monthly_pfs():
+    """Positionfixes of three users over three months."""
+    pfs = ti.read_positionfixes_csv(os.path.join("tests", "data", "positionfixes.csv"), sep=";", index_col="id")
+    parts = []
+    for i, month in enumerate(["2015-10", "2015-11", "2015-12"]):
+        for user_id in range(3):
+            part = pfs.copy()
+            part["user_id"] = user_id
+            part["tracked_at"] = part["tracked_at"] + (pd.Timestamp(month + "-27") - pd.Timestamp("2015-11-27"))
+            parts.append(part)
+    pfs = pd.concat(parts, ignore_index=True)
+    pfs.index.name = "id"
+    return ti.Positionfixes(pfs)
+
+
+@pytest.fixture
+def dataset(tmp_path):
+    """Empty dataset with 2 buckets."""
+    return TrackintelDataset.open(tmp_path / "ds", n_buckets=2)
+
+
+def _read_all(dataset, model):
+    return pd.concat([data for _, data in dataset.iter_partitions(model)]).sort_index()
+
+
+class TestOpen:
+    """Test for 'TrackintelDataset.open' method."""
+
+    def test_create(self, tmp_path):
+        """Test that a new dataset stores its number of buckets."""
+        TrackintelDataset.open(tmp_path / "ds", n_buckets=8)
+        ds = TrackintelDataset.open(tmp_path / "ds")
+        assert ds.n_buckets == 8
+        assert ds.models == []
+
+    def test_default_buckets(self, tmp_path):
+        """Test the default number of buckets."""
+        assert TrackintelDataset.open(tmp_path / "ds").n_buckets == 16
+
+    def test_bucket_mismatch(self, tmp_path):
+        """Test that opening with a different number of buckets raises an error."""
+        TrackintelDataset.open(tmp_path / "ds", n_buckets=8)
+        with pytest.raises(ValueError, match="has 8 buckets"):
+            TrackintelDataset.open(tmp_path / "ds", n_buckets=4)
+
+    def test_invalid_buckets(self, tmp_path):
+        """Test that a non-positive number of buckets raises an error."""
+        with pytest.raises(ValueError, match="n_buckets must be between"):
+            TrackintelDataset.open(tmp_path / "ds", n_buckets=0)
+
+
+class TestWrite_partitioned:
+    """Test for 'TrackintelDataset.write_partitioned' method."""
+
+    def test_partitions(self, dataset, monthly_pfs):
+        """Test that the data is split by user bucket and month."""
+        dataset.write_partitioned(monthly_pfs)
+        buckets = sorted(set(_user_bucket([0, 1, 2], 2).tolist()))
+        expected = [(b, m) for b in buckets for m in ["2015-10", "2015-11", "2015-12"]]
+        assert dataset.partitions("positionfixes") == expected
+        assert dataset.models == ["positionfixes"]
+
+        for (bucket, month), pfs in dataset.iter_partitions("positionfixes"):
+            assert (_user_bucket(pfs["user_id"], 2) == bucket).all()
+            assert (pfs["tracked_at"].dt.strftime("%Y-%m") == month).all()
+
+    def test_round_trip(self, dataset, monthly_pfs):
+        """Test that all data is read back."""
+        dataset.write_partitioned(monthly_pfs)
+        assert_geodataframe_equal(_read_all(dataset, "positionfixes"), monthly_pfs)
+
+    def test_append(self, dataset, monthly_pfs):
+        """Test that data written in chunks is appended."""
+        dataset.write_partitioned(monthly_pfs.iloc[:10])
+        dataset.write_partitioned(monthly_pfs.iloc[10:])
+        assert_geodataframe_equal(_read_all(dataset, "positionfixes"), monthly_pfs)
+
+    def test_locations(self, dataset, geolife_pfs):
+        """Test that locations are only partitioned by user bucket."""
+        _, sp = geolife_pfs.generate_staypoints()
+        _, locs = sp.generate_locations()
+        dataset.write_partitioned(locs)
+        assert all(month is None for _, month in dataset.partitions("locations"))
+        assert_geodataframe_equal(_read_all(dataset, "locations"), locs.sort_index())
+
+    def test_user_id_dtypes(self, dataset, geolife_pfs):
+        """Test that users are in the same bucket for all models, independent of the dtype of user_id."""
+        user_ids = [0, 1, 2, 10, 2**40]
+        expected = _user_bucket(np.array(user_ids, dtype="int64"), 16)
+        for dtype in ["Int64", "float64", "object", "category"]:
+            assert (_user_bucket(pd.Series(user_ids, dtype=dtype), 16) == expected).all()
+
+        pfs, sp = geolife_pfs.generate_staypoints()
+        _, tpls = pfs.generate_triplegs(sp)
+        sp["user_id"] = sp["user_id"].astype("Int64")
+        tpls["user_id"] = tpls["user_id"].astype("float64")
+        dataset.write_partitioned(sp)
+        dataset.write_partitioned(tpls)
+        users = {}
+        for model in ["staypoints", "triplegs"]:
+            users[model] = {key[0]: set(data["user_id"].astype(int)) for key, data in dataset.iter_partitions(model)}
+        assert users["staypoints"] == users["triplegs"]
+
+    def test_unknown_model(self, dataset, monthly_pfs):
+        """Test that the model must be known."""
+        with pytest.raises(ValueError, match="Cannot infer the model"):
+            dataset.write_partitioned(pd.DataFrame(monthly_pfs))
+        with pytest.raises(ValueError, match="model unknown"):
+            dataset.write_partitioned(monthly_pfs, model="pfs")
+
+
+class TestIter_partitions:
+    """Test for 'TrackintelDataset.iter_partitions' and 'TrackintelDataset.partitions' methods."""
+
+    def test_by_user_bucket(self, dataset, monthly_pfs):
+        """Test that all months of a bucket are yielded at once."""
+        dataset.write_partitioned(monthly_pfs)
+        keys = [key for key, _ in dataset.iter_partitions("positionfixes", by="user_bucket")]
+        assert keys == [(b, None) for b in sorted(set(_user_bucket([0, 1, 2], 2).tolist()))]
+
+    def test_filters(self, dataset, monthly_pfs):
+        """Test that partitions are pruned by users and time."""
+        dataset.write_partitioned(monthly_pfs)
+        bucket = _user_bucket([1], 2)[0]
+        assert dataset.partitions("positionfixes", user_ids=[1]) == [
+            (bucket, m) for m in ["2015-10", "2015-11", "2015-12"]
+        ]
+        assert dataset.partitions("positionfixes", user_ids=[1], start="2015-11-15", end="2015-11-30") == [
+            (bucket, "2015-11")
+        ]
+
+        data = [pfs for _, pfs in dataset.iter_partitions("positionfixes", user_ids=[1], start="2015-11-01")]
+        pfs = pd.concat(data)
+        assert (pfs["user_id"] == 1).all()
+        assert len(pfs) == 12
+
+    def test_empty(self, dataset):
+        """Test that a model without data yields nothing."""
+        assert dataset.partitions("staypoints") == []
+        assert list(dataset.iter_partitions("staypoints")) == []
+
+
+def _generate_trips(sp, tpls):
+    return ti.preprocessing.generate_trips(sp.create_activity_flag(), tpls)
+
+
+class TestMap_partitions:
+    """Test for 'TrackintelDataset.map_partitions' method."""
+
+    def test_generate_staypoints(self, dataset, geolife_pfs):
+        """Test that the partitioned result equals the result on the whole data."""
+        dataset.write_partitioned(geolife_pfs)
+        dataset.map_partitions(ti.preprocessing.generate_staypoints, ["positionfixes"], ["positionfixes", "staypoints"])
+        pfs = _read_all(dataset, "positionfixes")
+        sp = _read_all(dataset, "staypoints")
+
+        pfs_expected, sp_expected = geolife_pfs.generate_staypoints()
+        assert len(sp) == len(sp_expected)
+        assert set(pfs["staypoint_id"].dropna()) == set(sp.index)
+        # same grouping of positionfixes into staypoints
+        assert (pfs["staypoint_id"].isna() == pfs_expected["staypoint_id"].isna()).all()
+        assert pfs.groupby("staypoint_id").size().sort_values().tolist() == (
+            pfs_expected.groupby("staypoint_id").size().sort_values().tolist()
+        )
+
+    def test_pipeline(self, dataset, geolife_pfs):
+        """Test that ids stay unique and consistent over a chain of preprocessing steps."""
+        dataset.write_partitioned(geolife_pfs)
+        dataset.map_partitions(ti.preprocessing.generate_staypoints, ["positionfixes"], ["positionfixes", "staypoints"])
+        dataset.map_partitions(
+            ti.preprocessing.generate_triplegs, ["positionfixes", "staypoints"], ["positionfixes", "triplegs"]
+        )
+        dataset.map_partitions(_generate_trips, ["staypoints", "triplegs"], ["staypoints", "triplegs", "trips"])
+        sp = _read_all(dataset, "staypoints")
+        tpls = _read_all(dataset, "triplegs")
+        trips = _read_all(dataset, "trips")
+
+        for data in [sp, tpls, trips]:
+            assert data.index.is_unique
+        assert set(tpls["trip_id"].dropna()) <= set(trips.index)
+        assert set(trips["origin_staypoint_id"].dropna()) <= set(sp.index)
+
+    def test_missing_input(self, dataset, geolife_pfs):
+        """Test that a missing input is passed as empty model with the schema of the stored data."""
+        _, sp = geolife_pfs.generate_staypoints()
+        dataset.write_partitioned(sp)
+        empty = dataset._empty("staypoints")
+        assert isinstance(empty, ti.Staypoints)
+        assert empty.empty
+        assert empty.crs == sp.crs
+        assert empty.geometry.name == sp.geometry.name
+        assert (empty.dtypes == sp.dtypes).all()
+
+    def test_replace_outputs(self, dataset, geolife_pfs):
+        """Test that running a step twice replaces its outputs."""
+        dataset.write_partitioned(geolife_pfs)
+        for _ in range(2):
+            dataset.map_partitions(
+                ti.preprocessing.generate_staypoints, ["positionfixes"], ["positionfixes", "staypoints"]
+            )
+        assert len(_read_all(dataset, "positionfixes")) == len(geolife_pfs)
+        _, sp_expected = geolife_pfs.generate_staypoints()
+        assert len(_read_all(dataset, "staypoints")) == len(sp_expected)
+
+    def test_n_jobs(self, dataset, geolife_pfs):
+        """Test that units can be processed in parallel."""
+        dataset.write_partitioned(geolife_pfs)
+        dataset.map_partitions(
+            ti.preprocessing.generate_staypoints, ["positionfixes"], ["positionfixes", "staypoints"], n_jobs=2
+        )
+        _, sp_expected = geolife_pfs.generate_staypoints()
+        assert len(_read_all(dataset, "staypoints")) == len(sp_expected)
+
+    def test_by_partition(self, dataset, geolife_pfs):
+        """Test that outputs are written into the processed partition."""
+        next_month = geolife_pfs.copy()
+        next_month["tracked_at"] = next_month["tracked_at"] + pd.Timedelta(days=31)
+        pfs = ti.Positionfixes(pd.concat([geolife_pfs, next_month], ignore_index=True))
+        dataset.write_partitioned(pfs)
+        dataset.map_partitions(
+            ti.preprocessing.generate_staypoints, ["positionfixes"], ["positionfixes", "staypoints"], by="partition"
+        )
+        assert dataset.partitions("staypoints") == dataset.partitions("positionfixes")
+        assert len(dataset.partitions("staypoints")) == 4
+        sp = _read_all(dataset, "staypoints")
+        _, sp_expected = geolife_pfs.generate_staypoints()
+        assert sp.index.is_unique
+        assert len(sp) == 2 * len(sp_expected)
+
+    def test_kwargs(self, dataset, geolife_pfs):
+        """Test that kwargs are passed to the function."""
+        dataset.write_partitioned(geolife_pfs)
+        dataset.map_partitions(
+            ti.preprocessing.generate_staypoints,
+            ["positionfixes"],
+            ["positionfixes", "staypoints"],
+            dist_threshold=20,
+        )
+        _, sp_expected = geolife_pfs.generate_staypoints(dist_threshold=20)
+        assert len(_read_all(dataset, "staypoints")) == len(sp_expected)
+
+    def test_wrong_number_of_outputs(self, dataset, geolife_pfs):
+        """Test that an error is raised if func returns a different number of outputs."""
+        dataset.write_partitioned(geolife_pfs)
+        with pytest.raises(ValueError, match="outputs are expected"):
+            dataset.map_partitions(ti.preprocessing.generate_staypoints, ["positionfixes"], ["staypoints"])
+
+    def test_unknown_by(self, dataset):
+        """Test that an unknown unit raises an error."""
+        with pytest.raises(ValueError, match="by unknown"):
+            dataset.map_partitions(ti.preprocessing.generate_staypoints, ["positionfixes"], ["staypoints"], by="day")
@@ -2,6 +2,7 @@ import filecmp
 import os
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
 import pytest
 from pandas.testing import assert_frame_equal
@@ -11,6 +12,15 @@ from shapely.geometry import Point
 import trackintel as ti
 
 
+@pytest.fixture
+def geolife_pfs_csv(tmp_path):
+    """Csv file of the geolife positionfixes of two users."""
+    pfs, _ = ti.io.read_geolife(os.path.join("tests", "data", "geolife_long"))
+    file = tmp_path / "positionfixes.csv"
+    pfs.to_csv(file)
+    return file
+
+
 class TestPositionfixes:
     """Test for 'read_positionfixes_csv' and 'write_positionfixes_csv' functions."""
 
@@ -63,6 +73,41 @@ class TestPositionfixes:
 
         os.remove(tmp_file)
 
+    def test_datetime_format(self, tmp_path):
+        """Test reading timestamps with an explicit format and as epoch."""
+        file = os.path.join("tests", "data", "positionfixes.csv")
+        pfs = ti.read_positionfixes_csv(file, sep=";", index_col="id")
+
+        df = pd.read_csv(file, sep=";", index_col="id")
+        tracked_at = pd.to_datetime(df["tracked_at"])
+        tmp_file = tmp_path / "positionfixes.csv"
+        df["tracked_at"] = tracked_at.dt.strftime("%d.%m.%Y %H:%M:%S")
+        df.to_csv(tmp_file, sep=";")
+        pfs_format = ti.read_positionfixes_csv(
+            tmp_file, sep=";", index_col="id", tz="UTC", datetime_format="%d.%m.%Y %H:%M:%S"
+        )
+        assert_geodataframe_equal(pfs_format, pfs)
+
+        df["tracked_at"] = tracked_at.astype("int64") // 10**9
+        df.to_csv(tmp_file, sep=";")
+        pfs_epoch = ti.read_positionfixes_csv(tmp_file, sep=";", index_col="id")
+        assert_geodataframe_equal(pfs_epoch, pfs)
+        # epoch timestamps are in utc and converted to tz
+        pfs_epoch = ti.read_positionfixes_csv(tmp_file, sep=";", index_col="id", tz="Europe/Zurich")
+        assert (pfs_epoch["tracked_at"] == pfs["tracked_at"]).all()
+        assert str(pfs_epoch["tracked_at"].dt.tz) == "Europe/Zurich"
+
+    @pytest.mark.parametrize("geometry_encoding", ["xy", "wkt", "wkb_hex"])
+    def test_geometry_encoding(self, tmp_path, geometry_encoding):
+        """Test that all geometry encodings are read back without specifying them."""
+        file = os.path.join("tests", "data", "positionfixes.csv")
+        tmp_file = tmp_path / "positionfixes.csv"
+        pfs = ti.read_positionfixes_csv(file, sep=";", index_col="id", crs="EPSG:4326")
+        pfs.to_csv(tmp_file, geometry_encoding=geometry_encoding)
+        assert ("longitude" in pd.read_csv(tmp_file, nrows=0).columns) == (geometry_encoding == "xy")
+        pfs_read = ti.read_positionfixes_csv(tmp_file, index_col="id", crs="EPSG:4326")
+        assert_geodataframe_equal(pfs_read, pfs, check_like=True)
+
     def test_set_index_warning(self):
         """Test if a warning is raised when not parsing the index_col argument."""
         file = os.path.join("tests", "data", "positionfixes.csv")
@@ -85,6 +130,49 @@ class TestPositionfixes:
         pfs = ti.read_positionfixes_csv(file, sep=";", index_col=ind_name)
         assert isinstance(pfs, ti.Positionfixes)
 
+    def test_chunksize(self, geolife_pfs_csv):
+        """Test that chunks of chunksize rows are yielded, that together equal the whole file."""
+        pfs = ti.read_positionfixes_csv(geolife_pfs_csv, index_col="id", crs=4326)
+        chunks = list(ti.read_positionfixes_csv(geolife_pfs_csv, index_col="id", crs=4326, chunksize=1000))
+        assert [len(c) for c in chunks] == [1000, 1000, 1000, 1000, len(pfs) - 4000]
+        assert all(isinstance(c, ti.Positionfixes) for c in chunks)
+        assert_geodataframe_equal(pd.concat(chunks), pfs)
+
+    def test_align_users(self, geolife_pfs_csv):
+        """Test that no user is split over several chunks."""
+        pfs = ti.read_positionfixes_csv(geolife_pfs_csv, index_col="id", crs=4326)
+        chunks = ti.read_positionfixes_csv(geolife_pfs_csv, index_col="id", crs=4326, chunksize=1000, align_users=True)
+        chunks = list(chunks)
+        assert [c["user_id"].unique().tolist() for c in chunks] == [[1], [0]]
+        assert_geodataframe_equal(pd.concat(chunks), pfs)
+
+    def test_categorical_user_id(self, geolife_pfs_csv):
+        """Test that a categorical user_id stays categorical when chunks are aligned to users."""
+        chunks = ti.read_positionfixes_csv(
+            geolife_pfs_csv, index_col="id", chunksize=1000, align_users=True, dtype={"user_id": "category"}
+        )
+        for chunk in chunks:
+            assert isinstance(chunk["user_id"].dtype, pd.CategoricalDtype)
+
+    def test_pyarrow_engine(self, geolife_pfs_csv):
+        """Test that chunks are read with the streaming pyarrow reader."""
+        pytest.importorskip("pyarrow")
+        pfs = ti.read_positionfixes_csv(geolife_pfs_csv, index_col="id", crs=4326)
+        chunks = ti.read_positionfixes_csv(
+            geolife_pfs_csv,
+            index_col="id",
+            crs=4326,
+            chunksize=1000,
+            engine="pyarrow",
+            dtype={"user_id": "int64", "accuracy": "float64"},
+        )
+        chunks = list(chunks)
+        assert [len(c) for c in chunks] == [1000, 1000, 1000, 1000, len(pfs) - 4000]
+        assert_geodataframe_equal(pd.concat(chunks), pfs, check_less_precise=True)
+
+        with pytest.raises(ValueError, match="not supported with engine='pyarrow'"):
+            next(ti.read_positionfixes_csv(geolife_pfs_csv, index_col="id", chunksize=10, engine="pyarrow", nrows=5))
+
 
 class TestTriplegs:
     """Test for 'read_triplegs_csv' and 'write_triplegs_csv' functions."""
@@ -107,6 +195,21 @@ class TestTriplegs:
         assert filecmp.cmp(orig_file, tmp_file, shallow=False)
         os.remove(tmp_file)
 
+    def test_geometry_encoding(self, tmp_path):
+        """Test writing and reading triplegs as WKB hex."""
+        file = os.path.join("tests", "data", "triplegs.csv")
+        tmp_file = tmp_path / "triplegs.csv"
+        tpls = ti.read_triplegs_csv(file, sep=";", index_col="id")
+        tpls.to_csv(tmp_file, geometry_encoding="wkb_hex")
+        assert pd.read_csv(tmp_file)["geom"].str.fullmatch("[0-9A-F]+").all()
+        assert_geodataframe_equal(ti.read_triplegs_csv(tmp_file, index_col="id"), tpls)
+        assert_geodataframe_equal(ti.read_triplegs_csv(tmp_file, index_col="id", geometry_encoding="wkb_hex"), tpls)
+
+        with pytest.raises(ValueError, match="only possible for Point geometries"):
+            tpls.to_csv(tmp_file, geometry_encoding="xy")
+        with pytest.raises(ValueError, match="geometry_encoding unknown"):
+            tpls.to_csv(tmp_file, geometry_encoding="geojson")
+
     def test_set_crs(self):
         """Test setting the crs when reading."""
         file = os.path.join("tests", "data", "triplegs.csv")
@@ -179,6 +282,15 @@ class TestStaypoints:
         assert filecmp.cmp(orig_file, tmp_file, shallow=False)
         os.remove(tmp_file)
 
+    @pytest.mark.parametrize("geometry_encoding", ["xy", "wkb_hex"])
+    def test_geometry_encoding(self, tmp_path, geometry_encoding):
+        """Test that the geometry encodings are detected when reading."""
+        file = os.path.join("tests", "data", "staypoints.csv")
+        tmp_file = tmp_path / "staypoints.csv"
+        sp = ti.read_staypoints_csv(file, sep=";", index_col="id")
+        sp.to_csv(tmp_file, geometry_encoding=geometry_encoding)
+        assert_geodataframe_equal(ti.read_staypoints_csv(tmp_file, index_col="id"), sp, check_like=True)
+
     def test_set_crs(self):
         """Test setting the crs when reading."""
         file = os.path.join("tests", "data", "staypoints.csv")
@@ -265,6 +377,16 @@ class TestLocations:
         assert filecmp.cmp(orig_file, tmp_file, shallow=False)
         os.remove(tmp_file)
 
+    def test_geometry_encoding(self, tmp_path):
+        """Test that the center is written as longitude and latitude and the extent as WKB hex."""
+        file = os.path.join("tests", "data", "locations.csv")
+        tmp_file = tmp_path / "locations.csv"
+        locs = ti.read_locations_csv(file, sep=";", index_col="id")
+        locs.to_csv(tmp_file, geometry_encoding="xy")
+        df = pd.read_csv(tmp_file)
+        assert {"longitude", "latitude", "extent"}.issubset(df.columns) and "center" not in df.columns
+        assert_geodataframe_equal(ti.read_locations_csv(tmp_file, index_col="id"), locs, check_like=True)
+
     def test_set_crs(self):
         """Test setting the crs when reading."""
         file = os.path.join("tests", "data", "locations.csv")
@@ -327,6 +449,19 @@ class TestTrips:
         assert filecmp.cmp(orig_file, tmp_file, shallow=False)
         os.remove(tmp_file)
 
+    def test_geometry_encoding(self, tmp_path):
+        """Test writing and reading the trip geometries as WKB hex."""
+        file = os.path.join("tests", "data", "geolife_long")
+        pfs, _ = ti.io.dataset_reader.read_geolife(file, print_progress=False)
+        pfs, sp = pfs.generate_staypoints()
+        sp = sp.create_activity_flag()
+        pfs, tpls = pfs.generate_triplegs(sp)
+        _, _, trips = ti.preprocessing.generate_trips(sp, tpls, add_geometry=True)
+        tmp_file = tmp_path / "trips.csv"
+        trips.to_csv(tmp_file, geometry_encoding="wkb_hex")
+        trips_read = ti.read_trips_csv(tmp_file, index_col="id", geom_col="geom", crs=trips.crs)
+        assert_geodataframe_equal(trips_read, trips)
+
     def test_set_datatime_tz(self):
         """Test setting the timezone infomation when reading."""
         # check if tz is added to the datatime column
@@ -410,6 +545,41 @@ class TestTours:
         os.remove(tmp_file)
         assert_frame_equal(example_tours, read_tours)
 
+    @pytest.mark.parametrize("trips_sep", [None, "|", " "])
+    def test_trips_sep(self, example_tours, tmp_path, trips_sep):
+        """Test that the trip ids are read back as lists of integers for both the list and the joined format."""
+        tmp_file = tmp_path / "tours.csv"
+        example_tours["trips"] = [[0, 1, 2], [], [4, 5, 6]]
+        example_tours.to_csv(tmp_file, trips_sep=trips_sep)
+        if trips_sep is not None:
+            assert pd.read_csv(tmp_file, dtype=str)["trips"].iloc[0] == trips_sep.join(["0", "1", "2"])
+        read_tours = ti.read_tours_csv(tmp_file, index_col="id", trips_sep=trips_sep or "|")
+        assert_frame_equal(example_tours, read_tours)
+
+    def test_trips_non_integer(self, example_tours, tmp_path):
+        """Test that lists of non integer trip ids are parsed, and malformed joined ids raise an error."""
+        tmp_file = tmp_path / "tours.csv"
+        example_tours["trips"] = [["a", "b"], [1.5], [2.0, 3.0]]
+        example_tours.to_csv(tmp_file)
+        read_tours = ti.read_tours_csv(tmp_file, index_col="id")
+        assert_frame_equal(example_tours, read_tours)
+
+        example_tours["trips"] = [["a", "b"], ["c"], ["1"]]
+        example_tours.to_csv(tmp_file, trips_sep="|")
+        with pytest.raises(ValueError, match="Cannot parse the trip ids"):
+            ti.read_tours_csv(tmp_file, index_col="id")
+
+    @pytest.mark.parametrize("trips_sep", [None, "|"])
+    def test_trips_list_like(self, example_tours, tmp_path, trips_sep):
+        """Test that tuples and arrays of trip ids are written and read back as lists."""
+        tmp_file = tmp_path / "tours.csv"
+        expected = example_tours.copy()
+        expected["trips"] = [[0, 1, 2], [3], []]
+        example_tours["trips"] = [(0, 1, 2), np.array([3]), None]
+        example_tours.to_csv(tmp_file, trips_sep=trips_sep)
+        read_tours = ti.read_tours_csv(tmp_file, index_col="id", trips_sep=trips_sep or "|")
+        assert_frame_equal(expected, read_tours)
+
     def test_to_csv_accessor(self):
         """Test basic reading and writing functions."""
         orig_file = os.path.join("tests", "data", "geolife_long", "tours.csv")
@@ -8,6 +8,7 @@ from geopandas.testing import assert_geodataframe_equal
 from pandas.testing import assert_frame_equal, assert_index_equal
 from shapely.geometry import Point, Polygon, MultiPoint
 from trackintel.io.from_geopandas import (
+    _localize_timestamp,
     _trackintel_model,
     read_locations_gpd,
     read_positionfixes_gpd,
@@ -116,6 +117,39 @@ class Test_Trackintel_Model:
         assert_geodataframe_equal(pfs, example_positionfixes)
 
 
+class Test_Localize_Timestamp:
+    """Test `_localize_timestamp()` function."""
+
+    def test_naive(self):
+        """Test that naive datetimes are localized (also across daylight saving time)."""
+        dt = pd.Series(pd.to_datetime(["2021-03-27 12:00", "2021-03-28 12:00", None]))
+        res = _localize_timestamp(dt, "Europe/Zurich", "tracked_at")
+        expected = [pd.Timestamp(t, tz="Europe/Zurich") for t in ["2021-03-27 12:00", "2021-03-28 12:00"]]
+        assert res.dtype == pd.DatetimeTZDtype(tz="Europe/Zurich")
+        assert res.iloc[:2].tolist() == expected
+        assert pd.isna(res.iloc[2])
+
+    def test_aware(self):
+        """Test that timezone aware datetimes are converted."""
+        dt = pd.Series([pd.Timestamp("2021-08-01 16:00:00", tz="Europe/Amsterdam")], dtype=object)
+        res = _localize_timestamp(dt, "UTC", "tracked_at")
+        assert res.dtype == pd.DatetimeTZDtype(tz="UTC")
+        assert res.iloc[0] == pd.Timestamp("2021-08-01 14:00:00", tz="UTC")
+
+    def test_mixed(self):
+        """Test that naive and aware datetimes in the same column are handled separately."""
+        dt = pd.Series(
+            [pd.Timestamp("2021-08-01 16:00:00", tz="Asia/Muscat"), pd.Timestamp("2021-08-01 16:00:00"), None],
+            index=[2, 2, 0],
+        )
+        res = _localize_timestamp(dt, "Europe/Amsterdam", "tracked_at")
+        assert res.dtype == pd.DatetimeTZDtype(tz="Europe/Amsterdam")
+        assert res.index.equals(dt.index)
+        assert res.iloc[0] == pd.Timestamp("2021-08-01 12:00:00", tz="UTC")
+        assert res.iloc[1] == pd.Timestamp("2021-08-01 14:00:00", tz="UTC")
+        assert pd.isna(res.iloc[2])
+
+
 class TestRead_Positionfixes_Gpd:
     """Test `read_positionfixes_gpd()` function."""
 
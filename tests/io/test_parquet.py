@@ -0,0 +1,331 @@
+import os
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import pytest
+from geopandas.testing import assert_geodataframe_equal
+from pandas.testing import assert_frame_equal
+from shapely.geometry import MultiPoint, Point
+
+import trackintel as ti
+from trackintel.io.parquet import _geodataframe_to_arrow, _row_group_bounds
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+@pytest.fixture
+def example_positionfixes():
+    """Positionfixes read from the test data."""
+    file = os.path.join("tests", "data", "positionfixes.csv")
+    return ti.read_positionfixes_csv(file, sep=";", index_col="id", crs="EPSG:4326")
+
+
+@pytest.fixture
+def multi_user_positionfixes(example_positionfixes):
+    """Positionfixes of three users in reversed order."""
+    pfs = [example_positionfixes.assign(user_id=user_id) for user_id in [2, 0, 1]]
+    pfs = pd.concat(pfs, ignore_index=True).iloc[::-1]
+    pfs.index.name = "id"
+    return ti.Positionfixes(pfs)
+
+
+@pytest.fixture
+def example_locations():
+    """Locations with a center and an extent column."""
+    p1 = Point(8.5067847, 47.4)
+    p2 = Point(8.5067847, 47.5)
+    list_dict = [
+        {"user_id": 0, "center": p1},
+        {"user_id": 1, "center": p2},
+    ]
+    locs = gpd.GeoDataFrame(data=list_dict, geometry="center", crs="EPSG:4326")
+    locs["extent"] = gpd.GeoSeries([p1.buffer(0.1), p2.buffer(0.1)], crs="EPSG:4326")
+    locs.index.name = "id"
+    return ti.Locations(locs)
+
+
+@pytest.fixture
+def example_tours():
+    """Tours with a list of trips."""
+    t1 = pd.Timestamp("1971-01-01 00:00:00", tz="utc")
+    t2 = pd.Timestamp("1971-01-01 05:00:00", tz="utc")
+    h = pd.Timedelta(hours=1)
+    list_dict = [
+        {"user_id": 0, "started_at": t1, "finished_at": t1 + h, "trips": [0, 1, 2]},
+        {"user_id": 1, "started_at": t2, "finished_at": t2 + h, "trips": [2, 3]},
+    ]
+    tours = pd.DataFrame(data=list_dict)
+    tours.index.name = "id"
+    return ti.Tours(tours)
+
+
+class TestPositionfixes:
+    """Test for 'read_positionfixes_parquet' and 'write_positionfixes_parquet' functions."""
+
+    def test_to_from_parquet(self, example_positionfixes, tmp_path):
+        """Test that writing and reading returns the same positionfixes."""
+        file = tmp_path / "pfs.parquet"
+        example_positionfixes.to_parquet(file)
+        pfs = ti.read_positionfixes_parquet(file)
+        assert isinstance(pfs, ti.Positionfixes)
+        assert_geodataframe_equal(pfs, example_positionfixes)
+        assert pfs.crs == example_positionfixes.crs
+
+    def test_timezone(self, example_positionfixes, tmp_path):
+        """Test that the timezone of the timestamps is kept."""
+        file = tmp_path / "pfs.parquet"
+        example_positionfixes["tracked_at"] = example_positionfixes["tracked_at"].dt.tz_convert("Europe/Zurich")
+        ti.io.write_positionfixes_parquet(example_positionfixes, file)
+        pfs = ti.read_positionfixes_parquet(file)
+        assert str(pfs["tracked_at"].dt.tz) == "Europe/Zurich"
+
+    def test_validate(self, example_positionfixes, tmp_path, monkeypatch):
+        """Test that files written by trackintel are only validated on demand."""
+        calls = []
+        monkeypatch.setattr(ti.Positionfixes, "validate", staticmethod(lambda obj: calls.append(obj)))
+        file = tmp_path / "pfs.parquet"
+        example_positionfixes.to_parquet(file)
+
+        ti.read_positionfixes_parquet(file)
+        assert len(calls) == 0
+        ti.read_positionfixes_parquet(file, validate=True)
+        assert len(calls) == 1
+
+    def test_foreign_file(self, example_positionfixes, tmp_path):
+        """Test that files not written by trackintel are validated."""
+        file = tmp_path / "pfs.parquet"
+        gpd.GeoDataFrame(example_positionfixes).drop(columns="user_id").to_parquet(file)
+        with pytest.raises(AttributeError):
+            ti.read_positionfixes_parquet(file)
+
+    def test_other_model(self, example_positionfixes, tmp_path):
+        """Test that files of another model are validated."""
+        file = tmp_path / "pfs.parquet"
+        example_positionfixes.to_parquet(file)
+        with pytest.raises(AttributeError):
+            ti.read_staypoints_parquet(file)
+
+    def test_sorted(self, multi_user_positionfixes, tmp_path):
+        """Test that the positionfixes are written sorted by user and time and keep their index."""
+        file = tmp_path / "pfs.parquet"
+        multi_user_positionfixes.to_parquet(file)
+        pfs = ti.read_positionfixes_parquet(file)
+        expected = multi_user_positionfixes.sort_values(["user_id", "tracked_at"])
+        assert_geodataframe_equal(pfs, expected)
+
+    def test_unsorted(self, multi_user_positionfixes, tmp_path):
+        """Test that the order is kept with sort=False."""
+        file = tmp_path / "pfs.parquet"
+        multi_user_positionfixes.to_parquet(file, sort=False)
+        pfs = ti.read_positionfixes_parquet(file)
+        assert_geodataframe_equal(pfs, multi_user_positionfixes)
+
+    def test_row_groups(self, multi_user_positionfixes, tmp_path):
+        """Test that row groups don't split users."""
+        file = tmp_path / "pfs.parquet"
+        multi_user_positionfixes.to_parquet(file, row_group_size=10)
+        metadata = pq.read_metadata(file)
+        user_col = metadata.schema.names.index("user_id")
+        stats = [metadata.row_group(i).column(user_col).statistics for i in range(metadata.num_row_groups)]
+        assert [(s.min, s.max) for s in stats] == [(0, 0), (1, 1), (2, 2)]
+
+        multi_user_positionfixes.to_parquet(file, row_group_size=12)
+        metadata = pq.read_metadata(file)
+        assert [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)] == [12, 6]
+
+    def test_columns(self, example_positionfixes, tmp_path):
+        """Test that only the selected and required columns are read."""
+        file = tmp_path / "pfs.parquet"
+        example_positionfixes.to_parquet(file)
+        pfs = ti.read_positionfixes_parquet(file, columns=["accuracy"])
+        assert list(pfs.columns) == ["user_id", "tracked_at", "accuracy", "geom"]
+        assert_geodataframe_equal(pfs, example_positionfixes[pfs.columns])
+
+        with pytest.raises(KeyError, match="not in the file"):
+            ti.read_positionfixes_parquet(file, columns=["speed"])
+
+    def test_user_ids(self, multi_user_positionfixes, tmp_path):
+        """Test that only the positionfixes of the selected users are read."""
+        file = tmp_path / "pfs.parquet"
+        multi_user_positionfixes.to_parquet(file, row_group_size=6)
+        pfs = ti.read_positionfixes_parquet(file, user_ids=[0, 2])
+        assert set(pfs["user_id"]) == {0, 2}
+        assert len(pfs) == 12
+
+    def test_time_window(self, multi_user_positionfixes, tmp_path):
+        """Test that only positionfixes with tracked_at in [start, end) are read."""
+        file = tmp_path / "pfs.parquet"
+        multi_user_positionfixes.to_parquet(file)
+        start, end = pd.Timestamp("2015-11-27 08:20:22", tz="utc"), pd.Timestamp("2015-11-27 09:00:00", tz="utc")
+        expected = multi_user_positionfixes.sort_values(["user_id", "tracked_at"])
+        expected = expected[(expected["tracked_at"] >= start) & (expected["tracked_at"] < end)]
+        assert len(expected) > 0
+
+        pfs = ti.read_positionfixes_parquet(file, start=start, end=end)
+        assert_geodataframe_equal(pfs, expected)
+        # timezone naive values are interpreted in the timezone of the column
+        pfs = ti.read_positionfixes_parquet(file, start="2015-11-27 08:20:22", end="2015-11-27 09:00:00")
+        assert_geodataframe_equal(pfs, expected)
+        # other timezones are converted
+        pfs = ti.read_positionfixes_parquet(file, start=start.tz_convert("Europe/Zurich"), end=end)
+        assert_geodataframe_equal(pfs, expected)
+
+    def test_combined_filters(self, multi_user_positionfixes, tmp_path):
+        """Test that user and time filters are combined."""
+        file = tmp_path / "pfs.parquet"
+        multi_user_positionfixes.to_parquet(file)
+        pfs = ti.read_positionfixes_parquet(file, columns=[], user_ids=[1], start="2015-11-27 08:20:22")
+        assert (pfs["user_id"] == 1).all()
+        assert (pfs["tracked_at"] >= pd.Timestamp("2015-11-27 08:20:22", tz="utc")).all()
+        assert len(pfs) == 5
+
+
+class TestRow_group_bounds:
+    """Test for '_row_group_bounds' function."""
+
+    def test_bounds(self):
+        """Test that users are only split if they exceed the row group size."""
+        user_codes = np.array([0, 0, 0, 1, 1, 2, 2, 2, 2, 2, 3])
+        assert _row_group_bounds(user_codes, 4) == [(0, 3), (3, 5), (5, 10), (10, 11)]
+        assert _row_group_bounds(user_codes, 5) == [(0, 5), (5, 10), (10, 11)]
+        assert _row_group_bounds(user_codes, 100) == [(0, 11)]
+
+    def test_empty(self):
+        """Test that no row groups are returned for empty data."""
+        assert _row_group_bounds(np.array([], dtype=int), 4) == []
+
+
+class TestGeodataframe_to_arrow:
+    """Test for '_geodataframe_to_arrow' function."""
+
+    def test_fallback(self, example_positionfixes, tmp_path, monkeypatch):
+        """Test that the geo metadata and the index are kept without GeoDataFrame.to_arrow."""
+        monkeypatch.delattr(gpd.GeoDataFrame, "to_arrow", raising=False)
+        table = _geodataframe_to_arrow(example_positionfixes, index=True)
+        assert b"geo" in table.schema.metadata
+        assert example_positionfixes.index.name in table.column_names
+        assert table.num_rows == len(example_positionfixes)
+        path = os.path.join(tmp_path, "positionfixes.parquet")
+        pq.write_table(table, path)
+        assert_geodataframe_equal(gpd.read_parquet(path), gpd.GeoDataFrame(example_positionfixes))
+
+    def test_to_arrow(self, example_positionfixes, monkeypatch):
+        """Test that GeoDataFrame.to_arrow is used if available."""
+        calls = []
+        expected = _geodataframe_to_arrow(example_positionfixes, index=False)
+
+        def to_arrow(self, index=None):
+            calls.append(index)
+            return expected
+
+        monkeypatch.setattr(gpd.GeoDataFrame, "to_arrow", to_arrow, raising=False)
+        assert _geodataframe_to_arrow(example_positionfixes, index=False).equals(expected)
+        assert calls == [False]
+
+
+class TestStaypoints:
+    """Test for 'read_staypoints_parquet' and 'write_staypoints_parquet' functions."""
+
+    def test_to_from_parquet(self, tmp_path):
+        """Test that writing and reading returns the same staypoints."""
+        sp = ti.read_staypoints_csv(os.path.join("tests", "data", "staypoints.csv"), sep=";", index_col="id")
+        file = tmp_path / "sp.parquet"
+        sp.to_parquet(file)
+        sp_read = ti.read_staypoints_parquet(file)
+        assert isinstance(sp_read, ti.Staypoints)
+        assert_geodataframe_equal(sp_read, sp)
+
+
+class TestTriplegs:
+    """Test for 'read_triplegs_parquet' and 'write_triplegs_parquet' functions."""
+
+    def test_to_from_parquet(self, tmp_path):
+        """Test that writing and reading returns the same triplegs."""
+        tpls = ti.read_triplegs_csv(os.path.join("tests", "data", "triplegs.csv"), sep=";", index_col="id")
+        file = tmp_path / "tpls.parquet"
+        tpls.to_parquet(file)
+        tpls_read = ti.read_triplegs_parquet(file)
+        assert isinstance(tpls_read, ti.Triplegs)
+        assert_geodataframe_equal(tpls_read, tpls)
+
+
+class TestLocations:
+    """Test for 'read_locations_parquet' and 'write_locations_parquet' functions."""
+
+    def test_to_from_parquet(self, example_locations, tmp_path):
+        """Test that both geometry columns are kept."""
+        file = tmp_path / "locs.parquet"
+        example_locations.to_parquet(file)
+        locs = ti.read_locations_parquet(file)
+        assert isinstance(locs, ti.Locations)
+        assert locs.geometry.name == "center"
+        assert isinstance(locs["extent"], gpd.GeoSeries)
+        assert_geodataframe_equal(locs, example_locations)
+
+    def test_user_ids(self, example_locations, tmp_path):
+        """Test that the locations can be filtered by user."""
+        file = tmp_path / "locs.parquet"
+        example_locations.to_parquet(file)
+        locs = ti.read_locations_parquet(file, columns=[], user_ids=[1])
+        assert list(locs.columns) == ["user_id", "center"]
+        assert_geodataframe_equal(locs, example_locations.loc[[1], ["user_id", "center"]])
+
+
+class TestTrips:
+    """Test for 'read_trips_parquet' and 'write_trips_parquet' functions."""
+
+    def test_to_from_parquet(self, tmp_path):
+        """Test that trips without geometry are read as TripsDataFrame."""
+        trips = ti.read_trips_csv(os.path.join("tests", "data", "trips.csv"), sep=";", index_col="id")
+        file = tmp_path / "trips.parquet"
+        trips.to_parquet(file)
+        trips_read = ti.read_trips_parquet(file)
+        assert isinstance(trips_read, ti.TripsDataFrame)
+        assert not isinstance(trips_read, gpd.GeoDataFrame)
+        assert_frame_equal(trips_read, trips)
+
+    def test_no_metadata(self, tmp_path):
+        """Test that columns can be selected in files without schema metadata."""
+        trips = ti.read_trips_csv(os.path.join("tests", "data", "trips.csv"), sep=";", index_col="id")
+        trips["purpose"] = "work"
+        file = tmp_path / "trips.parquet"
+        table = pa.Table.from_pandas(trips, preserve_index=False).replace_schema_metadata(None)
+        pq.write_table(table, file)
+        assert pq.read_schema(file).metadata is None
+        trips_read = ti.read_trips_parquet(file, columns=["origin_staypoint_id"])
+        assert list(trips_read.columns) == list(trips.columns.drop("purpose"))
+        assert len(trips_read) == len(trips)
+
+    def test_geometry(self, tmp_path):
+        """Test that trips with geometry are read as TripsGeoDataFrame."""
+        trips = ti.read_trips_csv(os.path.join("tests", "data", "trips.csv"), sep=";", index_col="id")
+        trips["geom"] = gpd.GeoSeries([MultiPoint([(8.5, 47.3), (8.6, 47.4)])] * len(trips), index=trips.index)
+        trips = ti.Trips(trips, geometry="geom")
+        file = tmp_path / "trips.parquet"
+        trips.to_parquet(file)
+        trips_read = ti.read_trips_parquet(file)
+        assert isinstance(trips_read, ti.TripsGeoDataFrame)
+        assert_geodataframe_equal(trips_read, trips)
+
+
+class TestTours:
+    """Test for 'read_tours_parquet' and 'write_tours_parquet' functions."""
+
+    def test_to_from_parquet(self, example_tours, tmp_path):
+        """Test that the trips are read back as list."""
+        file = tmp_path / "tours.parquet"
+        example_tours.to_parquet(file)
+        tours = ti.read_tours_parquet(file)
+        assert isinstance(tours, ti.Tours)
+        assert tours.loc[0, "trips"] == [0, 1, 2]
+        assert_frame_equal(tours, example_tours)
+
+    def test_time_window(self, example_tours, tmp_path):
+        """Test that the tours can be filtered by started_at."""
+        file = tmp_path / "tours.parquet"
+        example_tours.to_parquet(file)
+        tours = ti.read_tours_parquet(file, columns=[], end="1971-01-01 05:00:00")
+        assert list(tours.columns) == ["user_id", "started_at", "finished_at"]
+        assert_frame_equal(tours, example_tours.loc[[0], ["user_id", "started_at", "finished_at"]])
@@ -274,6 +274,23 @@ class TestPositionfixes:
         finally:
             del_table(conn, table)
 
+    def test_read_chunksize(self, example_positionfixes, conn_postgis):
+        """Test if positionfixes are read in chunks of validated positionfixes."""
+        pfs = example_positionfixes.copy()
+        conn_string, conn = conn_postgis
+        table = "positionfixes"
+        sql = f"SELECT * FROM {table}"
+
+        try:
+            pfs.as_positionfixes.to_postgis(table, conn_string)
+            chunks = ti.io.read_positionfixes_postgis(sql, conn_string, index_col="id", chunksize=2)
+            chunks = list(chunks)
+            assert [len(c) for c in chunks] == [2, 1]
+            assert all(isinstance(c, ti.Positionfixes) for c in chunks)
+            assert_geodataframe_equal(pfs, pd.concat(chunks))
+        finally:
+            del_table(conn, table)
+
     def test_no_crs(self, example_positionfixes, conn_postgis):
         """Test if writing reading to postgis also works correctly without CRS."""
         pfs = example_positionfixes.copy()
@@ -760,3 +777,78 @@ class Test_Handle_Con_String:
             assert con is conn
 
         wrapped(conn)
+
+    def test_generator(self):
+        """Test if the connection is kept open until a returned generator is exhausted."""
+        connections = []
+
+        @ti.io.postgis._handle_con_string
+        def wrapped(con):
+            connections.append(con)
+            yield from range(2)
+
+        gen = wrapped("sqlite://")
+        assert next(gen) == 0
+        assert not connections[0].closed
+        assert list(gen) == [1]
+        assert connections[0].closed
+
+
+class TestEngineCache:
+    @pytest.fixture(autouse=True)
+    def reset_engines(self):
+        """Restore the default engine options after each test."""
+        yield
+        ti.io.set_engine_options()
+
+    def test_reuse(self):
+        """Test if the engine of a connection string is reused."""
+        engine = ti.io.postgis._get_engine("sqlite://")
+        assert ti.io.postgis._get_engine("sqlite://") is engine
+
+        @ti.io.postgis._handle_con_string
+        def wrapped(con):
+            return con.engine
+
+        assert wrapped("sqlite://") is engine
+
+    def test_cache_size(self):
+        """Test if the least recently used engine is dropped."""
+        ti.io.set_engine_options(cache_size=2)
+        first = ti.io.postgis._get_engine("sqlite:///first.db")
+        second = ti.io.postgis._get_engine("sqlite:///second.db")
+        assert ti.io.postgis._get_engine("sqlite:///first.db") is first
+        ti.io.postgis._get_engine("sqlite:///third.db")
+        assert list(ti.io.postgis._engines) == ["sqlite:///first.db", "sqlite:///third.db"]
+        assert ti.io.postgis._get_engine("sqlite:///second.db") is not second
+
+        with pytest.raises(ValueError, match="cache_size must be at least 1"):
+            ti.io.set_engine_options(cache_size=0)
+
+    def test_engine_kws(self):
+        """Test if the engine options are passed to the engines and the cache is cleared."""
+        engine = ti.io.postgis._get_engine("sqlite://")
+        ti.io.set_engine_options(echo=True)
+        new_engine = ti.io.postgis._get_engine("sqlite://")
+        assert new_engine is not engine
+        assert new_engine.echo
+
+
+class Test_Read_Sql_Chunks:
+    def test_stream_results(self):
+        """Test if the chunks are read with stream_results and the options of a connection are restored."""
+        streamed = []
+
+        def read(sql, con, chunksize):
+            streamed.append(con.get_execution_options().get("stream_results", False))
+            yield from pd.read_sql(sql, con, chunksize=chunksize)
+
+        engine = create_engine("sqlite://")
+        with engine.connect() as conn:
+            chunks = ti.io.postgis._read_sql_chunks(read, "SELECT 1 AS a UNION ALL SELECT 2", conn, 1, len)
+            assert list(chunks) == [1, 1]
+            assert not conn.get_execution_options().get("stream_results", False)
+
+        chunks = ti.io.postgis._read_sql_chunks(read, "SELECT 1 AS a", engine, 1, len)
+        assert list(chunks) == [1]
+        assert streamed == [True, True]
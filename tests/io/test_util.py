@@ -1,5 +1,8 @@
+import pandas as pd
 import pytest
-from trackintel.io.util import _index_warning_default_none
+from pandas.testing import assert_series_equal
+
+from trackintel.io.util import _detect_datetime_format, _index_warning_default_none, _parse_datetime
 
 
 class Test_index_warning_default_none:
@@ -21,3 +24,51 @@ class Test_index_warning_default_none:
 
         with pytest.warns(UserWarning):
             foo()
+
+
+class Test_parse_datetime:
+    def test_iso8601_offset(self):
+        """Test that ISO 8601 strings with offsets are parsed to UTC."""
+        s = pd.Series(["2021-01-01 12:00:00+01:00", "2021-07-01T12:00:00-0230", "2021-01-01 12:00:00.500Z"])
+        res = _parse_datetime(s)
+        expected = ["2021-01-01 11:00:00", "2021-07-01 14:30:00", "2021-01-01 12:00:00.5"]
+        expected = pd.Series([pd.Timestamp(t, tz="UTC") for t in expected])
+        assert_series_equal(res, expected)
+
+    def test_iso8601_naive_tz(self):
+        """Test that naive ISO 8601 strings are localized to tz."""
+        s = pd.Series(["2021-01-01 12:00:00", None])
+        res = _parse_datetime(s, tz="Europe/Zurich", col_name="col")
+        assert str(res.dt.tz) == "Europe/Zurich"
+        assert res.iloc[0] == pd.Timestamp("2021-01-01 12:00:00", tz="Europe/Zurich")
+        assert pd.isna(res.iloc[1])
+
+    def test_mixed_offsets(self):
+        """Test that strings with varying offsets match pd.to_datetime."""
+        s = pd.Series(["2021-01-01 12:00:00+01:00", "2021-01-01 12:00:00-0500", "2021-01-01 12:00:00"])
+        res = _parse_datetime(s, tz="UTC")
+        expected = pd.to_datetime(s, format="ISO8601", utc=True)
+        assert (res == expected).all()
+
+    def test_epoch(self):
+        """Test that epoch timestamps are detected and parsed in the correct unit."""
+        expected = pd.Series(pd.to_datetime(["2021-01-01 12:00:00"])).dt.tz_localize("UTC")
+        assert_series_equal(_parse_datetime(pd.Series([1609502400])), expected)
+        assert_series_equal(_parse_datetime(pd.Series([1609502400000])), expected)
+        assert_series_equal(_parse_datetime(pd.Series([1609502400]), datetime_format="epoch"), expected)
+        assert_series_equal(_parse_datetime(pd.Series([1609502400000]), datetime_format="epoch_ms"), expected)
+
+    def test_explicit_format(self):
+        """Test that an explicit format is used and errors are raised."""
+        s = pd.Series(["01.02.2021 12:00"])
+        res = _parse_datetime(s, datetime_format="%d.%m.%Y %H:%M", tz="UTC")
+        assert res.iloc[0] == pd.Timestamp("2021-02-01 12:00", tz="UTC")
+        with pytest.raises(ValueError):
+            _parse_datetime(s, datetime_format="%Y-%m-%d")
+
+    def test_detect_datetime_format(self):
+        """Test the detection of the datetime format."""
+        assert _detect_datetime_format(pd.Series(["2021-01-01 12:00:00+01:00", None])) == "ISO8601"
+        assert _detect_datetime_format(pd.Series([1.6e9])) == "epoch_s"
+        assert _detect_datetime_format(pd.Series([1.6e12])) == "epoch_ms"
+        assert _detect_datetime_format(pd.Series(["01.02.2021 12:00"])) is None
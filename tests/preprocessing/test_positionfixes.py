@@ -319,6 +319,15 @@ class Test_Generate_staypoints_sliding_user:
                 method="sliding", dist_threshold=100, time_threshold=5, distance_metric="unknown"
             )
 
+    def test_equirectangular_distance_metric(self):
+        """Test if the equirectangular approximation generates the same staypoints as haversine."""
+        pfs, _ = ti.io.dataset_reader.read_geolife(os.path.join("tests", "data", "geolife_long"))
+        _, sp_hav = pfs.generate_staypoints(method="sliding", dist_threshold=100, time_threshold=5)
+        _, sp_equi = pfs.generate_staypoints(
+            method="sliding", dist_threshold=100, time_threshold=5, distance_metric="equirectangular"
+        )
+        assert_geodataframe_equal(sp_hav, sp_equi)
+
 
 class Test__create_new_staypoints:
     """Test __create_new_staypoints."""
@@ -431,6 +440,16 @@ class TestGenerate_triplegs:
 
         assert_geodataframe_equal(tpls_case1, tpls_case2)
 
+    def test_sp_after_last_pfs(self, geolife_pfs_sp_long):
+        """Check that staypoints ending after the last positionfix of the user are handled in case 2."""
+        pfs, sp = geolife_pfs_sp_long
+        pfs = pfs[pfs["tracked_at"] < sp["finished_at"].max()]
+
+        _, tpls_case1 = pfs.as_positionfixes.generate_triplegs(sp, method="between_staypoints")
+        pfs = pfs.drop(columns="staypoint_id")
+        _, tpls_case2 = pfs.as_positionfixes.generate_triplegs(sp, method="between_staypoints")
+        assert_geodataframe_equal(tpls_case1, tpls_case2)
+
     def test_stability(self, geolife_pfs_sp_long):
         """Checks if the results are same for different cases in tripleg_generation method."""
         pfs, sp = geolife_pfs_sp_long
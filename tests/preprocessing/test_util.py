@@ -8,7 +8,13 @@ import pytest
 from pandas.testing import assert_frame_equal
 from shapely.geometry import MultiPoint, Point
 
-from trackintel.preprocessing.util import _explode_agg, calc_temp_overlap, angle_centroid_multipoints
+from trackintel.preprocessing.util import (
+    _explode_agg,
+    angle_centroid_multipoints,
+    calc_temp_overlap,
+    calc_temp_overlap_array,
+    interval_join,
+)
 
 
 @pytest.fixture
@@ -48,6 +54,175 @@ class TestCalc_temp_overlap:
         assert ratio == 0
 
 
+class TestCalc_temp_overlap_array:
+    """Test calc_temp_overlap_array"""
+
+    @pytest.fixture
+    def spans(self):
+        """Random time spans (including spans of zero duration)."""
+        rng = np.random.default_rng(0)
+        t = pd.Timestamp("2021-01-01", tz="Europe/Zurich")
+        start = pd.Series(t + pd.to_timedelta(rng.integers(0, 10, 40), unit="h"))
+        end = start + pd.to_timedelta(rng.integers(0, 5, 40), unit="h")
+        return start[:20], end[:20], start[20:].reset_index(drop=True), end[20:].reset_index(drop=True)
+
+    def test_equal_scalar(self, spans):
+        """Test that the element-wise ratios are equal to the scalar version."""
+        ratio = calc_temp_overlap_array(*spans)
+        ratio_scalar = [calc_temp_overlap(*s) for s in zip(*spans)]
+        assert np.allclose(ratio, ratio_scalar)
+        assert ratio.dtype == np.float64
+
+    def test_broadcast(self, spans):
+        """Test that scalars are broadcasted."""
+        start_1, end_1, start_2, end_2 = spans
+        ratio = calc_temp_overlap_array(start_1, end_1, start_2[0], end_2[0])
+        ratio_scalar = [calc_temp_overlap(s, e, start_2[0], end_2[0]) for s, e in zip(start_1, end_1)]
+        assert np.allclose(ratio, ratio_scalar)
+
+    def test_timezone(self, spans):
+        """Test that timezone aware datetimes are compared in UTC."""
+        start_1, end_1, start_2, end_2 = spans
+        start_2, end_2 = start_2.dt.tz_convert("America/New_York"), end_2.dt.tz_convert("America/New_York")
+        assert np.array_equal(calc_temp_overlap_array(start_1, end_1, start_2, end_2), calc_temp_overlap_array(*spans))
+
+    def test_pairwise(self, spans):
+        """Test that all pairs are compared and pairs of different users are missing."""
+        start_1, end_1, start_2, end_2 = spans
+        ratio = calc_temp_overlap_array(start_1, end_1, start_2[:5], end_2[:5], pairwise=True)
+        assert ratio.shape == (20, 5)
+        assert ratio[3, 4] == calc_temp_overlap(start_1[3], end_1[3], start_2[4], end_2[4])
+
+        user_1, user_2 = np.arange(20) % 2, np.arange(5) % 2
+        ratio_user = calc_temp_overlap_array(start_1, end_1, start_2[:5], end_2[:5], True, user_1, user_2)
+        same_user = user_1[:, None] == user_2
+        assert np.array_equal(ratio_user[same_user], ratio[same_user])
+        assert np.isnan(ratio_user[~same_user]).all()
+
+
+class TestInterval_join:
+    """Test interval_join"""
+
+    @pytest.fixture
+    def intervals(self):
+        """Random intervals of three users."""
+        rng = np.random.default_rng(0)
+        t = pd.Timestamp("2021-01-01", tz="utc")
+
+        def random_intervals(n):
+            start = t + pd.to_timedelta(rng.integers(0, 100, n), unit="h")
+            end = start + pd.to_timedelta(rng.integers(0, 10, n), unit="h")
+            return pd.DataFrame({"user_id": rng.integers(0, 3, n), "started_at": start, "finished_at": end})
+
+        left, right = random_intervals(100), random_intervals(50)
+        right.index = right.index + 1000
+        return left, right
+
+    def test_brute_force(self, intervals):
+        """Test that the same pairs as with a cross join are found."""
+        left, right = intervals
+        pairs = interval_join(left, right)
+        cross = left.reset_index().merge(right.reset_index(), on="user_id", suffixes=("_l", "_r"))
+        overlap = (cross["started_at_l"] < cross["finished_at_r"]) & (cross["started_at_r"] < cross["finished_at_l"])
+        cross = cross[overlap]
+        assert set(zip(pairs["left"], pairs["right"])) == set(zip(cross["index_l"], cross["index_r"]))
+        assert len(pairs) == len(cross)
+        assert pairs["left"].is_monotonic_increasing
+
+    @pytest.mark.parametrize("closed", ["left", "right", "both", "neither"])
+    def test_within(self, intervals, closed):
+        """Test that timestamps are matched with the intervals they lie in."""
+        left, right = intervals
+        pairs = interval_join(left, right, left_on="started_at", how="within", closed=closed)
+        cross = left.reset_index().merge(right.reset_index(), on="user_id", suffixes=("_l", "_r"))
+        interval = pd.IntervalIndex.from_arrays(cross["started_at_r"], cross["finished_at_r"], closed=closed)
+        within = [t in i for t, i in zip(cross["started_at_l"], interval)]
+        cross = cross[within]
+        assert set(zip(pairs["left"], pairs["right"])) == set(zip(cross["index_l"], cross["index_r"]))
+        assert len(pairs) == len(cross)
+
+    @pytest.mark.parametrize("how", ["preceding", "following"])
+    @pytest.mark.parametrize("closed", ["left", "right", "both", "neither"])
+    def test_nearest(self, intervals, how, closed):
+        """Test that the closest timestamp before or after is matched."""
+        left, right = intervals
+        pairs = interval_join(left, right, left_on="started_at", right_on="started_at", how=how, closed=closed)
+        cross = left.reset_index().merge(right.reset_index(), on="user_id", suffixes=("_l", "_r"))
+        diff = cross["started_at_r"] - cross["started_at_l"]
+        if how == "preceding":
+            diff = -diff
+        inclusive = closed in (["right", "both"] if how == "preceding" else ["left", "both"])
+        cross = cross[(diff >= pd.Timedelta(0)) if inclusive else (diff > pd.Timedelta(0))]
+        expected = cross.groupby("index_l")["started_at_r"].agg("max" if how == "preceding" else "min")
+        assert pairs["left"].is_unique
+        assert pairs["left"].tolist() == expected.index.tolist()
+        assert (right.loc[pairs["right"], "started_at"].to_numpy() == expected.to_numpy()).all()
+
+    def test_closed_overlap(self):
+        """Test that intervals that only touch overlap only for closed='both'."""
+        t = pd.Timestamp("2021-01-01", tz="utc")
+        h = pd.Timedelta("1h")
+        left = pd.DataFrame({"user_id": [0], "started_at": [t], "finished_at": [t + h]})
+        right = pd.DataFrame({"user_id": [0], "started_at": [t + h], "finished_at": [t + 2 * h]})
+        assert len(interval_join(left, right, closed="right")) == 0
+        assert len(interval_join(left, right, closed="both")) == 1
+
+    def test_unknown_parameter(self, intervals):
+        """Test that unknown values for how and closed raise an error."""
+        left, right = intervals
+        with pytest.raises(ValueError, match="how unknown"):
+            interval_join(left, right, how="nearest")
+        with pytest.raises(ValueError, match="closed unknown"):
+            interval_join(left, right, closed="open")
+
+    def test_by_none(self, intervals):
+        """Test that without partition intervals of different users are joined."""
+        left, right = intervals
+        pairs = interval_join(left, right, by=None)
+        right["user_id"] = 0
+        left["user_id"] = 0
+        assert_frame_equal(pairs, interval_join(left, right))
+
+    @pytest.mark.parametrize("how", ["overlap", "within", "preceding", "following"])
+    def test_missing_by(self, intervals, how):
+        """Test that rows with a missing value in 'by' are not matched."""
+        left, right = intervals
+        left_on = ("started_at", "finished_at") if how == "overlap" else "started_at"
+        right_on = "started_at" if how in ["preceding", "following"] else ("started_at", "finished_at")
+        left["user_id"] = left["user_id"].where(left["user_id"] != 0)
+        right["user_id"] = right["user_id"].where(right["user_id"] != 0)
+        pairs = interval_join(left, right, left_on=left_on, right_on=right_on, how=how)
+        assert len(pairs) > 0
+        assert left.loc[pairs["left"], "user_id"].notna().all()
+        assert (left.loc[pairs["left"], "user_id"].to_numpy() == right.loc[pairs["right"], "user_id"].to_numpy()).all()
+
+    def test_negative_duration(self):
+        """Test that intervals that end before they start are not matched."""
+        t = pd.Timestamp("2021-01-01", tz="utc")
+        h = pd.Timedelta("1h")
+        left = pd.DataFrame({"user_id": [0, 0], "started_at": [t + 2 * h, t], "finished_at": [t, t + h]})
+        right = pd.DataFrame({"user_id": [0, 0], "started_at": [t + 3 * h, t], "finished_at": [t, t + 3 * h]})
+        pairs = interval_join(left, right)
+        assert pairs.values.tolist() == [[1, 1]]
+        pairs = interval_join(left, right, left_on="started_at", how="within")
+        assert pairs.values.tolist() == [[0, 1], [1, 1]]
+
+    def test_touching(self):
+        """Test that intervals that only touch don't overlap."""
+        t = pd.Timestamp("2021-01-01", tz="utc")
+        h = pd.Timedelta("1h")
+        left = pd.DataFrame({"user_id": [0, 0], "started_at": [t, t + h], "finished_at": [t + h, t + 2 * h]})
+        right = pd.DataFrame({"user_id": [0], "started_at": [t + h], "finished_at": [t + 3 * h]})
+        pairs = interval_join(left, right)
+        assert pairs.values.tolist() == [[1, 0]]
+
+    def test_empty(self, intervals):
+        """Test that empty inputs return no pairs."""
+        left, right = intervals
+        assert len(interval_join(left, right.iloc[:0])) == 0
+        assert len(interval_join(left.iloc[:0], right)) == 0
+
+
 class TestExplodeAgg:
     """Test util method _explode_agg"""
 
@@ -5,12 +5,13 @@ from .labelling import create_activity_flag
 from .labelling import predict_transport_mode
 
 from .modal_split import calculate_modal_split
+from .modal_split import calculate_modal_split_cube, update_modal_split_cube, modal_split_from_cube
 
 from .location_identification import location_identifier
 from .location_identification import pre_filter_locations
 from .location_identification import freq_method, osna_method
 
-from .metrics import radius_gyration, jump_length
+from .metrics import radius_gyration, jump_length, mobility_metrics
 
 __all__ = [
     "temporal_tracking_quality",
@@ -18,10 +19,14 @@ __all__ = [
     "create_activity_flag",
     "predict_transport_mode",
     "calculate_modal_split",
+    "calculate_modal_split_cube",
+    "update_modal_split_cube",
+    "modal_split_from_cube",
     "location_identifier",
     "pre_filter_locations",
     "freq_method",
     "osna_method",
     "radius_gyration",
     "jump_length",
+    "mobility_metrics",
 ]
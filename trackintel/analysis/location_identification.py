@@ -56,11 +56,16 @@ def location_identifier(staypoints, method="FREQ", pre_filter=True, **pre_filter
             )
         )
     if pre_filter:
-        f = pre_filter_locations(sp, **pre_filter_kwargs)
+        stats = _location_stats(sp, pre_filter_kwargs.pop("agg_level", "user"))
+        f = _filter_location_stats(stats, **pre_filter_kwargs)
     else:
+        stats = None
         f = pd.Series(np.full(len(sp.index), True), index=sp.index)
 
-    if method == "FREQ":
+    if method == "FREQ" and stats is not None and "duration" not in sp.columns:
+        # reuse durations of the pre-filter
+        method_val = pd.DataFrame({"purpose": _freq_transform(stats[f], "home", "work")})
+    elif method == "FREQ":
         method_val = freq_method(sp[f], "home", "work")
     elif method == "OSNA":
         method_val = osna_method(sp[f])
@@ -121,45 +126,66 @@ def pre_filter_locations(
     >>> mask = pre_filter_locations(staypoints)
     >>> staypoints = staypoints[mask]
     """
-    sp = staypoints.copy()
-    if isinstance(thresh_loc_time, str):
-        thresh_loc_time = pd.to_timedelta(thresh_loc_time)
-    if isinstance(thresh_loc_period, str):
-        thresh_loc_period = pd.to_timedelta(thresh_loc_period)
+    stats = _location_stats(staypoints, agg_level)
+    return _filter_location_stats(stats, thresh_sp, thresh_loc, thresh_sp_at_loc, thresh_loc_time, thresh_loc_period)
 
-    # filtering users
-    user = sp.groupby("user_id").nunique()
-    user_sp = user["started_at"] >= thresh_sp  # every staypoint should have a started_at -> count
-    user_loc = user["location_id"] >= thresh_loc
-    user_filter_agg = user_sp & user_loc
-    user_filter_agg.rename("user_filter", inplace=True)  # rename for merging
-    user_filter = pd.merge(sp["user_id"], user_filter_agg, left_on="user_id", right_index=True)["user_filter"]
 
-    # filtering locations
-    sp["duration"] = sp["finished_at"] - sp["started_at"]
+def _location_stats(staypoints, agg_level="user"):
+    """Statistics of users and locations that are needed for filtering, broadcast to every staypoint.
+
+    Parameters
+    ----------
+    staypoints : Staypoints
+        Staypoints with the column "location_id".
+
+    agg_level: {"user", "dataset"}, default "user"
+        The level of aggregation of the location statistics.
+
+    Returns
+    -------
+    pd.DataFrame
+        Same index as `staypoints` with the columns "user_id", "location_id", "duration" (of the staypoint),
+        "user_n_sp", "user_n_loc", "loc_n_sp", "loc_duration" and "loc_period".
+    """
     if agg_level == "user":
         groupby_loc = ["user_id", "location_id"]
     elif agg_level == "dataset":
         groupby_loc = ["location_id"]
     else:
         raise ValueError(f"Unknown agg_level '{agg_level}' use instead {{'user', 'dataset'}}.")
-    loc = sp.groupby(groupby_loc).agg({"started_at": ["min", "count"], "finished_at": "max", "duration": "sum"})
-    loc.columns = loc.columns.droplevel(0)  # remove possible multi-index
-    loc.rename(columns={"min": "started_at", "max": "finished_at", "sum": "duration"}, inplace=True)
-    # period for maximal time span first visit - last visit.
+
+    stats = staypoints[["user_id", "location_id", "started_at", "finished_at"]].copy()
+    stats["duration"] = stats["finished_at"] - stats["started_at"]
+
+    user = stats.groupby("user_id")
+    stats["user_n_sp"] = user["started_at"].transform("nunique")  # every staypoint should have a started_at
+    stats["user_n_loc"] = user["location_id"].transform("nunique")
+
+    loc = stats.groupby(groupby_loc)
+    stats["loc_n_sp"] = loc["started_at"].transform("count")
     # duration for effective time spent at location summed up.
-    loc["period"] = loc["finished_at"] - loc["started_at"]
-    loc_sp = loc["count"] >= thresh_sp_at_loc
-    loc_time = loc["duration"] >= thresh_loc_time
-    loc_period = loc["period"] >= thresh_loc_period
-    loc_filter_agg = loc_sp & loc_time & loc_period
-    loc_filter_agg.rename("loc_filter", inplace=True)  # rename for merging
-    loc_filter = pd.merge(sp[groupby_loc], loc_filter_agg, how="left", left_on=groupby_loc, right_index=True)
-    loc_filter = loc_filter["loc_filter"]
+    stats["loc_duration"] = loc["duration"].transform("sum")
+    # period for maximal time span first visit - last visit.
+    stats["loc_period"] = loc["finished_at"].transform("max") - loc["started_at"].transform("min")
+    return stats.drop(columns=["started_at", "finished_at"])
 
-    total_filter = user_filter & loc_filter
 
-    return total_filter
+def _filter_location_stats(
+    stats, thresh_sp=10, thresh_loc=10, thresh_sp_at_loc=10, thresh_loc_time="1h", thresh_loc_period="5h"
+):
+    """Filter mask from the output of `_location_stats`, see `pre_filter_locations` for the parameters."""
+    if isinstance(thresh_loc_time, str):
+        thresh_loc_time = pd.to_timedelta(thresh_loc_time)
+    if isinstance(thresh_loc_period, str):
+        thresh_loc_period = pd.to_timedelta(thresh_loc_period)
+
+    # filtering users
+    user_filter = (stats["user_n_sp"] >= thresh_sp) & (stats["user_n_loc"] >= thresh_loc)
+    # filtering locations
+    loc_sp = stats["loc_n_sp"] >= thresh_sp_at_loc
+    loc_time = stats["loc_duration"] >= thresh_loc_time
+    loc_period = stats["loc_period"] >= thresh_loc_period
+    return user_filter & loc_sp & loc_time & loc_period
 
 
 def freq_method(staypoints, *labels):
@@ -191,57 +217,58 @@ def freq_method(staypoints, *labels):
     sp = staypoints.copy()
     if not labels:
         labels = ("home", "work")
-    for name, group in sp.groupby("user_id"):
-        if "duration" not in group.columns:
-            group["duration"] = group["finished_at"] - group["started_at"]
-        # pandas keeps inner order of groups
-        sp.loc[sp["user_id"] == name, "purpose"] = _freq_transform(group, *labels)
-    if "purpose" not in sp.columns:  # if empty sp
-        sp["purpose"] = None
+    if "duration" not in sp.columns:
+        duration = sp["finished_at"] - sp["started_at"]
+    else:
+        duration = sp["duration"]
+    df = pd.DataFrame({"user_id": sp["user_id"], "location_id": sp["location_id"], "duration": duration})
+    sp["purpose"] = _freq_transform(df, *labels).to_numpy()
     return sp
 
 
-def _freq_transform(group, *labels):
-    """Transform function that assigns the longest (duration) visited locations the labels in order.
+def _freq_transform(df, *labels):
+    """Transform function that assigns the longest (duration) visited locations of every user the labels in order.
 
     Parameters
     ----------
-    group : pd.DataFrame
-        Should have columns "location_id" and "duration".
+    df : pd.DataFrame
+        Should have columns "user_id", "location_id" and "duration".
 
     Returns
     -------
     pd.Series
         dtype : object
     """
-    group_agg = group.groupby("location_id").agg({"duration": "sum"})
-    group_agg["purpose"] = _freq_assign(group_agg["duration"], *labels)
-    group_merge = pd.merge(
-        group["location_id"], group_agg["purpose"], how="left", left_on="location_id", right_index=True
+    duration = df.groupby(["user_id", "location_id"])["duration"].sum()
+    purpose = pd.Series(_freq_assign(duration, *labels), index=duration.index, name="purpose", dtype="object")
+    df_merge = pd.merge(
+        df[["user_id", "location_id"]], purpose, how="left", left_on=["user_id", "location_id"], right_index=True
     )
-    return group_merge["purpose"]
+    return df_merge["purpose"]
 
 
 def _freq_assign(duration, *labels):
-    """Assign k labels to k longest durations the rest is `None`.
+    """Assign k labels to k longest durations per user the rest is `None`.
 
     Parameters
     ----------
     duration : pd.Series
+        Durations with the user in the first index level.
 
     Returns
     -------
     np.array
         dtype : object
     """
-    kth = (-duration).argsort()[: len(labels)]  # if inefficient use partial sort.
+    # ties are resolved in the order of the index
+    rank = (-duration).groupby(level=0).rank(method="first").to_numpy()
     label_array = np.full(len(duration), fill_value=None)
-    labels = labels[: len(kth)]  # if provided with more labels than entries.
-    label_array[kth] = labels
+    labelled = rank <= len(labels)
+    label_array[labelled] = np.array(labels, dtype=object)[rank[labelled].astype(int) - 1]
     return label_array
 
 
-def osna_method(staypoints):
+def osna_method(staypoints, weekend=(5, 6), start_rest=2, start_work=8, start_leisure=19):
     """Find "home" location for timeframes "rest" and "leisure" and "work" location for "work" timeframe.
 
     Use weekdays data divided in three time frames ["rest", "work", "leisure"] to generate location labels.
@@ -253,6 +280,18 @@ def osna_method(staypoints):
     staypoints : Staypoints
         Staypoints with the column "location_id".
 
+    weekend : collection of int, default (5, 6)
+        Days of the week (Monday=0, Sunday=6) that are excluded from the analysis.
+
+    start_rest : int or array-like of int, default 2
+        Hour the "rest" timeframe starts. Can be given per day of the week as array of length 7 (Monday first).
+
+    start_work : int or array-like of int, default 8
+        Hour the "work" timeframe starts (and the "rest" timeframe ends). Can be given per day of the week.
+
+    start_leisure : int or array-like of int, default 19
+        Hour the "leisure" timeframe starts (and the "work" timeframe ends). Can be given per day of the week.
+
     Returns
     -------
     Staypoints
@@ -275,79 +314,98 @@ def osna_method(staypoints):
     --------
     >>> from ti.analysis import osna_method
     >>> staypoints = osna_method(staypoints)
+    >>> # work ends at 14:00 on fridays
+    >>> staypoints = osna_method(staypoints, start_leisure=[19, 19, 19, 19, 14, 19, 19])
     """
     sp_in = staypoints  # no copy --> used to join back later.
-    sp = sp_in.copy()
-    sp["duration"] = sp["finished_at"] - sp["started_at"]
-    sp["mean_time"] = sp["started_at"] + sp["duration"] / 2
-
-    sp["label"] = sp["mean_time"].apply(_osna_label_timeframes)
-    sp.loc[sp["label"] == "rest", "duration"] *= 0.739  # weight given in paper
-    sp.loc[sp["label"] == "leisure", "duration"] *= 0.358  # weight given in paper
-
-    groups_map = {
-        "rest": "home",
-        "leisure": "home",
-        "work": "work",
-    }  # weekends aren't included in analysis!
-    # groupby user, location and label.
-    groups = ["user_id", "location_id", sp["label"].map(groups_map)]
+    duration = sp_in["finished_at"] - sp_in["started_at"]
+    mean_time = sp_in["started_at"] + duration / 2
+
+    label = _osna_label_timeframes(mean_time, weekend, start_rest, start_work, start_leisure)
+    weight = np.select([label == "rest", label == "leisure"], [0.739, 0.358], default=1.0)  # weight given in paper
+    # weekends aren't included in analysis!
+    is_weekday = label != "weekend"
+    sp = pd.DataFrame(
+        {
+            "user_id": sp_in["user_id"].to_numpy()[is_weekday],
+            "location_id": sp_in["location_id"].to_numpy()[is_weekday],
+            "group": np.where(label == "work", "work", "home")[is_weekday],
+            "duration": (duration * weight)[is_weekday].to_numpy(),
+        }
+    )
 
-    sp_agg = sp.groupby(groups)["duration"].sum()
+    # groupby user, location and label.
+    sp_agg = sp.groupby(["user_id", "location_id", "group"])["duration"].sum()
     if sp_agg.empty:
         warnings.warn("Got empty table in the osna method, check if the dates lie in weekends.")
         sp_in["purpose"] = pd.NA
         return sp_in
 
-    # create a pivot table -> labels "home" and "work" as columns. ("user_id", "location_id" still in index.)
-    sp_pivot = sp_agg.unstack()
-    # get index of maximum for columns "work" and "home"
-    # looks over locations to find maximum for columns
-    # use fillna such that idxmax raises no error on columns with only NaT
-    sp_idxmax = sp_pivot.fillna(pd.Timedelta(0)).groupby(["user_id"]).idxmax()
-
-    # preset dtype to avoid upcast (float64 -> object) in pandas (and the corresponding error)
-    sp_pivot["purpose"] = None
-    # assign empty index to idx_work/idx_home to have a default behavior for the intersection later
-    idx_work = idx_home = pd.Index([])
-    if "work" in sp_pivot.columns:
-        # first get all index of max entries (of work) that are not NaT
-        idx_work = sp_pivot.loc[sp_idxmax["work"], "work"].dropna().index
-        # set them to the corresponding purpose (work)
-        sp_pivot.loc[idx_work, "purpose"] = "work"
-
-    if "home" in sp_pivot.columns:
-        # get all index of max entries (of home) that are not NaT
-        idx_home = sp_pivot.loc[sp_idxmax["home"], "home"].dropna().index
-        # set them to the corresponding purpose (home overrides work!)
-        sp_pivot.loc[idx_home, "purpose"] = "home"
-
-    # if override happened recalculate work
-    overlap = idx_home.intersection(idx_work)
-    if not overlap.empty:
-        # remove overlap -> must take another location as everything is NaT on maximum
-        sp_pivot.loc[overlap, "work"] = pd.NaT
-        sp_idxmax = sp_pivot["work"].fillna(pd.Timedelta(0)).groupby(["user_id"]).idxmax()
-        idx_work = sp_pivot.loc[sp_idxmax, "work"].dropna().index
-        sp_pivot.loc[idx_work, "purpose"] = "work"
+    group = sp_agg.index.get_level_values("group")
+    idx_home = _osna_idxmax(sp_agg[group == "home"].droplevel("group"))
+    work = sp_agg[group == "work"].droplevel("group")
+    # home overrides work -> take location with 2nd highest score as work
+    idx_work = _osna_idxmax(work[~work.index.isin(idx_home)])
+
+    purpose = pd.Series(None, index=sp_agg.index.droplevel("group").unique(), name="purpose", dtype="object")
+    purpose[idx_work] = "work"
+    purpose[idx_home] = "home"
 
     # now join it back together
     sel = sp_in.columns != "purpose"  # no overlap with older "purpose"
     return pd.merge(
         sp_in.loc[:, sel],
-        sp_pivot["purpose"],
+        purpose,
         how="left",
         left_on=["user_id", "location_id"],
         right_index=True,
     )
 
 
-def _osna_label_timeframes(dt, weekend=[5, 6], start_rest=2, start_work=8, start_leisure=19):
-    """Help function to assign "weekend", "rest", "work", "leisure"."""
-    if dt.weekday() in weekend:
-        return "weekend"
-    if start_rest <= dt.hour < start_work:
-        return "rest"
-    if start_work <= dt.hour < start_leisure:
-        return "work"
-    return "leisure"
+def _osna_idxmax(duration):
+    """Index of the location with the maximum duration per user (first location on ties).
+
+    Parameters
+    ----------
+    duration : pd.Series
+        Durations with MultiIndex ("user_id", "location_id").
+
+    Returns
+    -------
+    pd.MultiIndex
+    """
+    duration = duration.sort_values(ascending=False, kind="stable")
+    return duration.index[~duration.index.get_level_values("user_id").duplicated()]
+
+
+def _osna_label_timeframes(dt, weekend=(5, 6), start_rest=2, start_work=8, start_leisure=19):
+    """Help function to assign "weekend", "rest", "work", "leisure".
+
+    Parameters
+    ----------
+    dt : pd.Series or pd.DatetimeIndex
+        Datetimes to label.
+
+    weekend : collection of int, default (5, 6)
+        Days of the week (Monday=0) labelled as "weekend".
+
+    start_rest, start_work, start_leisure : int or array-like of int
+        Start hour of the timeframes, either for all days or per day of the week (array of length 7).
+
+    Returns
+    -------
+    np.array
+        dtype : str
+    """
+    dt = pd.DatetimeIndex(dt)
+    weekday = dt.weekday.to_numpy()
+    hour = dt.hour.to_numpy()
+    start_rest, start_work, start_leisure = (
+        np.broadcast_to(s, 7)[weekday] for s in (start_rest, start_work, start_leisure)
+    )
+    conditions = [
+        np.isin(weekday, weekend),
+        (start_rest <= hour) & (hour < start_work),
+        (start_work <= hour) & (hour < start_leisure),
+    ]
+    return np.select(conditions, ["weekend", "rest", "work"], default="leisure")
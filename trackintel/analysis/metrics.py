@@ -1,6 +1,5 @@
 import numpy as np
 import pandas as pd
-from tqdm import tqdm
 
 from trackintel.geogr import point_haversine_dist, check_gdf_planar
 
@@ -20,13 +19,18 @@ def radius_gyration(sp, method="count", print_progress=False):
         - `duration`: assigns each Point a weight based on duration.
 
     print_progress: bool, default False
-        Show per-user progress if set to True.
+        Has no effect as the calculation is vectorized over all users, only kept for backwards compatibility.
 
     Returns
     -------
     Series
         Radius of gyration for individual users.
 
+    Notes
+    -----
+    For geographic crs the center of mass is calculated with the circular mean of the longitudes
+    (same as in :func:`trackintel.preprocessing.util.angle_centroid_multipoints`) to handle the wrap-around at ±180°.
+
     References
     ----------
     [1] Gonzalez, M. C., Hidalgo, C. A., & Barabasi, A. L. (2008).
@@ -36,50 +40,59 @@ def radius_gyration(sp, method="count", print_progress=False):
     if method not in ["count", "duration"]:
         raise ValueError(f'Method unknown. Should be on of {{"count", "duration"}}. You passed "{method}"')
 
-    if print_progress:
-        tqdm.pandas(desc="User radius of gyration calculation")
-        s = sp.groupby("user_id").progress_apply(_radius_gyration_user, method=method)
-    else:
-        s = sp.groupby("user_id").apply(_radius_gyration_user, method=method)
+    user, user_ids = pd.factorize(sp["user_id"], sort=True)
+    # staypoints without user (code -1) are dropped, as by groupby
+    valid = user >= 0
+    user = user[valid]
+    x = sp.geometry.x.to_numpy()[valid]
+    y = sp.geometry.y.to_numpy()[valid]
+    if method == "duration":
+        w = (sp["finished_at"] - sp["started_at"]).dt.total_seconds().to_numpy()[valid]
+    else:  # method == count
+        w = np.ones_like(x)
 
-    s = s.rename("radius_gyration")
-    return s
+    square_rg = _radius_gyration(user, len(user_ids), x, y, w, check_gdf_planar(sp))
+    return pd.Series(np.sqrt(square_rg), index=pd.Index(user_ids, name="user_id"), name="radius_gyration")
 
 
-def _radius_gyration_user(sp, method):
+def _radius_gyration(user, n_users, x, y, w, planar):
     """
-    User level radius of gyration calculation, see radius_gyration() for more details.
+    Squared radius of gyration per user from coordinate arrays.
 
     Parameters
     ----------
-    sp : Staypoints
-    method: {"count", "duration"}
+    user : np.array
+        User codes in [0, n_users).
+    n_users : int
+    x, y : np.array
+        Coordinates.
+    w : np.array
+        Weights.
+    planar : bool
+        If False the coordinates are in degrees and haversine distances are used.
 
     Returns
     -------
-    float
-        The radius of gyration of the user
+    np.array
+        Squared radius of gyration, NaN for users without weight.
     """
-    x = sp.geometry.x
-    y = sp.geometry.y
-
-    if method == "duration":
-        duration = sp["finished_at"] - sp["started_at"]
-        w = duration.dt.total_seconds()
-    else:  # method == count (check is done in upper level)
-        w = np.ones_like(x)
-
-    x_center = np.average(x, weights=w)
-    y_center = np.average(y, weights=w)
-    if check_gdf_planar(sp):
-        sq_dist = (x - x_center) ** 2 + (y - y_center) ** 2
-    else:
-        sq_dist = point_haversine_dist(x, y, x_center, y_center) ** 2
-    square_rg = np.average(sq_dist, weights=w)
-    return np.sqrt(square_rg)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        w_sum = np.bincount(user, weights=w, minlength=n_users)
+        y_center = np.bincount(user, weights=w * y, minlength=n_users) / w_sum
+        if planar:
+            x_center = np.bincount(user, weights=w * x, minlength=n_users) / w_sum
+            sq_dist = (x - x_center[user]) ** 2 + (y - y_center[user]) ** 2
+        else:
+            # calculate mean of x coordinates with wrapping
+            x_rad = np.deg2rad(x)
+            x_sin = np.bincount(user, weights=w * np.sin(x_rad), minlength=n_users)
+            x_cos = np.bincount(user, weights=w * np.cos(x_rad), minlength=n_users)
+            x_center = np.rad2deg(np.arctan2(x_sin, x_cos))
+            sq_dist = point_haversine_dist(x, y, x_center[user], y_center[user]) ** 2
+        return np.bincount(user, weights=w * sq_dist, minlength=n_users) / w_sum
 
 
-def jump_length(staypoints):
+def jump_length(staypoints, dtype=np.float64):
     """
     Jump length between consecutive staypoints per users.
 
@@ -87,6 +100,10 @@ def jump_length(staypoints):
     ----------
     sp : Staypoints
 
+    dtype : {np.float64, np.float32}, default np.float64
+        Precision of the haversine distance calculation (ignored for planar crs).
+        np.float32 is faster for large datasets, but only accurate to about one meter.
+
     Returns
     -------
     pd.Series
@@ -97,32 +114,216 @@ def jump_length(staypoints):
     ----------
     [1] Brockmann, D., Hufnagel, L., & Geisel, T. (2006). The scaling laws of human travel. Nature, 439(7075), 462-465.
     """
-    geom = staypoints.geometry.name
-    staypoints = staypoints.sort_values(by=["user_id", "started_at"])[["user_id", geom]]
-    # due to bug in GeoPandas 0.14.0, we cannot use transform on grouped GeoSeries,
-    # thus we stay in GeoDataFrame and convert in the end to Series (will be fixed in next release)
-    series = staypoints.groupby(by="user_id").transform(_jump_length_user)
-    series = series[geom].rename("jump_length")
-    return series
+    # sort by user and time without copying the whole frame, staypoints without user (code -1) last
+    user, user_ids = pd.factorize(staypoints["user_id"], sort=True)
+    user = np.where(user < 0, len(user_ids), user)
+    order = np.lexsort((staypoints["started_at"].values, user))
+    user = user[order]
+    x = staypoints.geometry.x.to_numpy()[order]
+    y = staypoints.geometry.y.to_numpy()[order]
+    # jumps between consecutive staypoints of the same user, staypoints without user have no jumps
+    same_user = (user[1:] == user[:-1]) & (user[1:] < len(user_ids))
+
+    dist = np.full(len(staypoints), np.nan)
+    if check_gdf_planar(staypoints):
+        dist[:-1] = np.sqrt((x[1:] - x[:-1]) ** 2 + (y[1:] - y[:-1]) ** 2)
+    else:
+        dist[:-1] = point_haversine_dist(x[:-1], y[:-1], x[1:], y[1:], dtype=dtype)
+    dist[:-1][~same_user] = np.nan
+    return pd.Series(dist, index=staypoints.index[order], name="jump_length")
 
 
-def _jump_length_user(g):
+_METRICS = ["radius_gyration", "k_radius_gyration", "jump_length", "n_locations", "entropy", "waiting_time"]
+_LOCATION_METRICS = ["k_radius_gyration", "n_locations", "entropy"]
+
+
+def mobility_metrics(staypoints, metrics=None, method="count", k=2, dtype=np.float64):
     """
-    Jump length for a single user.
+    Calculate several mobility metrics per user at once.
+
+    The staypoints are sorted only once and all requested metrics are calculated from the same arrays.
 
     Parameters
     ----------
-    g : gpd.GeoSeries
+    staypoints : Staypoints
+
+    metrics : list of str, optional
+        The metrics to calculate, by default all of them:
+
+        - `radius_gyration`: radius of gyration, see :func:`radius_gyration`.
+        - `k_radius_gyration`: radius of gyration of the staypoints at the k most visited locations of the user [1].
+        - `jump_length`: mean distance between consecutive staypoints, see :func:`jump_length`.
+        - `n_locations`: number of distinct visited locations.
+        - `entropy`: Shannon entropy (base 2) of the visit frequencies of the locations [2].
+        - `waiting_time`: mean and median duration of the staypoints in seconds,
+          returned in the columns `waiting_time_mean` and `waiting_time_median`.
+
+    method: {"count", "duration"}, default "count"
+        Weighting for the radius of gyration, see :func:`radius_gyration`.
+
+    k : int, default 2
+        Number of most visited locations for `k_radius_gyration`.
+
+    dtype : {np.float64, np.float32}, default np.float64
+        Precision of the haversine distance calculation of `jump_length` (ignored for planar crs).
 
     Returns
     -------
-    np.array
+    pd.DataFrame
+        One row per user (index "user_id") and one column per metric.
+
+    Notes
+    -----
+    The metrics `k_radius_gyration`, `n_locations` and `entropy` require the column "location_id".
+    Staypoints without location are not counted for them.
+
+    References
+    ----------
+    [1] Pappalardo, L., Simini, F., Rinzivillo, S., Pedreschi, D., Giannotti, F., & Barabási, A. L. (2015).
+    Returners and explorers dichotomy in human mobility. Nature communications, 6(1), 8166.
+
+    [2] Song, C., Qu, Z., Blumm, N., & Barabási, A. L. (2010).
+    Limits of predictability in human mobility. Science, 327(5968), 1018-1021.
+
+    Examples
+    --------
+    >>> from trackintel.analysis import mobility_metrics
+    >>> mobility_metrics(sp, metrics=["radius_gyration", "entropy"])
+    """
+    if metrics is None:
+        metrics = _METRICS
+    unknown = [m for m in metrics if m not in _METRICS]
+    if unknown:
+        raise ValueError(f"Metrics unknown. Should be in {_METRICS}. You passed {unknown}")
+    if method not in ["count", "duration"]:
+        raise ValueError(f'Method unknown. Should be on of {{"count", "duration"}}. You passed "{method}"')
+    if any(m in _LOCATION_METRICS for m in metrics) and "location_id" not in staypoints.columns:
+        raise KeyError(
+            f"To calculate the metrics {_LOCATION_METRICS} the staypoints must have a column named 'location_id'."
+        )
+
+    # sort once by user and time and share the arrays between all metrics
+    user, user_ids = pd.factorize(staypoints["user_id"], sort=True)
+    # staypoints without user (code -1) are dropped, as by groupby
+    order = np.flatnonzero(user >= 0)
+    order = order[np.lexsort((staypoints["started_at"].values[order], user[order]))]
+    data = {
+        "user": user[order],
+        "n_users": len(user_ids),
+        "x": staypoints.geometry.x.to_numpy()[order],
+        "y": staypoints.geometry.y.to_numpy()[order],
+        "duration": (staypoints["finished_at"] - staypoints["started_at"]).dt.total_seconds().to_numpy()[order],
+        "planar": check_gdf_planar(staypoints),
+        "method": method,
+        "k": k,
+        "dtype": dtype,
+    }
+    if "location_id" in staypoints.columns:
+        data["location"] = pd.factorize(staypoints["location_id"], sort=True)[0][order]
+
+    result = pd.DataFrame(index=pd.Index(user_ids, name="user_id"))
+    for metric in metrics:
+        for column, values in _METRIC_FUNCS[metric](data).items():
+            result[column] = values
+    return result
+
+
+def _weights(data):
+    """Weights of the staypoints for the radius of gyration."""
+    if data["method"] == "duration":
+        return data["duration"]
+    return np.ones(len(data["user"]))
+
+
+def _location_counts(data):
+    """Number of visits per (user, location) pair sorted by user and location (cached in data).
+
+    Staypoints without location are dropped.
     """
-    if check_gdf_planar(g):
-        dist = g.distance(g.shift(-1))
+    if "pair_user" not in data:
+        has_loc = data["location"] >= 0
+        n_locs = data["location"].max() + 1 if len(data["location"]) else 1
+        # pair id of each staypoint, -1 for staypoints without location
+        data["pair"] = np.where(has_loc, data["user"] * n_locs + data["location"], -1)
+        data["n_locs"] = n_locs
+        pair, pair_count = np.unique(data["pair"][has_loc], return_counts=True)
+        data["pair_user"], data["pair_location"] = pair // n_locs, pair % n_locs
+        data["pair_count"] = pair_count
+    return data["pair_user"], data["pair_location"], data["pair_count"]
+
+
+def _metric_radius_gyration(data):
+    """Radius of gyration per user."""
+    square_rg = _radius_gyration(data["user"], data["n_users"], data["x"], data["y"], _weights(data), data["planar"])
+    return {"radius_gyration": np.sqrt(square_rg)}
+
+
+def _metric_k_radius_gyration(data):
+    """Radius of gyration per user only considering the k most visited locations."""
+    pair_user, pair_location, pair_count = _location_counts(data)
+    # rank the locations per user by visits, ties are resolved in favor of the smaller location_id
+    order = np.lexsort((-pair_count, pair_user))
+    pair_user, pair_location = pair_user[order], pair_location[order]
+    pair_start = np.searchsorted(pair_user, pair_user)
+    top_k = (np.arange(len(pair_user)) - pair_start) < data["k"]
+
+    # select the staypoints at the top k locations
+    sel = np.isin(data["pair"], pair_user[top_k] * data["n_locs"] + pair_location[top_k])
+    square_rg = _radius_gyration(
+        data["user"][sel], data["n_users"], data["x"][sel], data["y"][sel], _weights(data)[sel], data["planar"]
+    )
+    return {"k_radius_gyration": np.sqrt(square_rg)}
+
+
+def _metric_jump_length(data):
+    """Mean jump length between consecutive staypoints per user."""
+    user, x, y = data["user"], data["x"], data["y"]
+    same_user = user[1:] == user[:-1]
+    if data["planar"]:
+        dist = np.sqrt((x[1:] - x[:-1]) ** 2 + (y[1:] - y[:-1]) ** 2)
     else:
-        dist = np.zeros(len(g), dtype=np.float64)
-        dist[:-1] = point_haversine_dist(g.x[:-1], g.y[:-1], g.x[1:], g.y[1:])
-        dist[-1] = np.nan
-        dist = pd.Series(data=dist, index=g.index)
-    return dist
+        dist = point_haversine_dist(x[:-1], y[:-1], x[1:], y[1:], dtype=data["dtype"])
+    n_users = data["n_users"]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        jumps = np.bincount(user[1:][same_user], weights=dist[same_user], minlength=n_users)
+        return {"jump_length": jumps / np.bincount(user[1:][same_user], minlength=n_users)}
+
+
+def _metric_n_locations(data):
+    """Number of distinct visited locations per user."""
+    pair_user, _, _ = _location_counts(data)
+    return {"n_locations": np.bincount(pair_user, minlength=data["n_users"])}
+
+
+def _metric_entropy(data):
+    """Shannon entropy of the location visit frequencies per user."""
+    pair_user, _, pair_count = _location_counts(data)
+    n_users = data["n_users"]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        p = pair_count / np.bincount(pair_user, weights=pair_count, minlength=n_users)[pair_user]
+        entropy = -np.bincount(pair_user, weights=p * np.log2(p), minlength=n_users).astype(float)
+    entropy[np.bincount(pair_user, minlength=n_users) == 0] = np.nan
+    return {"entropy": entropy + 0.0}  # avoid -0.0
+
+
+def _metric_waiting_time(data):
+    """Mean and median staypoint duration per user."""
+    user, duration = data["user"], data["duration"]
+    n_users = data["n_users"]
+    count = np.bincount(user, minlength=n_users)
+    mean = np.bincount(user, weights=duration, minlength=n_users) / count
+    # median from the durations sorted within the user segments
+    duration = duration[np.lexsort((duration, user))]
+    start = np.searchsorted(user, np.arange(n_users))
+    median = (duration[start + (count - 1) // 2] + duration[start + count // 2]) / 2
+    return {"waiting_time_mean": mean, "waiting_time_median": median}
+
+
+_METRIC_FUNCS = {
+    "radius_gyration": _metric_radius_gyration,
+    "k_radius_gyration": _metric_k_radius_gyration,
+    "jump_length": _metric_jump_length,
+    "n_locations": _metric_n_locations,
+    "entropy": _metric_entropy,
+    "waiting_time": _metric_waiting_time,
+}
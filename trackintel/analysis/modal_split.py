@@ -1,6 +1,7 @@
 import pandas as pd
+from pandas.tseries.offsets import Day, Tick
 
-from trackintel.geogr import check_gdf_planar, calculate_haversine_length
+from trackintel.geogr import calculate_tripleg_stats
 
 
 def calculate_modal_split(tpls, freq=None, metric="count", per_user=False, norm=False):
@@ -41,15 +42,13 @@ def calculate_modal_split(tpls, freq=None, metric="count", per_user=False, norm=
     >>> triplegs.calculate_modal_split()
     >>> tripleg.calculate_modal_split(freq='W-MON', metric='distance')
     """
-    tpls = tpls.copy()  # copy as we add additional columns on tpls
-
     # count on mode, sum on length and duration
     agg = "sum"
-    # calculate distance and duration if required
+    # calculate distance and duration if required (before copying to make use of the cache on tpls)
     if metric == "distance":
-        tpls[metric] = _calculate_length(tpls)
+        values = _calculate_length(tpls)
     elif metric == "duration":
-        tpls[metric] = (tpls["finished_at"] - tpls["started_at"]).dt.total_seconds()
+        values = (tpls["finished_at"] - tpls["started_at"]).dt.total_seconds()
     elif metric == "count":
         agg = "count"
         metric = "mode"  # count on mode
@@ -57,16 +56,149 @@ def calculate_modal_split(tpls, freq=None, metric="count", per_user=False, norm=
         error_msg = f"Metric {metric} unknown, only metrics {{'count', 'distance', 'duration'}} are supported."
         raise ValueError(error_msg)
 
+    tpls = tpls.copy()  # copy as we add additional columns on tpls
+    if agg == "sum":
+        tpls[metric] = values
+    return _modal_split_table(tpls, "started_at", metric, agg, freq, per_user, norm)
+
+
+def calculate_modal_split_cube(tpls):
+    """
+    Aggregate triplegs per user, day and mode.
+
+    The cube holds the count, distance and duration of the triplegs at the finest granularity supported by
+    :func:`modal_split_from_cube`. It can be extended with new triplegs using :func:`update_modal_split_cube`.
+
+    Parameters
+    ----------
+    tpls : Triplegs
+        triplegs require the column `mode`.
+
+    Returns
+    -------
+    cube : DataFrame
+        Index levels `('user_id', 'timestamp', 'mode')` with `timestamp` the start of the day (in the timezone of
+        `started_at`) and the columns `count`, `distance` (in the unit of the crs, or meters for geographic crs)
+        and `duration` (in seconds).
+
+    Examples
+    --------
+    >>> cube = triplegs.calculate_modal_split_cube()
+    >>> cube = ti.analysis.update_modal_split_cube(cube, new_triplegs)
+    >>> ti.analysis.modal_split_from_cube(cube, freq="W-MON", metric="distance")
+    """
+    stats = calculate_tripleg_stats(tpls)
+    df = pd.DataFrame(
+        {
+            "user_id": tpls["user_id"],
+            "timestamp": tpls["started_at"].dt.normalize(),
+            "mode": tpls["mode"],
+            "count": 1,
+            "distance": stats["length"],
+            "duration": stats["duration"],
+        }
+    )
+    return df.groupby(["user_id", "timestamp", "mode"]).sum()
+
+
+def update_modal_split_cube(cube, tpls):
+    """
+    Add new triplegs to a modal split cube.
+
+    Only the new triplegs are aggregated, the history is taken from the cube.
+
+    Parameters
+    ----------
+    cube : DataFrame
+        Cube created by :func:`calculate_modal_split_cube`.
+
+    tpls : Triplegs
+        New triplegs that are not yet part of the cube.
+
+    Returns
+    -------
+    cube : DataFrame
+        The updated cube.
+
+    Examples
+    --------
+    >>> cube = ti.analysis.update_modal_split_cube(cube, new_triplegs)
+    """
+    new = calculate_modal_split_cube(tpls)
+    return pd.concat((cube, new)).groupby(level=["user_id", "timestamp", "mode"]).sum()
+
+
+def modal_split_from_cube(cube, freq=None, metric="count", per_user=False, norm=False):
+    """
+    Calculate the modal split from a modal split cube.
+
+    Returns the same as :func:`calculate_modal_split` but only needs to roll up the cube instead
+    of aggregating all triplegs.
+
+    Parameters
+    ----------
+    cube : DataFrame
+        Cube created by :func:`calculate_modal_split_cube`.
+    freq : str
+        frequency string passed on as `freq` keyword to the pandas.Grouper class. Must be a multiple of a day as the
+        cube has a daily granularity. If `freq=None` the modal split is calculated on all data.
+    metric : {'count', 'distance', 'duration'}
+        Aggregation used to represent the modal split.
+    per_user : bool, default: False
+        If True the modal split is calculated per user
+    norm : bool, default: False
+        If True every row of the modal split is normalized to 1
+
+    Returns
+    -------
+    modal_split : DataFrame
+        The modal split represented as pandas Dataframe with (optionally) a multi-index. The index can have the
+        levels: `('user_id', 'timestamp')` and every mode as a column.
+
+    Examples
+    --------
+    >>> ti.analysis.modal_split_from_cube(cube, freq="W-MON", metric="distance", per_user=True)
+    """
+    if metric not in ["count", "distance", "duration"]:
+        error_msg = f"Metric {metric} unknown, only metrics {{'count', 'distance', 'duration'}} are supported."
+        raise ValueError(error_msg)
+    if freq is not None:
+        offset = pd.tseries.frequencies.to_offset(freq)
+        if isinstance(offset, Tick) and offset.nanos % Day().nanos != 0:
+            raise ValueError(f"The cube has a daily granularity and cannot be aggregated with freq '{freq}'.")
+    modal_split = _modal_split_table(cube.reset_index(), "timestamp", metric, "sum", freq, per_user, norm)
+    if freq is None and not per_user and metric == "count":
+        modal_split.index = ["mode"]  # calculate_modal_split counts on column mode
+    return modal_split
+
+
+def _modal_split_table(df, time_col, value_col, agg, freq, per_user, norm):
+    """Help function to aggregate the column `value_col` per mode (and optionally per user and time bin).
+
+    Parameters
+    ----------
+    df : DataFrame
+        requires the columns `mode`, `value_col` and `time_col` (if `freq` is not None) and `user_id` (if `per_user`)
+    time_col : str
+    value_col : str
+    agg : str
+    freq, per_user, norm
+        See :func:`calculate_modal_split`.
+
+    Returns
+    -------
+    modal_split : DataFrame
+    """
     group = []
     if per_user:
         group = ["user_id"]
 
     if freq is not None:
-        tpls.set_index("started_at", inplace=True)
-        tpls.index.name = "timestamp"
+        df = df.set_index(time_col)
+        df.index.name = "timestamp"
         group.append(pd.Grouper(freq=freq))
 
-    modal_split = pd.pivot_table(tpls, index=group, columns=["mode"], aggfunc={metric: agg}, fill_value=0)
+    modal_split = pd.pivot_table(df, index=group, columns=["mode"], aggfunc={value_col: agg}, fill_value=0)
     if group:  # non-empty group creates MultiIndex that we need to handle
         modal_split.columns = modal_split.columns.droplevel(0)
 
@@ -78,12 +210,10 @@ def calculate_modal_split(tpls, freq=None, metric="count", per_user=False, norm=
 def _calculate_length(tpls):
     """Help function to calculate length of tripleg.
 
-    Checks if crs is planar or if not. If not uses ``calculate_haversine_length``.
+    Uses the (cached) length of ``calculate_tripleg_stats``, i.e. the haversine length for geographic crs.
 
     Parameters
     ----------
     tpls : Triplegs
     """
-    if check_gdf_planar(tpls):
-        return tpls.length  # if planar use geopandas function
-    return pd.Series(calculate_haversine_length(tpls), index=tpls.index)
+    return calculate_tripleg_stats(tpls)["length"].rename(None)
@@ -1,5 +1,6 @@
 import warnings
 
+import numpy as np
 import pandas as pd
 
 
@@ -76,8 +77,13 @@ def temporal_tracking_quality(source, granularity="all"):
         return None
 
     if granularity == "all":
-        quality = df.groupby("user_id", as_index=False).apply(_get_tracking_quality_user, granularity)
-        return quality
+        quality = df.groupby("user_id", as_index=False).agg(
+            tracked=("duration", "sum"), started_at=("started_at", "min"), finished_at=("finished_at", "max")
+        )
+        # the whole tracking period
+        extent = (quality["finished_at"] - quality["started_at"]).dt.total_seconds()
+        quality["quality"] = quality["tracked"] / extent
+        return quality[["user_id", "quality"]]
 
     # split records that span several days
     df = _split_overlaps(df, granularity="day")
@@ -112,56 +118,30 @@ def temporal_tracking_quality(source, granularity="all"):
         )
 
     # calculate per-user per-grouper tracking quality
-    quality = df.groupby(["user_id", grouper]).apply(_get_tracking_quality_user, granularity).reset_index()
-
-    # rename and reorder
-    quality.rename(columns={"started_at": column_name}, inplace=True)
-    quality = quality[["user_id", column_name, "quality"]]
-
-    return quality
-
-
-def _get_tracking_quality_user(df, granularity="all"):
-    """
-    Tracking quality per-user per-granularity.
-
-    Parameters
-    ----------
-    df : Trackintel class
-        The source dataframe
-
-    granularity : {"all", "day", "weekday", "week", "hour"}, default "all"
-        Determines the extent of the tracking. "all" the entire tracking period,
-        "day" and "weekday" a whole day, "week" a whole week, and "hour" a whole hour.
-
-    Returns
-    -------
-    pandas.Series
-        A pandas.Series object containing the tracking quality
-    """
-    tracked_duration = (df["finished_at"] - df["started_at"]).dt.total_seconds().sum()
-    if granularity == "all":
-        # the whole tracking period
-        extent = (df["finished_at"].max() - df["started_at"].min()).total_seconds()
-    elif granularity == "day":
+    df["duration"] = df["duration"].dt.total_seconds()
+    grouped = df.groupby(["user_id", grouper])
+    tracked = grouped["duration"].sum()
+    if granularity == "day":
         # total seconds in a day
         extent = 60 * 60 * 24
-    elif granularity == "weekday":
-        # total seconds in an day * number of tracked weeks
-        # (entries from multiple weeks may be grouped together)
-        extent = 60 * 60 * 24 * (df["week"].max() - df["week"].min() + 1)
     elif granularity == "week":
         # total seconds in a week
         extent = 60 * 60 * 24 * 7
-    elif granularity == "hour":
+    elif granularity == "weekday":
+        # total seconds in an day * number of tracked weeks
+        # (entries from multiple weeks may be grouped together)
+        extent = 60 * 60 * 24 * (grouped["week"].max() - grouped["week"].min() + 1)
+    else:
         # total seconds in an hour * number of tracked days
         # (entries from multiple days may be grouped together)
-        extent = (60 * 60) * (df["day"].max() - df["day"].min() + 1)
-    else:
-        raise ValueError(
-            f"granularity unknown. We only support ['all', 'day', 'week', 'weekday', 'hour']. You passed {granularity}"
-        )
-    return pd.Series([tracked_duration / extent], index=["quality"])
+        extent = (60 * 60) * (grouped["day"].max() - grouped["day"].min() + 1)
+    quality = (tracked / extent).rename("quality").reset_index()
+
+    # rename and reorder
+    quality.rename(columns={"started_at": column_name}, inplace=True)
+    quality = quality[["user_id", column_name, "quality"]]
+
+    return quality
 
 
 def _split_overlaps(source, granularity="day"):
@@ -181,40 +161,66 @@ def _split_overlaps(source, granularity="day"):
     -------
     Trackintel class
         The input object after the splitting
+
+    Notes
+    -----
+    Days are split at midnight (local time for timezone-aware timestamps), hours are split every full hour
+    after the start of the record.
     """
-    freq = "H" if granularity == "hour" else "D"
-    gdf = source.copy()
-    gdf[["started_at", "finished_at"]] = gdf.apply(_get_times, axis="columns", result_type="expand", freq=freq)
-    # must call DataFrame.explode directly because GeoDataFrame.explode cannot be used on multiple columns
-    gdf = pd.DataFrame.explode(gdf, ["started_at", "finished_at"], ignore_index=True)
+    step = 60 * 60 * 10**9 if granularity == "hour" else 24 * 60 * 60 * 10**9
+    started_at = pd.DatetimeIndex(source["started_at"])
+    finished_at = pd.DatetimeIndex(source["finished_at"])
+    start, finish, shift = _wall_time_ns(started_at, finished_at, granularity)
+
+    # number of boundaries strictly within (start, finish)
+    first_boundary = start // step + 1
+    n_splits = np.maximum(-(-finish // step) - first_boundary, 0)
+    repeats = n_splits + 1
+    rows = np.repeat(np.arange(len(source)), repeats)
+    # position of split within the record
+    k = np.arange(len(rows)) - np.repeat(np.cumsum(repeats) - repeats, repeats)
+    lower = (first_boundary[rows] + k - 1) * step
+    lower = _from_wall_time_ns(lower, shift[rows], started_at.tz, granularity)
+    upper = (first_boundary[rows] + k) * step
+    upper = _from_wall_time_ns(upper, shift[rows], started_at.tz, granularity)
+
+    gdf = source.iloc[rows].reset_index(drop=True)
+    gdf["started_at"] = started_at[rows].where(k == 0, lower)
+    gdf["finished_at"] = finished_at[rows].where(k == n_splits[rows], upper)
     if "duration" in gdf.columns:
         gdf["duration"] = gdf["finished_at"] - gdf["started_at"]
     return gdf
 
 
-def _get_times(row, freq="D"):
+def _wall_time_ns(started_at, finished_at, granularity):
     """
-    Returns the times for splitting range (start-finish) at frequency borders.
-
-    Use it with `.apply()` for a single row of a DataFrame. Set result_type="expand".
-
-    Parameters
-    ----------
-    row : Series
-        Row of dataframe with columns ["started_at", "finished_at"].
+    Transform the timestamps into epoch ns in which the split boundaries are multiples of the step size.
 
-    freq : str or DateOffset, default 'D'
-        Pandas frequency string.
+    For timezone-aware timestamps, days are split at local midnight so both timestamps are transformed into
+    local wall time. Hours are split every 60 minutes (as `pd.date_range`) so both are shifted by the
+    utc offset of the start.
 
     Returns
     -------
-    Tuple of lists
-        Tuple of (start, end) times.
+    start, finish, shift : np.array
+        Transformed starts and finishes and the shift in ns that was added to the utc time of the start.
     """
-    result = []
-    if row["started_at"] != row["started_at"].ceil(freq):
-        result.append(row["started_at"])  # is not on border -> not included in date_range
-    result.extend(pd.date_range(row["started_at"].ceil(freq), row["finished_at"], freq=freq).to_list())
-    if (row["finished_at"] != result[-1]) or (len(result) == 1):  # len check for started_at == finished_at
-        result.append(row["finished_at"])  # is not on border -> not included in data_range
-    return result[:-1], result[1:]
+    start_utc = started_at.as_unit("ns").asi8
+    finish_utc = finished_at.as_unit("ns").asi8
+    if started_at.tz is None:
+        shift = np.zeros(len(start_utc), dtype=np.int64)
+        return start_utc, finish_utc, shift
+    start = started_at.tz_localize(None).as_unit("ns").asi8
+    shift = start - start_utc
+    if granularity == "hour":
+        return start, finish_utc + shift, shift
+    return start, finished_at.tz_localize(None).as_unit("ns").asi8, shift
+
+
+def _from_wall_time_ns(boundaries, shift, tz, granularity):
+    """Transform split boundaries from :func:`_wall_time_ns` back into timestamps."""
+    if tz is None:
+        return pd.DatetimeIndex(boundaries)
+    if granularity == "hour":
+        return pd.DatetimeIndex(boundaries - shift).tz_localize("UTC").tz_convert(tz)
+    return pd.DatetimeIndex(boundaries).tz_localize(tz, ambiguous=True, nonexistent="shift_forward")
@@ -1,5 +1,6 @@
 from .distances import calculate_distance_matrix
 from .distances import calculate_haversine_length
+from .distances import calculate_tripleg_stats
 from .distances import meters_to_decimal_degrees
 from .distances import point_haversine_dist
 from .distances import get_speed_positionfixes
@@ -7,14 +8,17 @@ from .distances import get_speed_triplegs
 from .distances import check_gdf_planar
 
 from .filter import spatial_filter
+from .filter import tag_zones
 
 __all__ = [
     "calculate_distance_matrix",
     "calculate_haversine_length",
+    "calculate_tripleg_stats",
     "meters_to_decimal_degrees",
     "point_haversine_dist",
     "get_speed_positionfixes",
     "get_speed_triplegs",
     "check_gdf_planar",
     "spatial_filter",
+    "tag_zones",
 ]
@@ -1,5 +1,4 @@
 import itertools
-import math
 import warnings
 from math import cos, pi
 
@@ -10,9 +9,10 @@ import similaritymeasures
 from sklearn.metrics import pairwise_distances
 
 from trackintel import Triplegs
+from trackintel.geogr import kernels
 
 
-def point_haversine_dist(lon_1, lat_1, lon_2, lat_2, r=6371000, float_flag=False):
+def point_haversine_dist(lon_1, lat_1, lon_2, lat_2, r=6371000, float_flag=False, out=None, dtype=np.float64):
     """
     Compute the great circle or haversine distance between two coordinates in WGS84.
 
@@ -39,6 +39,13 @@ def point_haversine_dist(lon_1, lat_1, lon_2, lat_2, r=6371000, float_flag=False
     float_flag : bool, default False
         Optimization flag. Set to True if you are sure that you are only using floats as args.
 
+    out : numpy.array, optional
+        Preallocated array the distances are written to. Ignored if `float_flag` is True.
+
+    dtype : {np.float64, np.float32}, default np.float64
+        Precision of the calculation. Use np.float32 to speed up large, memory bound calculations
+        if an accuracy of about one meter is sufficient. Ignored if `float_flag` is True.
+
     Returns
     -------
     float or numpy.array
@@ -46,8 +53,8 @@ def point_haversine_dist(lon_1, lat_1, lon_2, lat_2, r=6371000, float_flag=False
 
     Examples
     --------
-    >>> point_haversine_dist(8.5, 47.3, 8.7, 47.2)
-    18749.056277719905
+    >>> point_haversine_dist(8.5, 47.3, 8.7, 47.2, float_flag=True)
+    18749.05627771994
 
     References
     ----------
@@ -55,29 +62,8 @@ def point_haversine_dist(lon_1, lat_1, lon_2, lat_2, r=6371000, float_flag=False
     https://stackoverflow.com/questions/19413259/efficient-way-to-calculate-distance-matrix-given-latitude-and-longitude-data-in
     """
     if float_flag:
-        lon_1 = math.radians(lon_1)
-        lat_1 = math.radians(lat_1)
-        lon_2 = math.radians(lon_2)
-        lat_2 = math.radians(lat_2)
-
-        cos_lat2 = math.cos(lat_2)
-        cos_lat1 = math.cos(lat_1)
-        cos_lat_d = math.cos(lat_1 - lat_2)
-        cos_lon_d = math.cos(lon_1 - lon_2)
-
-        return r * math.acos(cos_lat_d - cos_lat1 * cos_lat2 * (1 - cos_lon_d))
-
-    lon_1 = np.deg2rad(lon_1).ravel()
-    lat_1 = np.deg2rad(lat_1).ravel()
-    lon_2 = np.deg2rad(lon_2).ravel()
-    lat_2 = np.deg2rad(lat_2).ravel()
-
-    cos_lat1 = np.cos(lat_1)
-    cos_lat2 = np.cos(lat_2)
-    cos_lat_d = np.cos(lat_1 - lat_2)
-    cos_lon_d = np.cos(lon_1 - lon_2)
-
-    return r * np.arccos(cos_lat_d - cos_lat1 * cos_lat2 * (1 - cos_lon_d))
+        return kernels.haversine_scalar(lon_1, lat_1, lon_2, lat_2, r=r)
+    return kernels.haversine(lon_1, lat_1, lon_2, lat_2, r=r, out=out, dtype=dtype)
 
 
 def calculate_distance_matrix(X, Y=None, dist_metric="haversine", n_jobs=None, **kwds):
@@ -244,7 +230,7 @@ def check_gdf_planar(gdf, transform=False):
     return not (gdf.crs is None or gdf.crs.is_geographic)
 
 
-def calculate_haversine_length(gdf):
+def calculate_haversine_length(gdf, dtype=np.float64):
     """
     Calculate the length of linestrings using the haversine distance.
 
@@ -253,6 +239,11 @@ def calculate_haversine_length(gdf):
     gdf : GeoDataFrame with linestring geometry
         The coordinates are expected to be in WGS84
 
+    dtype : {np.float64, np.float32}, default np.float64
+        Precision of the distance calculation between the vertices.
+        np.float32 is faster and needs less memory for large datasets, but is only accurate to about one meter
+        per segment.
+
     Returns
     -------
     length: np.array
@@ -265,10 +256,89 @@ def calculate_haversine_length(gdf):
     """
     geom = gdf.geometry
     assert np.any(shapely.get_type_id(geom) == 1)  # 1 is LineStrings
-    geom, index = shapely.get_coordinates(geom, return_index=True)
+    coords, index = shapely.get_coordinates(geom, return_index=True)
     no_mix = index[:-1] == index[1:]  # mask where LineStrings are not overlapping
-    dist = point_haversine_dist(geom[:-1, 0], geom[:-1, 1], geom[1:, 0], geom[1:, 1])
-    return np.bincount((index[:-1])[no_mix], weights=dist[no_mix])
+    dist = point_haversine_dist(coords[:-1, 0], coords[:-1, 1], coords[1:, 0], coords[1:, 1], dtype=dtype)
+    return np.bincount((index[:-1])[no_mix], weights=dist[no_mix], minlength=len(geom))
+
+
+def calculate_tripleg_stats(triplegs):
+    """
+    Calculate the length, duration and number of vertices of triplegs.
+
+    For `Triplegs` the result is cached on the object, such that analysis functions working on the same
+    triplegs (e.g., speed, transport mode prediction and modal split) compute these columns only once.
+    The cache is invalidated if the index, the crs, the geometries or the timestamps of the triplegs change.
+
+    Parameters
+    ----------
+    triplegs : Triplegs
+
+    Returns
+    -------
+    pd.DataFrame
+        Same index as `triplegs` with the columns `length` (in meters for geographic crs, in the unit of the crs
+        otherwise), `duration` (in seconds) and `n_vertices`.
+
+    Notes
+    -----
+    Checking the cache compares the identity of every geometry and the value of every timestamp, which is much
+    cheaper than the haversine length. Copies of the triplegs (e.g., by ``triplegs.copy()`` or by selecting rows)
+    do not share the cache.
+
+    Examples
+    --------
+    >>> from trackintel.geogr import calculate_tripleg_stats
+    >>> calculate_tripleg_stats(triplegs)["length"].sum()
+    >>> triplegs.calculate_stats()
+    """
+    cache = triplegs._stats_cache if isinstance(triplegs, Triplegs) else None
+    if cache is not None and _tripleg_stats_valid(cache, triplegs):
+        return cache["stats"].copy()
+
+    geometry = triplegs.geometry
+    if check_gdf_planar(triplegs):
+        length = geometry.length.to_numpy()
+    else:
+        length = calculate_haversine_length(triplegs)
+    stats = pd.DataFrame(
+        {
+            "length": length,
+            "duration": (triplegs["finished_at"] - triplegs["started_at"]).dt.total_seconds().to_numpy(),
+            "n_vertices": shapely.get_num_coordinates(geometry.values),
+        },
+        index=triplegs.index,
+    )
+    if isinstance(triplegs, Triplegs):
+        geoms = np.asarray(geometry.values).copy()
+        triplegs._stats_cache = {
+            "stats": stats,
+            "index": triplegs.index,
+            "crs": geometry.crs,
+            # the references keep the geometries alive, such that their ids cannot be reused
+            "geoms": geoms,
+            "geom_ids": _geometry_ids(geoms),
+            "started_at": triplegs["started_at"].array.asi8.copy(),
+            "finished_at": triplegs["finished_at"].array.asi8.copy(),
+        }
+    return stats.copy()
+
+
+def _tripleg_stats_valid(cache, triplegs):
+    """Check if the cached stats are still valid for the (possibly modified in place) triplegs."""
+    geometry = triplegs.geometry.values
+    return (
+        cache["index"] is triplegs.index
+        and cache["crs"] == geometry.crs
+        and np.array_equal(cache["started_at"], triplegs["started_at"].array.asi8)
+        and np.array_equal(cache["finished_at"], triplegs["finished_at"].array.asi8)
+        and np.array_equal(cache["geom_ids"], _geometry_ids(np.asarray(geometry)))
+    )
+
+
+def _geometry_ids(geoms):
+    """Identity of every geometry, geometries can be replaced in place (e.g., by ``.loc``)."""
+    return np.fromiter(map(id, geoms), dtype=np.intp, count=len(geoms))
 
 
 def get_speed_positionfixes(positionfixes):
@@ -335,14 +405,10 @@ def get_speed_triplegs(triplegs, positionfixes=None, method="tpls_speed"):
     Triplegs.validate(triplegs)
     # Simple method: Divide overall tripleg distance by overall duration
     if method == "tpls_speed":
-        if check_gdf_planar(triplegs):
-            distance = triplegs.length
-        else:
-            distance = calculate_haversine_length(triplegs)
-        duration = (triplegs["finished_at"] - triplegs["started_at"]).dt.total_seconds()
+        stats = calculate_tripleg_stats(triplegs)
         # The unit of the speed is m/s
         tpls = triplegs.copy()
-        tpls["speed"] = distance / duration
+        tpls["speed"] = stats["length"] / stats["duration"]
         return tpls
 
     # Pfs-based method: compute speed per positionfix and average then
@@ -1,4 +1,10 @@
-def spatial_filter(source, areas, method="within", re_project=False):
+import numpy as np
+import pandas as pd
+import shapely
+from joblib import Parallel, delayed
+
+
+def spatial_filter(source, areas, method="within", re_project=False, area_col=None):
     """
     Filter a GeoDataFrame on a geo extent. Using spatial indexing for improved performance.
 
@@ -26,44 +32,193 @@ def spatial_filter(source, areas, method="within", re_project=False):
     re_project : bool, default False
         If this is set to True, the 'source' will be projected to the coordinate reference system of 'areas'
 
+    area_col : str, optional
+        If set, a column with this name is added to the result that contains the index of the area
+        that the feature matched. If a feature matches several areas, the first area (in order of 'areas') is used.
+
     Returns
     -------
     GeoDataFrame
         A new GeoDataFrame containing the features after the spatial filtering.
 
+    Notes
+    -----
+    The predicate is evaluated against every area individually and not against the union of all areas.
+    Thus a feature that is only within the union of two adjacent areas but not within any single one of them
+    is not returned by the `within` method. For the same reason such a feature, e.g., a tripleg going from one
+    area into an adjacent one, is returned by the `crosses` method, as it crosses each of the two areas. When
+    testing against the union it did not cross the areas, thus filter on a dissolved 'areas' (e.g.,
+    ``areas.dissolve()``) to keep the previous behavior.
+
     Examples
     --------
     >>> sp.spatial_filter(areas, method="within", re_project=False)
+    >>> sp.spatial_filter(municipalities, method="within", area_col="municipality_id")
     """
-    gdf = source.copy()
+    if method not in ["within", "intersects", "crosses"]:
+        raise ValueError("method unknown. We only support ['within', 'intersects', 'crosses']. " f"You passed {method}")
+
+    gdf = source
 
     if re_project:
         init_crs = gdf.crs
         gdf = gdf.to_crs(areas.crs)
 
-    # build spatial index for pre filtering
-    source_sindex = gdf.sindex
-    possible_matches_index = []
-    for other in areas.itertuples():
-        bounds = other.geometry.bounds
-        c = list(source_sindex.intersection(bounds))
-        possible_matches_index += c
-
-    # Get unique candidates
-    unique_candidate_matches = list(set(possible_matches_index))
-    possible_matches = gdf.iloc[unique_candidate_matches]
-
-    # get final result
-    if method == "within":
-        ret_gdf = possible_matches.loc[possible_matches.within(areas.unary_union)]
-    elif method == "intersects":
-        ret_gdf = possible_matches.loc[possible_matches.intersects(areas.unary_union)]
-    elif method == "crosses":
-        ret_gdf = possible_matches.loc[possible_matches.crosses(areas.unary_union)]
-    else:
-        raise ValueError("method unknown. We only support ['within', 'intersects', 'crosses']. " f"You passed {method}")
+    source_pos, area_pos = _query_areas(gdf.geometry, areas, method)
+    ret_gdf = gdf.iloc[source_pos].copy()
+    if area_col is not None:
+        ret_gdf[area_col] = areas.index.to_numpy()[area_pos]
 
     if re_project:
         return ret_gdf.to_crs(init_crs)
     else:
         return ret_gdf
+
+
+def _query_areas(geometry, areas, predicate):
+    """Find the first area each geometry satisfies the predicate with.
+
+    The spatial index is built on the areas (usually much smaller than the source) and
+    queried with all geometries at once.
+
+    Parameters
+    ----------
+    geometry : GeoSeries or GeometryArray
+        Geometries that are queried against the areas.
+
+    areas : GeoDataFrame or GeoSeries
+        Areas to build the spatial index on.
+
+    predicate : str
+        Binary predicate evaluated as ``predicate(geometry, area)``.
+
+    Returns
+    -------
+    source_pos, area_pos : np.array
+        Sorted positions of the matching geometries, and the position of the first area they matched.
+    """
+    source_pos, area_pos = areas.sindex.query(geometry, predicate=predicate)
+    # keep only first area per geometry
+    order = np.lexsort((area_pos, source_pos))
+    source_pos, area_pos = source_pos[order], area_pos[order]
+    source_pos, first = np.unique(source_pos, return_index=True)
+    return source_pos, area_pos[first]
+
+
+def tag_zones(source, zones, method="start", re_project=False, chunksize=100_000, n_jobs=1):
+    """
+    Tag every feature with the zone it lies in (point-in-polygon).
+
+    Unlike :func:`spatial_filter` no rows are dropped and no copy of 'source' is made,
+    only a Series with the zone of every feature is returned.
+
+    Parameters
+    ----------
+    source : GeoDataFrame
+        The features to tag, e.g. positionfixes, staypoints, triplegs or locations.
+
+    zones : GeoDataFrame or GeoSeries
+        The (multi)polygons the features are tagged with. The index of 'zones' is used as zone id.
+
+    method : {'start', 'end', 'majority'}, default 'start'
+        Which points of a feature are used for tagging. Only has an effect on features with more than one
+        vertex, e.g., triplegs; point features are tagged with the zone they lie in.
+
+        - `start`: use the first vertex of the feature.
+        - `end`: use the last vertex of the feature.
+        - `majority`: use the zone that contains most of the vertices of the feature. Vertices outside of all zones
+          are counted as well, thus features that lie mostly outside of the zones are not tagged. Ties are resolved
+          in favor of a zone over outside of all zones, and between zones in favor of the first zone.
+
+    re_project : bool, default False
+        If this is set to True, the geometries of 'source' will be projected to the coordinate reference
+        system of 'zones'.
+
+    chunksize : int, default 100000
+        Number of features processed at once. Bounds the memory used by the intermediate results.
+
+    n_jobs : int, default 1
+        The maximum number of chunks processed concurrently. If -1 all CPUs are used.
+        The chunks are processed in threads that share the spatial index of the zones.
+
+    Returns
+    -------
+    pd.Series
+        The zone id of every feature in 'source' (same index), missing if the feature lies outside of all zones.
+
+    Notes
+    -----
+    The zones are stored in a STRtree of prepared geometries. Points on the boundary of a zone belong to the zone.
+    If a point lies in several zones, the first zone (in order of 'zones') is used.
+
+    Examples
+    --------
+    >>> sp["municipality_id"] = sp.tag_zones(municipalities)
+    >>> tpls["end_zone"] = tpls.tag_zones(zones, method="end", n_jobs=-1)
+    """
+    if method not in ["start", "end", "majority"]:
+        raise ValueError(f"method unknown. We only support ['start', 'end', 'majority']. You passed {method}")
+
+    geometry = source.geometry
+    if re_project:
+        geometry = geometry.to_crs(zones.crs)
+    geometry = np.asarray(geometry.values)
+    zone_geoms = np.asarray(zones.geometry.values).copy()
+    shapely.prepare(zone_geoms)
+    tree = shapely.STRtree(zone_geoms)
+
+    chunks = range(0, len(geometry), chunksize)
+    zone_pos = Parallel(n_jobs=n_jobs, prefer="threads")(
+        delayed(_tag_chunk)(geometry[i : i + chunksize], tree, zone_geoms, method) for i in chunks
+    )
+    zone_pos = np.concatenate(zone_pos) if len(zone_pos) else np.array([], dtype=int)
+
+    zone_ids = zones.index
+    if pd.api.types.is_integer_dtype(zone_ids.dtype):
+        zone_ids = zone_ids.astype("Int64")
+    zone_ids = zone_ids.array.take(zone_pos, allow_fill=True)
+    return pd.Series(zone_ids, index=source.index, name=zones.index.name)
+
+
+def _tag_chunk(geometry, tree, zone_geoms, method):
+    """Return the position of the zone of every geometry (-1 if in no zone)."""
+    coords, geom_pos = shapely.get_coordinates(geometry, return_index=True)
+    if method == "start":
+        _, first = np.unique(geom_pos, return_index=True)
+        coords, geom_pos = coords[first], geom_pos[first]
+    elif method == "end":
+        _, last = np.unique(geom_pos[::-1], return_index=True)
+        last = len(geom_pos) - 1 - last
+        coords, geom_pos = coords[last], geom_pos[last]
+
+    vertex_zone = _locate_coordinates(coords, tree, zone_geoms)
+    zone_pos = np.full(len(geometry), -1)
+    if method != "majority":
+        zone_pos[geom_pos] = vertex_zone
+        return zone_pos
+
+    # count vertices per (geometry, zone) pair, vertices outside of all zones have zone -1
+    n = len(zone_geoms) + 1
+    pairs, counts = np.unique(geom_pos * n + vertex_zone + 1, return_counts=True)
+    geom_pos, vertex_zone = pairs // n, pairs % n - 1
+    # most vertices first, ties are resolved in favor of a zone (the first one) over outside of all zones
+    order = np.lexsort((vertex_zone == -1, -counts, geom_pos))
+    geom_pos, vertex_zone = geom_pos[order], vertex_zone[order]
+    geom_pos, first = np.unique(geom_pos, return_index=True)
+    zone_pos[geom_pos] = vertex_zone[first]
+    return zone_pos
+
+
+def _locate_coordinates(coords, tree, zone_geoms):
+    """Return the position of the first zone that contains the coordinate (-1 if in no zone)."""
+    # the tree only checks the bounding boxes, the exact test runs on the prepared zones
+    coord_pos, zone_pos = tree.query(shapely.points(coords))
+    inside = shapely.intersects_xy(zone_geoms[zone_pos], coords[coord_pos, 0], coords[coord_pos, 1])
+    coord_pos, zone_pos = coord_pos[inside], zone_pos[inside]
+
+    order = np.lexsort((zone_pos, coord_pos))
+    coord_pos, zone_pos = coord_pos[order], zone_pos[order]
+    coord_pos, first = np.unique(coord_pos, return_index=True)
+    res = np.full(len(coords), -1)
+    res[coord_pos] = zone_pos[first]
+    return res
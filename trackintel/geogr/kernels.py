@@ -0,0 +1,176 @@
+import math
+
+import numpy as np
+
+EARTH_RADIUS = 6371000
+
+
+def haversine(lon_1, lat_1, lon_2, lat_2, r=EARTH_RADIUS, out=None, dtype=np.float64):
+    """
+    Haversine distance kernel for arrays of WGS84 coordinates.
+
+    Uses the numerically stable haversine formulation
+    ``2r * arcsin(sqrt(sin²(Δlat/2) + cos(lat_1)cos(lat_2)sin²(Δlon/2)))``
+    instead of the spherical law of cosines, which loses precision for short distances.
+    All intermediate results are computed in-place in at most two scratch buffers.
+
+    Parameters
+    ----------
+    lon_1, lat_1, lon_2, lat_2 : float or array_like
+        Coordinates in degrees, must be broadcastable against each other.
+
+    r : float, default 6371000
+        Radius of the reference sphere in meters.
+
+    out : np.ndarray, optional
+        Buffer the result is written to. Must have the broadcasted shape of the input and dtype `dtype`.
+
+    dtype : {np.float64, np.float32}, default np.float64
+        Precision of the calculation. float32 halves the memory traffic of bulk calculations
+        at the cost of accuracy, as float32 resolves WGS84 coordinates only to about one meter.
+
+    Returns
+    -------
+    np.ndarray
+        Distances in meters.
+    """
+    dtype = np.dtype(dtype).type
+    lon_1, lat_1, lon_2, lat_2 = (np.asarray(v, dtype=dtype).ravel() for v in (lon_1, lat_1, lon_2, lat_2))
+    shape = np.broadcast_shapes(lon_1.shape, lat_1.shape, lon_2.shape, lat_2.shape)
+    if out is None:
+        out = np.empty(shape, dtype=dtype)
+    tmp = np.empty(shape, dtype=dtype)
+    half_rad = dtype(np.pi / 360)
+
+    # sin²(Δlon / 2) * cos(lat_1) * cos(lat_2)
+    np.subtract(lon_2, lon_1, out=out)
+    np.multiply(out, half_rad, out=out)
+    np.sin(out, out=out)
+    np.square(out, out=out)
+    np.multiply(lat_1, 2 * half_rad, out=tmp)
+    np.cos(tmp, out=tmp)
+    np.multiply(out, tmp, out=out)
+    np.multiply(lat_2, 2 * half_rad, out=tmp)
+    np.cos(tmp, out=tmp)
+    np.multiply(out, tmp, out=out)
+
+    # + sin²(Δlat / 2)
+    np.subtract(lat_2, lat_1, out=tmp)
+    np.multiply(tmp, half_rad, out=tmp)
+    np.sin(tmp, out=tmp)
+    np.square(tmp, out=tmp)
+    np.add(out, tmp, out=out)
+
+    # rounding errors can push antipodal points slightly above 1
+    np.minimum(out, 1, out=out)
+    np.sqrt(out, out=out)
+    np.arcsin(out, out=out)
+    np.multiply(out, dtype(2 * r), out=out)
+    return out
+
+
+def haversine_scalar(lon_1, lat_1, lon_2, lat_2, r=EARTH_RADIUS):
+    """
+    Haversine distance kernel for a single pair of WGS84 coordinates.
+
+    Same formulation as :func:`haversine` but uses the math module, which is considerably faster for python floats.
+
+    Parameters
+    ----------
+    lon_1, lat_1, lon_2, lat_2 : float
+        Coordinates in degrees.
+
+    r : float, default 6371000
+        Radius of the reference sphere in meters.
+
+    Returns
+    -------
+    float
+        Distance in meters.
+    """
+    lat_1 = math.radians(lat_1)
+    lat_2 = math.radians(lat_2)
+    sin_lat_d = math.sin((lat_2 - lat_1) / 2)
+    sin_lon_d = math.sin(math.radians(lon_2 - lon_1) / 2)
+    a = sin_lat_d * sin_lat_d + math.cos(lat_1) * math.cos(lat_2) * sin_lon_d * sin_lon_d
+    return 2 * r * math.asin(math.sqrt(min(a, 1.0)))
+
+
+def equirectangular(lon_1, lat_1, lon_2, lat_2, r=EARTH_RADIUS, out=None, dtype=np.float64):
+    """
+    Equirectangular approximation of the distance between arrays of WGS84 coordinates.
+
+    Projects the coordinate differences onto a plane at the mean latitude of each pair, which only requires
+    a single trigonometric function. The relative error is below 0.1% for distances up to a few kilometers
+    (away from the poles), this makes it well suited for comparisons against sub-kilometer thresholds.
+
+    Parameters
+    ----------
+    lon_1, lat_1, lon_2, lat_2 : float or array_like
+        Coordinates in degrees, must be broadcastable against each other.
+
+    r : float, default 6371000
+        Radius of the reference sphere in meters.
+
+    out : np.ndarray, optional
+        Buffer the result is written to. Must have the broadcasted shape of the input and dtype `dtype`.
+
+    dtype : {np.float64, np.float32}, default np.float64
+        Precision of the calculation.
+
+    Returns
+    -------
+    np.ndarray
+        Approximated distances in meters.
+    """
+    dtype = np.dtype(dtype).type
+    lon_1, lat_1, lon_2, lat_2 = (np.asarray(v, dtype=dtype).ravel() for v in (lon_1, lat_1, lon_2, lat_2))
+    shape = np.broadcast_shapes(lon_1.shape, lat_1.shape, lon_2.shape, lat_2.shape)
+    if out is None:
+        out = np.empty(shape, dtype=dtype)
+    tmp = np.empty(shape, dtype=dtype)
+    rad = dtype(np.pi / 180)
+
+    # x = Δlon * cos(mean latitude)
+    np.add(lat_1, lat_2, out=tmp)
+    np.multiply(tmp, rad / 2, out=tmp)
+    np.cos(tmp, out=tmp)
+    np.subtract(lon_2, lon_1, out=out)
+    # take shorter way around the antimeridian
+    np.add(out, 180, out=out)
+    np.mod(out, 360, out=out)
+    np.subtract(out, 180, out=out)
+    np.multiply(out, tmp, out=out)
+    np.square(out, out=out)
+
+    # y = Δlat
+    np.subtract(lat_2, lat_1, out=tmp)
+    np.square(tmp, out=tmp)
+    np.add(out, tmp, out=out)
+    np.sqrt(out, out=out)
+    np.multiply(out, rad * dtype(r), out=out)
+    return out
+
+
+def equirectangular_scalar(lon_1, lat_1, lon_2, lat_2, r=EARTH_RADIUS):
+    """
+    Equirectangular approximation of the distance between a single pair of WGS84 coordinates.
+
+    See :func:`equirectangular` for details.
+
+    Parameters
+    ----------
+    lon_1, lat_1, lon_2, lat_2 : float
+        Coordinates in degrees.
+
+    r : float, default 6371000
+        Radius of the reference sphere in meters.
+
+    Returns
+    -------
+    float
+        Approximated distance in meters.
+    """
+    x = ((lon_2 - lon_1 + 180) % 360 - 180) * math.cos(math.radians(lat_1 + lat_2) / 2)
+    y = lat_2 - lat_1
+    return r * math.radians(math.sqrt(x * x + y * y))
@@ -3,36 +3,52 @@ from .file import write_positionfixes_csv
 from .postgis import read_positionfixes_postgis
 from .postgis import write_positionfixes_postgis
 from .from_geopandas import read_positionfixes_gpd
+from .parquet import read_positionfixes_parquet
+from .parquet import write_positionfixes_parquet
 
 from .file import read_triplegs_csv
 from .file import write_triplegs_csv
 from .postgis import read_triplegs_postgis
 from .postgis import write_triplegs_postgis
 from .from_geopandas import read_triplegs_gpd
+from .parquet import read_triplegs_parquet
+from .parquet import write_triplegs_parquet
 
 from .file import read_staypoints_csv
 from .file import write_staypoints_csv
 from .postgis import read_staypoints_postgis
 from .postgis import write_staypoints_postgis
 from .from_geopandas import read_staypoints_gpd
+from .parquet import read_staypoints_parquet
+from .parquet import write_staypoints_parquet
 
 from .file import read_locations_csv
 from .file import write_locations_csv
 from .postgis import read_locations_postgis
 from .postgis import write_locations_postgis
 from .from_geopandas import read_locations_gpd
+from .parquet import read_locations_parquet
+from .parquet import write_locations_parquet
 
 from .file import read_trips_csv
 from .file import write_trips_csv
 from .postgis import read_trips_postgis
 from .postgis import write_trips_postgis
 from .from_geopandas import read_trips_gpd
+from .parquet import read_trips_parquet
+from .parquet import write_trips_parquet
 
 from .file import read_tours_csv
 from .file import write_tours_csv
 from .postgis import read_tours_postgis
 from .postgis import write_tours_postgis
 from .from_geopandas import read_tours_gpd
+from .parquet import read_tours_parquet
+from .parquet import write_tours_parquet
+
+from .postgis import set_engine_options
+
+from .dataset import TrackintelDataset
 
 from .dataset_reader import read_geolife
 from .dataset_reader import read_mzmv
@@ -46,36 +62,52 @@ __all__ = [
     "read_positionfixes_postgis",
     "write_positionfixes_postgis",
     "read_positionfixes_gpd",
+    "read_positionfixes_parquet",
+    "write_positionfixes_parquet",
     # triplegs
     "read_triplegs_csv",
     "write_triplegs_csv",
     "read_triplegs_postgis",
     "write_triplegs_postgis",
     "read_triplegs_gpd",
+    "read_triplegs_parquet",
+    "write_triplegs_parquet",
     # staypoints
     "read_staypoints_csv",
     "write_staypoints_csv",
     "read_staypoints_postgis",
     "write_staypoints_postgis",
     "read_staypoints_gpd",
+    "read_staypoints_parquet",
+    "write_staypoints_parquet",
     # locations
     "read_locations_csv",
     "write_locations_csv",
     "read_locations_postgis",
     "write_locations_postgis",
     "read_locations_gpd",
+    "read_locations_parquet",
+    "write_locations_parquet",
     # trips
     "read_trips_csv",
     "write_trips_csv",
     "read_trips_postgis",
     "write_trips_postgis",
     "read_trips_gpd",
+    "read_trips_parquet",
+    "write_trips_parquet",
     # tours
     "read_tours_csv",
     "write_tours_csv",
     "read_tours_postgis",
     "write_tours_postgis",
     "read_tours_gpd",
+    "read_tours_parquet",
+    "write_tours_parquet",
+    # postgis
+    "set_engine_options",
+    # dataset
+    "TrackintelDataset",
     # rest
     "read_geolife",
     "read_mzmv",
@@ -0,0 +1,526 @@
+import json
+import os
+import uuid
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+
+import trackintel as ti
+from trackintel import Locations, Positionfixes, Staypoints, Tours, Triplegs, TripsDataFrame
+from trackintel.io.parquet import (
+    _TIME_COLUMN,
+    read_locations_parquet,
+    read_positionfixes_parquet,
+    read_staypoints_parquet,
+    read_tours_parquet,
+    read_triplegs_parquet,
+    read_trips_parquet,
+    write_locations_parquet,
+    write_positionfixes_parquet,
+    write_staypoints_parquet,
+    write_tours_parquet,
+    write_triplegs_parquet,
+    write_trips_parquet,
+)
+
+# name of the file that stores the settings of the dataset
+_METADATA_FILE = "_trackintel_dataset.json"
+
+_MODELS = {
+    "positionfixes": (Positionfixes, read_positionfixes_parquet, write_positionfixes_parquet),
+    "staypoints": (Staypoints, read_staypoints_parquet, write_staypoints_parquet),
+    "triplegs": (Triplegs, read_triplegs_parquet, write_triplegs_parquet),
+    "locations": (Locations, read_locations_parquet, write_locations_parquet),
+    "trips": (TripsDataFrame, read_trips_parquet, write_trips_parquet),
+    "tours": (Tours, read_tours_parquet, write_tours_parquet),
+}
+
+# columns that reference the ids of a model
+_ID_COLUMNS = {
+    "staypoints": ["staypoint_id"],
+    "triplegs": ["tripleg_id"],
+    "locations": ["location_id"],
+    "trips": ["trip_id", "prev_trip_id", "next_trip_id"],
+    "tours": ["tour_id"],
+}
+
+# ids created in a partition are shifted by the number of the partition times this offset
+_ID_OFFSET = 2**32
+_MAX_BUCKETS = 2**14
+
+
+class TrackintelDataset:
+    """
+    A directory of trackintel models stored as parquet files, partitioned by user bucket and month.
+
+    The layout follows the hive convention::
+
+        path/
+            _trackintel_dataset.json
+            positionfixes/
+                user_bucket=0/
+                    month=2023-01/
+                        part-<uuid>.parquet
+            staypoints/
+            ...
+
+    Every user is assigned to one of 'n_buckets' buckets (by the hash of the user id), the month is taken from
+    the time column of the model ('tracked_at' or 'started_at', in UTC). Locations are only partitioned by bucket.
+    The partitions are independent units that can be read and processed one at a time and in parallel.
+
+    Use :meth:`TrackintelDataset.open` to create or open a dataset.
+
+    Parameters
+    ----------
+    path : str or path-like
+        Root directory of the dataset.
+
+    n_buckets : int
+        Number of user buckets.
+
+    Examples
+    --------
+    >>> ds = TrackintelDataset.open("archive", n_buckets=64)
+    >>> ds.write_partitioned(pfs)
+    >>> ds.map_partitions(ti.preprocessing.generate_staypoints, ["positionfixes"], ["positionfixes", "staypoints"])
+    >>> for (user_bucket, month), sp in ds.iter_partitions("staypoints"):
+    ...     print(user_bucket, month, len(sp))
+    """
+
+    def __init__(self, path, n_buckets):
+        if not 0 < n_buckets <= _MAX_BUCKETS:
+            raise ValueError(f"n_buckets must be between 1 and {_MAX_BUCKETS}, but it is {n_buckets}.")
+        self.path = os.fspath(path)
+        self.n_buckets = n_buckets
+
+    def __repr__(self):
+        return f"TrackintelDataset(path={self.path!r}, n_buckets={self.n_buckets})"
+
+    @classmethod
+    def open(cls, path, n_buckets=None):
+        """
+        Open the dataset at 'path', the dataset is created if it does not exist.
+
+        Parameters
+        ----------
+        path : str or path-like
+            Root directory of the dataset.
+
+        n_buckets : int, optional
+            Number of user buckets. Only needed to create a dataset (default 16), for existing datasets it must
+            match the stored number.
+
+        Returns
+        -------
+        TrackintelDataset
+
+        Examples
+        --------
+        >>> ds = TrackintelDataset.open("archive")
+        """
+        metadata_file = os.path.join(path, _METADATA_FILE)
+        if os.path.exists(metadata_file):
+            with open(metadata_file) as f:
+                metadata = json.load(f)
+            if n_buckets is not None and n_buckets != metadata["n_buckets"]:
+                raise ValueError(
+                    f"The dataset at {path} has {metadata['n_buckets']} buckets, but n_buckets={n_buckets} was passed."
+                )
+            return cls(path, metadata["n_buckets"])
+
+        dataset = cls(path, 16 if n_buckets is None else n_buckets)
+        os.makedirs(path, exist_ok=True)
+        with open(metadata_file, "w") as f:
+            json.dump({"n_buckets": dataset.n_buckets, "version": ti.__version__}, f)
+        return dataset
+
+    @property
+    def models(self):
+        """List of the models stored in the dataset."""
+        return [m for m in _MODELS if os.path.isdir(os.path.join(self.path, m))]
+
+    def partitions(self, model, user_ids=None, start=None, end=None):
+        """
+        List the partitions of a model.
+
+        Parameters
+        ----------
+        model : str
+            Name of the model, e.g., 'positionfixes'.
+
+        user_ids : list-like, optional
+            Only list the partitions that can contain these users.
+
+        start, end : datetime-like, optional
+            Only list the partitions that can contain data in [start, end).
+
+        Returns
+        -------
+        list of tuple
+            Sorted (user_bucket, month) of the partitions, month is None for locations.
+        """
+        _check_model(model)
+        model_dir = os.path.join(self.path, model)
+        if not os.path.isdir(model_dir):
+            return []
+        buckets = None if user_ids is None else set(_user_bucket(list(user_ids), self.n_buckets).tolist())
+        start_month = None if start is None else _month([_utc_bound(start, -1)])[0]
+        # end is exclusive
+        end_month = None if end is None else _month([_utc_bound(end, 1) - pd.Timedelta(1)])[0]
+
+        keys = []
+        for bucket_dir in os.listdir(model_dir):
+            bucket = _parse_hive(bucket_dir, "user_bucket")
+            if bucket is None or (buckets is not None and int(bucket) not in buckets):
+                continue
+            bucket = int(bucket)
+            if _TIME_COLUMN[model] is None:
+                keys.append((bucket, None))
+                continue
+            for month_dir in os.listdir(os.path.join(model_dir, bucket_dir)):
+                month = _parse_hive(month_dir, "month")
+                if month is None:
+                    continue
+                if (start_month is not None and month < start_month) or (end_month is not None and month > end_month):
+                    continue
+                keys.append((bucket, month))
+        return sorted(keys)
+
+    def write_partitioned(self, data, model=None, row_group_size=100_000):
+        """
+        Write trackintel data into the partitions of the dataset.
+
+        The data is split by user bucket and month and appended as new file to every partition it touches.
+        Thus, large data can be written in chunks.
+
+        Parameters
+        ----------
+        data : Positionfixes, Staypoints, Triplegs, Locations, Trips or Tours
+            The data to write.
+
+        model : str, optional
+            Name of the model, by default inferred from the type of 'data'.
+
+        row_group_size : int, default 100000
+            Maximum number of rows per row group.
+
+        Examples
+        --------
+        >>> ds.write_partitioned(pfs)
+        """
+        model = _model_name(data) if model is None else model
+        _check_model(model)
+        for key, part in self._split(data, model):
+            self._write_partition(part, model, key, row_group_size)
+
+    def read_partition(self, model, key, columns=None, user_ids=None, start=None, end=None):
+        """
+        Read a single partition of a model.
+
+        Parameters
+        ----------
+        model : str
+            Name of the model, e.g., 'positionfixes'.
+
+        key : tuple
+            (user_bucket, month) of the partition. If month is None all months of the bucket are read.
+
+        columns, user_ids, start, end : optional
+            Passed to the parquet reader of the model, see :func:`trackintel.io.read_positionfixes_parquet`.
+
+        Returns
+        -------
+        Positionfixes, Staypoints, Triplegs, Locations, Trips or Tours
+            The data of the partition, None if the partition is empty.
+        """
+        _check_model(model)
+        reader = _MODELS[model][1]
+        filter_kwargs = {"columns": columns, "user_ids": user_ids}
+        if _TIME_COLUMN[model] is not None:
+            filter_kwargs.update(start=start, end=end)
+
+        parts = [reader(file, **filter_kwargs) for file in self._files(model, key)]
+        parts = [p for p in parts if not p.empty]
+        if not parts:
+            return None
+        if len(parts) == 1:
+            return parts[0]
+        return pd.concat(parts)
+
+    def iter_partitions(self, model, by="partition", columns=None, user_ids=None, start=None, end=None):
+        """
+        Iterate over the partitions of a model, only one partition is kept in memory at a time.
+
+        Parameters
+        ----------
+        model : str
+            Name of the model, e.g., 'positionfixes'.
+
+        by : {'partition', 'user_bucket'}, default 'partition'
+            Yield every (user_bucket, month) partition or all months of a user bucket at once.
+
+        columns, user_ids, start, end : optional
+            Passed to the parquet reader of the model, see :func:`trackintel.io.read_positionfixes_parquet`.
+            Partitions that cannot contain the users or time window are skipped without reading.
+
+        Yields
+        ------
+        key : tuple
+            (user_bucket, month) of the partition, month is None if 'by' is 'user_bucket'.
+
+        data : Positionfixes, Staypoints, Triplegs, Locations, Trips or Tours
+            The data of the partition.
+
+        Examples
+        --------
+        >>> for (user_bucket, month), pfs in ds.iter_partitions("positionfixes", columns=[]):
+        ...     print(user_bucket, month, len(pfs))
+        """
+        for key in self._units([model], by, user_ids, start, end):
+            data = self.read_partition(model, key, columns, user_ids, start, end)
+            if data is not None:
+                yield key, data
+
+    def map_partitions(self, func, inputs, outputs, by="user_bucket", n_jobs=1, **kwargs):
+        """
+        Apply a function to every partition and write the results back into the dataset.
+
+        For every unit (see 'by') the input models are read and passed to 'func', the returned models are written
+        into the same unit, replacing the old data of the output models. The units are independent of each other
+        and can be processed in parallel.
+
+        Ids of models that are created by 'func' (i.e., outputs that are no inputs) are made unique over the
+        dataset by shifting them by the number of the unit times 2^32. The columns that reference them
+        (e.g., 'staypoint_id' of positionfixes) are shifted accordingly.
+
+        Parameters
+        ----------
+        func : callable
+            Called as ``func(*inputs, **kwargs)`` and returns one model per output,
+            e.g., :func:`trackintel.preprocessing.generate_staypoints`.
+
+        inputs : list of str
+            Names of the input models, in the order expected by 'func'.
+
+        outputs : list of str
+            Names of the output models, in the order returned by 'func'.
+
+        by : {'user_bucket', 'partition'}, default 'user_bucket'
+            Process all months of a user bucket at once, or every (user_bucket, month) partition on its own.
+            With 'partition', the data is cut at the month boundaries, e.g., a staypoint over midnight at the end of
+            a month is split in two.
+
+        n_jobs : int, default 1
+            The maximum number of concurrently processed units. If -1 all CPUs are used. Units are processed
+            in separate processes, 'func' must be picklable.
+
+        kwargs
+            Additional keyword arguments passed to 'func'.
+
+        Examples
+        --------
+        >>> ds.map_partitions(
+        ...     ti.preprocessing.generate_staypoints,
+        ...     inputs=["positionfixes"],
+        ...     outputs=["positionfixes", "staypoints"],
+        ...     n_jobs=-1,
+        ...     dist_threshold=100,
+        ... )
+        >>> ds.map_partitions(
+        ...     ti.preprocessing.generate_triplegs, ["positionfixes", "staypoints"], ["positionfixes", "triplegs"]
+        ... )
+        >>> def generate_trips(sp, tpls, **kwargs):
+        ...     return ti.preprocessing.generate_trips(sp.create_activity_flag(), tpls, **kwargs)
+        >>> ds.map_partitions(generate_trips, ["staypoints", "triplegs"], ["staypoints", "triplegs", "trips"])
+        """
+        if by not in ["user_bucket", "partition"]:
+            raise ValueError(f"by unknown. We only support ['user_bucket', 'partition']. You passed {by}")
+        for model in [*inputs, *outputs]:
+            _check_model(model)
+        units = self._units(inputs, by)
+        Parallel(n_jobs=n_jobs)(delayed(self._map_unit)(func, inputs, outputs, key, **kwargs) for key in units)
+
+    def _map_unit(self, func, inputs, outputs, key, **kwargs):
+        """Apply func to one unit and replace the outputs of the unit."""
+        old_files = {model: self._files(model, key) for model in outputs}
+        data = [self.read_partition(model, key) for model in inputs]
+        data = [self._empty(model) if d is None else d for model, d in zip(inputs, data)]
+
+        result = func(*data, **kwargs)
+        if not isinstance(result, tuple):
+            result = (result,)
+        if len(result) != len(outputs):
+            raise ValueError(f"func returned {len(result)} objects, but {len(outputs)} outputs are expected.")
+
+        offset = self._unit_number(key) * _ID_OFFSET
+        created = [model for model in outputs if model not in inputs]
+        result = [_shift_ids(r, created, offset, own=model in created) for model, r in zip(outputs, result)]
+
+        # write new files before deleting the old ones, such that no data is lost if writing fails
+        for model, r in zip(outputs, result):
+            if key[1] is None or _TIME_COLUMN[model] is None:
+                parts = self._split(r, model)
+            else:
+                parts = [] if r.empty else [(key, r)]
+            for part_key, part in parts:
+                self._write_partition(part, model, part_key)
+        for files in old_files.values():
+            for file in files:
+                os.remove(file)
+
+    def _unit_number(self, key):
+        """Number of a unit, that is unique within the dataset."""
+        bucket, month = key
+        if month is None:
+            return bucket
+        year, month = map(int, month.split("-"))
+        return (bucket + 1) * 2**16 + (year - 1970) * 12 + month - 1
+
+    def _units(self, models, by, user_ids=None, start=None, end=None):
+        """Union of the units of all models."""
+        keys = set()
+        for model in models:
+            for bucket, month in self.partitions(model, user_ids, start, end):
+                keys.add((bucket, month if by == "partition" else None))
+        return sorted(keys, key=lambda k: (k[0], k[1] or ""))
+
+    def _files(self, model, key):
+        """All parquet files of a partition (of all months of the bucket if month is None)."""
+        bucket, month = key
+        bucket_dir = os.path.join(self.path, model, f"user_bucket={bucket}")
+        if not os.path.isdir(bucket_dir):
+            return []
+        if _TIME_COLUMN[model] is None:
+            dirs = [bucket_dir]
+        elif month is None:
+            dirs = sorted(os.path.join(bucket_dir, d) for d in os.listdir(bucket_dir) if _parse_hive(d, "month"))
+        else:
+            dirs = [os.path.join(bucket_dir, f"month={month}")]
+        files = []
+        for d in dirs:
+            if os.path.isdir(d):
+                files.extend(sorted(os.path.join(d, f) for f in os.listdir(d) if f.endswith(".parquet")))
+        return files
+
+    def _split(self, data, model):
+        """Split data into the (user_bucket, month) partitions."""
+        if data.empty:
+            return []
+        group_keys = [_user_bucket(data["user_id"], self.n_buckets)]
+        if _TIME_COLUMN[model] is not None:
+            group_keys.append(_month(data[_TIME_COLUMN[model]]))
+        else:
+            group_keys.append(np.full(len(data), None))
+        return [(key, part) for key, part in data.groupby(group_keys, sort=True, dropna=False)]
+
+    def _write_partition(self, data, model, key, row_group_size=100_000):
+        """Write data as new file into a partition."""
+        bucket, month = key
+        directory = os.path.join(self.path, model, f"user_bucket={bucket}")
+        if _TIME_COLUMN[model] is not None:
+            directory = os.path.join(directory, f"month={month}")
+        os.makedirs(directory, exist_ok=True)
+        writer = _MODELS[model][2]
+        writer(data, os.path.join(directory, f"part-{uuid.uuid4().hex}.parquet"), row_group_size=row_group_size)
+
+    def _empty(self, model):
+        """Empty instance of a model with the schema of the stored data."""
+        import pyarrow.parquet as pq
+
+        keys = self.partitions(model)
+        files = self._files(model, keys[0]) if keys else []
+        if not files:
+            raise ValueError(f"The dataset contains no {model}.")
+        schema = pq.read_schema(files[0])
+        data = schema.empty_table().to_pandas()
+        if b"geo" in schema.metadata:
+            # geometries are stored as WKB, see the GeoParquet specification
+            geo = json.loads(schema.metadata[b"geo"])
+            for col, meta in geo["columns"].items():
+                data[col] = gpd.GeoSeries.from_wkb(data[col], crs=meta.get("crs"))
+            data = gpd.GeoDataFrame(data, geometry=geo["primary_column"])
+        model_class = ti.Trips if model == "trips" else _MODELS[model][0]
+        return model_class(data, validate=False)
+
+
+def _check_model(model):
+    if model not in _MODELS:
+        raise ValueError(f"model unknown. We only support {list(_MODELS)}. You passed {model}")
+
+
+def _model_name(data):
+    """Name of the trackintel model of data."""
+    for model, (model_class, _, _) in _MODELS.items():
+        if isinstance(data, model_class):
+            return model
+    raise ValueError(f"Cannot infer the model of {type(data).__name__}, please pass 'model'.")
+
+
+def _user_bucket(user_id, n_buckets):
+    """
+    Bucket of every user, by the (stable) hash of the user id.
+
+    Integral ids are hashed as int64 and all other ids as str, such that the bucket of a user doesn't depend on
+    the dtype of the user ids (e.g., int64, Int64, float64 or object).
+    """
+    ids = pd.Series(user_id).reset_index(drop=True)
+    if isinstance(ids.dtype, pd.CategoricalDtype):
+        ids = pd.Series(ids.to_numpy())
+    ids = ids.infer_objects()
+
+    integral = np.zeros(len(ids), dtype=bool)
+    if pd.api.types.is_numeric_dtype(ids.dtype) and not pd.api.types.is_bool_dtype(ids.dtype):
+        values = ids.to_numpy(dtype=np.float64, na_value=np.nan)
+        integral = np.isfinite(values) & (values == np.round(values))
+        if pd.api.types.is_integer_dtype(ids.dtype):
+            # keep the precision of large integers
+            int_ids = ids[integral].to_numpy(dtype=np.int64)
+        else:
+            int_ids = values[integral].astype(np.int64)
+
+    hashed = np.empty(len(ids), dtype=np.uint64)
+    if integral.any():
+        hashed[integral] = pd.util.hash_array(int_ids)
+    if not integral.all():
+        other = ids[~integral].astype(object)
+        other[other.isna()] = "nan"
+        hashed[~integral] = pd.util.hash_array(other.astype(str).to_numpy(dtype=object))
+    return (hashed % np.uint64(n_buckets)).astype(np.int64)
+
+
+def _month(time):
+    """Month ('YYYY-MM', in UTC) of every timestamp."""
+    time = pd.Series(time)
+    if isinstance(time.dtype, pd.DatetimeTZDtype):
+        time = time.dt.tz_convert(None)
+    return np.datetime_as_string(time.to_numpy().astype("datetime64[M]"), unit="M")
+
+
+def _utc_bound(value, direction):
+    """Convert value to a UTC timestamp, naive values are moved by 14 hours in 'direction' to cover all timezones."""
+    ts = pd.Timestamp(value)
+    if ts.tz is None:
+        return ts + direction * pd.Timedelta(hours=14)
+    return ts.tz_convert(None)
+
+
+def _parse_hive(name, key):
+    """Value of a hive partition directory 'key=value', None if it is not one."""
+    prefix = f"{key}="
+    if not name.startswith(prefix):
+        return None
+    return name[len(prefix) :]
+
+
+def _shift_ids(data, created, offset, own):
+    """Shift the ids of created models (the index if 'own') and the columns referencing them."""
+    data = data.copy()
+    if own and len(data):
+        data.index = data.index + offset
+    for model in created:
+        for col in _ID_COLUMNS.get(model, []):
+            if col in data.columns:
+                data[col] = data[col].astype("Int64") + offset
+    return data
@@ -8,10 +8,9 @@ import geopandas as gpd
 import numpy as np
 import pandas as pd
 from shapely.geometry import LineString
-from sklearn.neighbors import NearestNeighbors
 from tqdm import tqdm
 
-from trackintel.preprocessing.util import calc_temp_overlap
+from trackintel.preprocessing.util import _datetime_ns, _interval_join_pos, calc_temp_overlap_array
 from trackintel import Positionfixes, Staypoints, Triplegs
 from trackintel.io import read_positionfixes_gpd
 
@@ -215,7 +214,8 @@ def geolife_add_modes_to_triplegs(
         How much a label needs to overlap a tripleg to assign a the to this tripleg.
 
     max_triplegs : int, default 20
-        Number of neighbors that are considered in the search for matching triplegs.
+        Maximum number of triplegs a label is assigned to. If a label matches more triplegs, the triplegs closest
+        in time to the label are used.
 
     max_duration_tripleg : float, default 7 * 24 * 60 * 60 (seconds)
         Used for a primary filter. All triplegs that are further away in time than 'max_duration_tripleg' from a
@@ -231,6 +231,8 @@ def geolife_add_modes_to_triplegs(
     In the case that several labels overlap with the same tripleg the label with the highest overlap (relative to the
     tripleg) is chosen
 
+    The overlapping triplegs and labels are found with :func:`trackintel.preprocessing.util.interval_join`.
+
     Example
     ----------
     >>> from trackintel.io import read_geolife, geolife_add_modes_to_triplegs
@@ -240,130 +242,41 @@ def geolife_add_modes_to_triplegs(
     >>> tpls = geolife_add_modes_to_triplegs(tpls, mode_labels)
     """
     tpls = triplegs.copy()
-    # temp time fields for nn query
-    tpls["started_at_s"] = (tpls["started_at"] - pd.Timestamp("1970-01-01", tz="utc")) // pd.Timedelta("1s")
-    tpls["finished_at_s"] = (tpls["finished_at"] - pd.Timestamp("1970-01-01", tz="utc")) // pd.Timedelta("1s")
-    # tpls_id_mode_list is used to collect tripleg-mode matches. It will be filled with dictionaries with the
-    # following keys: [id', 'label_id', 'mode']
-    tpls_id_mode_list = list()
-
-    for user_this in labels.keys():
-        tpls_this = tpls[tpls["user_id"] == user_this]
-        labels_this = labels[user_this]
-
-        labels_this["started_at_s"] = (
-            labels_this["started_at"] - pd.Timestamp("1970-01-01", tz="utc")
-        ) // pd.Timedelta("1s")
-        labels_this["finished_at_s"] = (
-            labels_this["finished_at"] - pd.Timestamp("1970-01-01", tz="utc")
-        ) // pd.Timedelta("1s")
-
-        # fit search tree on timestamps
-        if tpls_this.shape[0] < max_triplegs:
-            max_triplegs = tpls_this.shape[0]
-        nn = NearestNeighbors(n_neighbors=max_triplegs, metric="chebyshev")
-        nn.fit(tpls_this[["started_at_s", "finished_at_s"]])
-
-        # find closest neighbours for timestamps in labels
-        distances, candidates = nn.kneighbors(labels_this[["started_at_s", "finished_at_s"]])
-
-        # filter anything above max_duration_tripleg (max distance start or end)
-        pre_filter = distances > max_duration_tripleg
-
-        candidates = pd.DataFrame(candidates, dtype="Int64")
-        candidates[pre_filter] = np.nan
-        candidates.dropna(how="all", inplace=True)
-
-        # collect the tripleg - mode matches in the
-        tpls_id_mode_list.extend(_calc_overlap_for_candidates(candidates, tpls_this, labels_this, ratio_threshold))
-
-    if len(tpls_id_mode_list) == 0:
-        tpls["mode"] = np.nan
+    labels = {user_id: labels_user[["started_at", "finished_at", "mode"]] for user_id, labels_user in labels.items()}
+    if len(labels) > 0:
+        labels = pd.concat(labels, names=["user_id", "label_id"]).reset_index(level="user_id")
     else:
-        tpls_id_mode = pd.DataFrame(tpls_id_mode_list)
-
-        # chose label with highest overlap
-        tpls_id_mode = tpls_id_mode.sort_values(by=["id", "ratio"])
-        # keep last (df sorted ascending)
-        tpls_id_mode = tpls_id_mode.drop_duplicates(subset="id", keep="last").set_index("id")
-
-        tpls = tpls.join(tpls_id_mode)
-        tpls = tpls.astype({"label_id": "Int64"})
-
-    tpls.drop(["started_at_s", "finished_at_s"], axis=1, inplace=True)
-
-    try:
-        tpls.drop(["ratio"], axis=1, inplace=True)
-    except KeyError:
-        pass
-
-    return tpls
-
-
-def _calc_overlap_for_candidates(candidates, tpls_this, labels_this, ratio_threshold):
-    """
-    Iterate all candidate triplegs and labels for a single user.
-
-    Parameters
-    ----------
-    candidates : DataFrame
-        A dataframe that has the following properties:
-        index = Reference to position in the label_this dataframe
-        columns: nb of neighbors, sorted by temporal distance
-        values: Reference to position in the tpls_this dataframe
-
-    tpls_this : Triplegs
-        triplegs of a single user
-
-    labels_this : DataFrame
-        labels of a single user
+        labels = pd.DataFrame(columns=["user_id", "started_at", "finished_at", "mode"])
 
-    ratio_threshold : float, optional
-        How much a label needs to overlap a tripleg to assign a the to this tripleg.
+    time_cols = ["started_at", "finished_at"]
+    tpls_pos, label_pos = _interval_join_pos(tpls, labels, "user_id", time_cols, time_cols)
+    tpls_start, tpls_end = (_datetime_ns(tpls[col])[tpls_pos] for col in time_cols)
+    label_start, label_end = (_datetime_ns(labels[col])[label_pos] for col in time_cols)
 
-    Returns
-    -------
-    tpls_id_mode_list : list
-        tpls_id_mode_list is used to collect tripleg-mode matches. It will be filled with dictionaries with the
-        following keys: [id', 'label_id', 'mode']
+    # overlap relative to the duration of the tripleg
+    ratio = calc_temp_overlap_array(tpls_start, tpls_end, label_start, label_end)
+    # primary filter on the temporal distance (maximum of start and end difference) between label and tripleg
+    distance = np.maximum(np.abs(tpls_start - label_start), np.abs(tpls_end - label_end))
+    keep = (ratio >= ratio_threshold) & (distance <= max_duration_tripleg * 1e9)
+    matches = pd.DataFrame({"tpls_pos": tpls_pos, "label_pos": label_pos, "ratio": ratio, "distance": distance})[keep]
 
-    Notes
-    -----
-    Candidates is a matrix with one row per label and where each column corresponds to a potential tripleg match. All
-    potential tripleg matches that are overlapped (in time) by more than ratio_threshold by a label are
-    assigned this label.
-    """
-    tpls_id_mode_list = []
-
-    # iterate all rows
-    for label_pos, row in candidates.iterrows():
-        potential_label = labels_this.iloc[label_pos, :]
-        # for every row, iterate all columns. Unused column index would indicate the nth column.
-        for _, tpls_pos in row.items():
-            # skip if tripleg was prefiltered and set to nan
-            if pd.isna(tpls_pos):
-                continue
-
-            potential_tripleg = tpls_this.iloc[tpls_pos, :]
-            ratio_this = calc_temp_overlap(
-                potential_tripleg["started_at"],
-                potential_tripleg["finished_at"],
-                potential_label["started_at"],
-                potential_label["finished_at"],
-            )
+    # a label is assigned to at most `max_triplegs` triplegs (the ones closest in time)
+    matches = matches.sort_values(["label_pos", "distance"], kind="stable")
+    matches = matches[matches.groupby("label_pos").cumcount() < max_triplegs]
 
-            if ratio_this >= ratio_threshold:
-                # assign label to tripleg (by storing matching in dictionary)
-                tpls_id_mode_list.append(
-                    {
-                        "id": potential_tripleg.name,
-                        "label_id": potential_label.name,
-                        "mode": potential_label["mode"],
-                        "ratio": ratio_this,
-                    }
-                )
-
-    return tpls_id_mode_list
+    if len(matches) == 0:
+        tpls["mode"] = np.nan
+        return tpls
+
+    # chose label with highest overlap (last label in case of ties)
+    matches = matches.sort_values(["tpls_pos", "ratio", "label_pos"], ascending=[True, False, False], kind="stable")
+    matches = matches.drop_duplicates(subset="tpls_pos")
+    label_ids = labels.index[matches["label_pos"]]
+    tpls_id_mode = pd.DataFrame(
+        {"label_id": pd.array(label_ids, dtype="Int64"), "mode": labels["mode"].to_numpy()[matches["label_pos"]]},
+        index=tpls.index[matches["tpls_pos"]],
+    )
+    return tpls.join(tpls_id_mode)
 
 
 def read_mzmv(mzmv_path):
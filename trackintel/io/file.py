@@ -1,8 +1,11 @@
 import ast
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
+import shapely
 from geopandas.geodataframe import GeoDataFrame
+from pandas.api.types import union_categoricals
 from trackintel.io.from_geopandas import (
     read_locations_gpd,
     read_positionfixes_gpd,
@@ -11,17 +14,30 @@ from trackintel.io.from_geopandas import (
     read_triplegs_gpd,
     read_trips_gpd,
 )
-from trackintel.io.util import _index_warning_default_none
+from trackintel.io.util import _detect_datetime_format, _index_warning_default_none, _parse_datetime
 from trackintel.model.util import doc, _shared_docs
 
 
 @_index_warning_default_none
-def read_positionfixes_csv(*args, columns=None, tz=None, index_col=None, geom_col="geom", crs=None, **kwargs):
+def read_positionfixes_csv(
+    *args,
+    columns=None,
+    tz=None,
+    index_col=None,
+    geom_col="geom",
+    crs=None,
+    datetime_format=None,
+    geometry_encoding=None,
+    chunksize=None,
+    align_users=False,
+    **kwargs,
+):
     """
     Read positionfixes from csv file.
 
-    Wraps the pandas read_csv function, extracts longitude and latitude and
+    Wraps the pandas read_csv function, extracts longitude and latitude (or the encoded geometry) and
     builds a POINT GeoSeries, extracts datetime from column `tracked_at`.
+    With `chunksize` the file is read in chunks, which allows reading files that don't fit into memory.
 
     Parameters
     ----------
@@ -31,11 +47,17 @@ def read_positionfixes_csv(*args, columns=None, tz=None, index_col=None, geom_co
     columns : dict, optional
         The column names to rename in the format {'old_name':'trackintel_standard_name'}.
         The required columns for this function include: "user_id", "tracked_at", "latitude"
-        and "longitude".
+        and "longitude" (or "geom" for encoded geometries).
 
     tz : str, optional
         pytz compatible timezone string. If None UTC is assumed.
 
+    datetime_format : str, optional
+        Format of the timestamps, e.g., "%Y-%m-%d %H:%M:%S" (passed to pd.to_datetime()) or "ISO8601".
+        Use "epoch" for seconds since 1970-01-01 (UTC), or "epoch_ms", "epoch_us" and "epoch_ns" for finer units.
+        If None, ISO 8601 and epoch timestamps are detected from the first rows and parsed with a fast path,
+        other formats are inferred by pandas.
+
     index_col : str, optional
         column name to be used as index. If None the default index is assumed
         as unique identifier.
@@ -48,12 +70,29 @@ def read_positionfixes_csv(*args, columns=None, tz=None, index_col=None, geom_co
         by pyproj.CRS.from_user_input(), such as an authority string
         (eg 'EPSG:4326') or a WKT string.
 
+    geometry_encoding : {'wkt', 'wkb_hex', 'xy'}, optional
+        Encoding of the geometries as written by the csv writers. If None, 'xy' is detected from the
+        "longitude" and "latitude" columns in the header, 'wkt' and 'wkb_hex' from the first value.
+
+    chunksize : int, optional
+        If set, an iterator is returned that yields Positionfixes of 'chunksize' rows. Every chunk is validated
+        on its own.
+
+    align_users : bool, default False
+        Only used with 'chunksize'. Chunks are only cut where the user changes, such that all positionfixes of a
+        user are in the same chunk. Requires the positionfixes of every user to be contiguous in the file
+        (e.g., sorted by user). The chunks are larger than 'chunksize' by the rows of the last user.
+
     kwargs
-        Additional keyword arguments passed to pd.read_csv().
+        Additional keyword arguments passed to pd.read_csv(). E.g., ``engine="pyarrow"`` for faster parsing or
+        ``dtype={"user_id": "category"}`` to reduce memory. With 'chunksize' and ``engine="pyarrow"``, the
+        streaming csv reader of pyarrow is used, which only supports the keyword arguments 'sep', 'delimiter',
+        'dtype', 'usecols' and 'encoding'.
 
     Returns
     -------
-    pfs : Positionfixes
+    pfs : Positionfixes or iterator of Positionfixes
+        An iterator if 'chunksize' is set.
 
     Notes
     -----
@@ -65,6 +104,8 @@ def read_positionfixes_csv(*args, columns=None, tz=None, index_col=None, geom_co
     Examples
     --------
     >>> trackintel.read_positionfixes_csv('data.csv')
+    >>> for pfs in trackintel.read_positionfixes_csv('data.csv', chunksize=1_000_000, align_users=True):
+    ...     pfs, sp = pfs.generate_staypoints()
     >>> trackintel.read_positionfixes_csv('data.csv', columns={'time':'tracked_at', 'User':'user_id'})
                          tracked_at  user_id                        geom
     id
@@ -75,17 +116,123 @@ def read_positionfixes_csv(*args, columns=None, tz=None, index_col=None, geom_co
     4     2008-10-23 02:53:25+00:00        0  POINT (116.31826 39.98465)
     """
     columns = {} if columns is None else columns
+    if chunksize is not None:
+        return _read_positionfixes_csv_chunks(
+            args,
+            kwargs,
+            chunksize,
+            align_users,
+            columns,
+            tz,
+            index_col,
+            geom_col,
+            crs,
+            datetime_format,
+            geometry_encoding,
+        )
 
     df = pd.read_csv(*args, index_col=index_col, **kwargs)
     df.rename(columns=columns, inplace=True)
+    return _positionfixes_from_csv(df, tz, geom_col, crs, datetime_format, geometry_encoding)
+
 
-    df["tracked_at"] = pd.to_datetime(df["tracked_at"])
-    df[geom_col] = gpd.points_from_xy(df["longitude"], df["latitude"])
-    df.drop(columns=["longitude", "latitude"], inplace=True)
+def _positionfixes_from_csv(df, tz, geom_col, crs, datetime_format, geometry_encoding):
+    """Create Positionfixes from a DataFrame with renamed columns as read from a csv."""
+    df["tracked_at"] = _parse_datetime(df["tracked_at"], datetime_format, tz, "tracked_at")
+    _decode_geometry_column(df, geom_col, geometry_encoding)
     return read_positionfixes_gpd(df, geom_col=geom_col, crs=crs, tz=tz)
 
 
-def write_positionfixes_csv(positionfixes, filename, *args, **kwargs):
+def _read_positionfixes_csv_chunks(
+    args, kwargs, chunksize, align_users, columns, tz, index_col, geom_col, crs, datetime_format, geometry_encoding
+):
+    """Generator over the Positionfixes chunks of a csv, see read_positionfixes_csv."""
+    if kwargs.get("engine") == "pyarrow":
+        chunks = _read_csv_chunks_pyarrow(*args, chunksize=chunksize, index_col=index_col, **kwargs)
+    else:
+        chunks = pd.read_csv(*args, index_col=index_col, chunksize=chunksize, **kwargs)
+
+    carry = None
+    for df in chunks:
+        df = df.rename(columns=columns)
+        if datetime_format is None:
+            # detect the format once
+            datetime_format = _detect_datetime_format(df["tracked_at"])
+        if align_users:
+            if carry is not None:
+                df = _concat_chunks(carry, df)
+            df, carry = _split_last_user(df)
+            if df.empty:
+                continue
+        yield _positionfixes_from_csv(df, tz, geom_col, crs, datetime_format, geometry_encoding)
+    if carry is not None and not carry.empty:
+        yield _positionfixes_from_csv(carry, tz, geom_col, crs, datetime_format, geometry_encoding)
+
+
+def _read_csv_chunks_pyarrow(
+    filepath, chunksize, index_col=None, sep=",", delimiter=None, dtype=None, usecols=None, encoding="utf8", **kwargs
+):
+    """Read a csv in DataFrames of 'chunksize' rows with the streaming csv reader of pyarrow."""
+    import pyarrow as pa
+    from pyarrow import csv
+
+    kwargs.pop("engine", None)
+    if kwargs:
+        raise ValueError(f"Keyword arguments {list(kwargs)} are not supported with engine='pyarrow' and chunksize.")
+    dtype = {} if dtype is None else dtype
+    # explicit types avoid that types are only inferred from the first block
+    column_types = {}
+    for col, col_dtype in dtype.items():
+        if isinstance(col_dtype, pd.CategoricalDtype) or col_dtype == "category":
+            column_types[col] = pa.dictionary(pa.int32(), pa.string())
+        elif col_dtype in (str, "str", "string", object, "object"):
+            column_types[col] = pa.string()
+        else:
+            column_types[col] = pa.from_numpy_dtype(np.dtype(col_dtype))
+    reader = csv.open_csv(
+        filepath,
+        read_options=csv.ReadOptions(encoding=encoding),
+        parse_options=csv.ParseOptions(delimiter=sep if delimiter is None else delimiter),
+        convert_options=csv.ConvertOptions(column_types=column_types, include_columns=usecols),
+    )
+
+    def to_pandas(table):
+        df = table.to_pandas()
+        return df if index_col is None else df.set_index(index_col)
+
+    batches, n_rows = [], 0
+    for batch in reader:
+        batches.append(batch)
+        n_rows += batch.num_rows
+        while n_rows >= chunksize:
+            table = pa.Table.from_batches(batches)
+            yield to_pandas(table.slice(0, chunksize))
+            rest = table.slice(chunksize)
+            batches, n_rows = rest.to_batches(), rest.num_rows
+    if n_rows > 0:
+        yield to_pandas(pa.Table.from_batches(batches))
+
+
+def _split_last_user(df):
+    """Split df before the rows of the last user (all rows are returned as second part if there is only one user)."""
+    user_id = df["user_id"].to_numpy()
+    change = np.flatnonzero(user_id[1:] != user_id[:-1])
+    if len(change) == 0:
+        return df.iloc[:0], df
+    return df.iloc[: change[-1] + 1].copy(), df.iloc[change[-1] + 1 :].copy()
+
+
+def _concat_chunks(first, second):
+    """Concatenate two chunks, categorical columns are kept categorical."""
+    for col in first.columns.intersection(second.columns):
+        if isinstance(first[col].dtype, pd.CategoricalDtype) and isinstance(second[col].dtype, pd.CategoricalDtype):
+            categories = union_categoricals([first[col], second[col]]).categories
+            first = first.assign(**{col: first[col].cat.set_categories(categories)})
+            second = second.assign(**{col: second[col].cat.set_categories(categories)})
+    return pd.concat([first, second])
+
+
+def write_positionfixes_csv(positionfixes, filename, *args, geometry_encoding="xy", **kwargs):
     """
     Write positionfixes to csv file.
 
@@ -99,6 +246,10 @@ def write_positionfixes_csv(positionfixes, filename, *args, **kwargs):
     filename : str
         The file to write to.
 
+    geometry_encoding : {'xy', 'wkt', 'wkb_hex'}, default 'xy'
+        Encoding of the geometry. 'xy' writes the "longitude" and "latitude" columns, 'wkt' well-known text
+        and 'wkb_hex' hex encoded well-known binary.
+
     args
         Additional arguments passed to pd.DataFrame.to_csv().
 
@@ -115,16 +266,92 @@ def write_positionfixes_csv(positionfixes, filename, *args, **kwargs):
     >>> pfs.to_csv("export_pfs.csv")
     >>> ti.io.write_positionfixes_csv(pfs, "export_pfs.csv")
     """
-    gdf = positionfixes.copy()
-    gdf["longitude"] = positionfixes.geometry.x
-    gdf["latitude"] = positionfixes.geometry.y
-    df = gdf.drop(columns=[gdf.geometry.name])
-
+    df = _encode_geometries(positionfixes, geometry_encoding)
     df.to_csv(filename, index=True, *args, **kwargs)
 
 
+_GEOMETRY_ENCODINGS = ["wkt", "wkb_hex", "xy"]
+
+
+def _encode_geometries(gdf, geometry_encoding):
+    """
+    Encode all geometry columns as text for writing them to csv.
+
+    Parameters
+    ----------
+    gdf : GeoDataFrame
+
+    geometry_encoding : {'wkt', 'wkb_hex', 'xy'}
+        'xy' replaces the (point) geometry by "longitude" and "latitude" columns, other geometry columns
+        are encoded as 'wkb_hex'.
+
+    Returns
+    -------
+    pd.DataFrame
+    """
+    if geometry_encoding not in _GEOMETRY_ENCODINGS:
+        raise ValueError(
+            f"geometry_encoding unknown. We only support {_GEOMETRY_ENCODINGS}. You passed {geometry_encoding}"
+        )
+    if geometry_encoding == "wkt":
+        return gdf.to_wkt(rounding_precision=-1, trim=False)
+
+    df = pd.DataFrame(gdf).copy(deep=False)
+    if geometry_encoding == "xy":
+        geometry = gdf.geometry
+        if not (geometry.geom_type.dropna() == "Point").all():
+            raise ValueError("geometry_encoding 'xy' is only possible for Point geometries.")
+        df = df.drop(columns=geometry.name)
+        df["longitude"] = geometry.x
+        df["latitude"] = geometry.y
+    for col in df.columns[df.dtypes == "geometry"]:
+        # the hex conversion of python is considerably faster than the one of GEOS
+        wkb = shapely.to_wkb(np.asarray(df[col].values))
+        df[col] = [None if b is None else b.hex().upper() for b in wkb]
+    return df
+
+
+def _decode_geometry_column(df, geom_col, geometry_encoding):
+    """Decode the geometry column of a DataFrame read from csv in place, see `_encode_geometries`."""
+    if geometry_encoding not in [None, *_GEOMETRY_ENCODINGS]:
+        raise ValueError(
+            f"geometry_encoding unknown. We only support {_GEOMETRY_ENCODINGS}. You passed {geometry_encoding}"
+        )
+    if geometry_encoding is None and geom_col not in df.columns and {"longitude", "latitude"}.issubset(df.columns):
+        geometry_encoding = "xy"
+
+    if geometry_encoding == "xy":
+        df[geom_col] = gpd.points_from_xy(df["longitude"], df["latitude"])
+        df.drop(columns=["longitude", "latitude"], inplace=True)
+    else:
+        df[geom_col] = _decode_geometries(df[geom_col], geometry_encoding)
+
+
+def _decode_geometries(geometries, geometry_encoding=None):
+    """Decode geometries encoded as WKT or hex WKB, the encoding is detected from the first value if None."""
+    if geometry_encoding is None:
+        first = geometries.dropna().head(1)
+        is_hex = len(first) and first.str.fullmatch("[0-9A-Fa-f]+").iloc[0]
+        geometry_encoding = "wkb_hex" if is_hex else "wkt"
+
+    if geometry_encoding == "wkt":
+        return gpd.GeoSeries.from_wkt(geometries)
+    wkb = np.array([bytes.fromhex(g) if isinstance(g, str) else None for g in geometries], dtype=object)
+    return gpd.GeoSeries(shapely.from_wkb(wkb), index=geometries.index)
+
+
 @_index_warning_default_none
-def read_triplegs_csv(*args, columns=None, tz=None, index_col=None, geom_col="geom", crs=None, **kwargs):
+def read_triplegs_csv(
+    *args,
+    columns=None,
+    tz=None,
+    index_col=None,
+    geom_col="geom",
+    crs=None,
+    datetime_format=None,
+    geometry_encoding=None,
+    **kwargs,
+):
     """
     Read triplegs from csv file.
 
@@ -144,18 +371,28 @@ def read_triplegs_csv(*args, columns=None, tz=None, index_col=None, geom_col="ge
     tz : str, optional
         pytz compatible timezone string. If None UTC is assumed.
 
+    datetime_format : str, optional
+        Format of the timestamps, e.g., "%Y-%m-%d %H:%M:%S" (passed to pd.to_datetime()) or "ISO8601".
+        Use "epoch" for seconds since 1970-01-01 (UTC), or "epoch_ms", "epoch_us" and "epoch_ns" for finer units.
+        If None, ISO 8601 and epoch timestamps are detected from the first rows and parsed with a fast path,
+        other formats are inferred by pandas.
+
     index_col : str, optional
         Column name to be used as index. If None the default index is assumed
         as unique identifier.
 
     geom_col : str, default "geom"
-        Name of the column containing the geometry as WKT.
+        Name of the column containing the geometry as WKT (or WKB hex).
 
     crs : pyproj.crs or str, optional
         Set coordinate reference system. The value can be anything accepted
         by pyproj.CRS.from_user_input(), such as an authority string
         (eg “EPSG:4326”) or a WKT string.
 
+    geometry_encoding : {'wkt', 'wkb_hex', 'xy'}, optional
+        Encoding of the geometries as written by the csv writers. If None, 'xy' is detected from the
+        "longitude" and "latitude" columns in the header, 'wkt' and 'wkb_hex' from the first value.
+
     kwargs
         Additional keyword arguments passed to pd.read_csv().
 
@@ -175,9 +412,9 @@ def read_triplegs_csv(*args, columns=None, tz=None, index_col=None, geom_col="ge
     columns = {} if columns is None else columns
     df = pd.read_csv(*args, index_col=index_col, **kwargs)
     df.rename(columns=columns, inplace=True)
-    df["started_at"] = pd.to_datetime(df["started_at"])
-    df["finished_at"] = pd.to_datetime(df["finished_at"])
-    df[geom_col] = gpd.GeoSeries.from_wkt(df[geom_col])
+    df["started_at"] = _parse_datetime(df["started_at"], datetime_format, tz, "started_at")
+    df["finished_at"] = _parse_datetime(df["finished_at"], datetime_format, tz, "finished_at")
+    _decode_geometry_column(df, geom_col, geometry_encoding)
     return read_triplegs_gpd(df, geom_col=geom_col, crs=crs, tz=tz, mapper=columns)
 
 
@@ -185,14 +422,25 @@ def read_triplegs_csv(*args, columns=None, tz=None, index_col=None, geom_col="ge
     _shared_docs["write_csv"],
     first_arg="\ntriplegs : Triplegs\n",
     long="triplegs",
+    encoding_arg=_shared_docs["csv_geometry_encoding"],
     short="tpls",
 )
-def write_triplegs_csv(triplegs, filename, *args, **kwargs):
-    pd.DataFrame.to_csv(triplegs.to_wkt(rounding_precision=-1, trim=False), filename, index=True, *args, **kwargs)
+def write_triplegs_csv(triplegs, filename, *args, geometry_encoding="wkt", **kwargs):
+    pd.DataFrame.to_csv(_encode_geometries(triplegs, geometry_encoding), filename, index=True, *args, **kwargs)
 
 
 @_index_warning_default_none
-def read_staypoints_csv(*args, columns=None, tz=None, index_col=None, geom_col="geom", crs=None, **kwargs):
+def read_staypoints_csv(
+    *args,
+    columns=None,
+    tz=None,
+    index_col=None,
+    geom_col="geom",
+    crs=None,
+    datetime_format=None,
+    geometry_encoding=None,
+    **kwargs,
+):
     """
     Read staypoints from csv file.
 
@@ -212,18 +460,28 @@ def read_staypoints_csv(*args, columns=None, tz=None, index_col=None, geom_col="
     tz : str, optional
         pytz compatible timezone string. If None UTC is assumed.
 
+    datetime_format : str, optional
+        Format of the timestamps, e.g., "%Y-%m-%d %H:%M:%S" (passed to pd.to_datetime()) or "ISO8601".
+        Use "epoch" for seconds since 1970-01-01 (UTC), or "epoch_ms", "epoch_us" and "epoch_ns" for finer units.
+        If None, ISO 8601 and epoch timestamps are detected from the first rows and parsed with a fast path,
+        other formats are inferred by pandas.
+
     index_col : str, optional
         column name to be used as index. If None the default index is assumed
         as unique identifier.
 
     geom_col : str, default "geom"
-        Name of the column containing the geometry as WKT.
+        Name of the column containing the geometry as WKT (or WKB hex).
 
     crs : pyproj.crs or str, optional
         Set coordinate reference system. The value can be anything accepted
         by pyproj.CRS.from_user_input(), such as an authority string
         (eg “EPSG:4326”) or a WKT string.
 
+    geometry_encoding : {'wkt', 'wkb_hex', 'xy'}, optional
+        Encoding of the geometries as written by the csv writers. If None, 'xy' is detected from the
+        "longitude" and "latitude" columns in the header, 'wkt' and 'wkb_hex' from the first value.
+
     kwargs
         Additional keyword arguments passed to pd.read_csv().
 
@@ -243,9 +501,9 @@ def read_staypoints_csv(*args, columns=None, tz=None, index_col=None, geom_col="
     columns = {} if columns is None else columns
     df = pd.read_csv(*args, index_col=index_col, **kwargs)
     df.rename(columns=columns, inplace=True)
-    df["started_at"] = pd.to_datetime(df["started_at"])
-    df["finished_at"] = pd.to_datetime(df["finished_at"])
-    df[geom_col] = gpd.GeoSeries.from_wkt(df[geom_col])
+    df["started_at"] = _parse_datetime(df["started_at"], datetime_format, tz, "started_at")
+    df["finished_at"] = _parse_datetime(df["finished_at"], datetime_format, tz, "finished_at")
+    _decode_geometry_column(df, geom_col, geometry_encoding)
     return read_staypoints_gpd(df, geom_col=geom_col, crs=crs, tz=tz)
 
 
@@ -253,14 +511,15 @@ def read_staypoints_csv(*args, columns=None, tz=None, index_col=None, geom_col="
     _shared_docs["write_csv"],
     first_arg="\nstaypoints : Staypoints\n",
     long="staypoints",
+    encoding_arg=_shared_docs["csv_geometry_encoding"],
     short="sp",
 )
-def write_staypoints_csv(staypoints, filename, *args, **kwargs):
-    pd.DataFrame.to_csv(staypoints.to_wkt(rounding_precision=-1, trim=False), filename, index=True, *args, **kwargs)
+def write_staypoints_csv(staypoints, filename, *args, geometry_encoding="wkt", **kwargs):
+    pd.DataFrame.to_csv(_encode_geometries(staypoints, geometry_encoding), filename, index=True, *args, **kwargs)
 
 
 @_index_warning_default_none
-def read_locations_csv(*args, columns=None, index_col=None, crs=None, **kwargs):
+def read_locations_csv(*args, columns=None, index_col=None, crs=None, geometry_encoding=None, **kwargs):
     """
     Read locations from csv file.
 
@@ -286,6 +545,10 @@ def read_locations_csv(*args, columns=None, index_col=None, crs=None, **kwargs):
         by pyproj.CRS.from_user_input(), such as an authority string
         (eg “EPSG:4326”) or a WKT string.
 
+    geometry_encoding : {'wkt', 'wkb_hex', 'xy'}, optional
+        Encoding of the geometries as written by the csv writers. If None, 'xy' is detected from the
+        "longitude" and "latitude" columns in the header, 'wkt' and 'wkb_hex' from the first value.
+
     kwargs
         Additional keyword arguments passed to pd.read_csv().
 
@@ -306,9 +569,10 @@ def read_locations_csv(*args, columns=None, index_col=None, crs=None, **kwargs):
     df = pd.read_csv(*args, index_col=index_col, **kwargs)
     df.rename(columns=columns, inplace=True)
 
-    df["center"] = gpd.GeoSeries.from_wkt(df["center"])
+    _decode_geometry_column(df, "center", geometry_encoding)
     if "extent" in df.columns:
-        df["extent"] = gpd.GeoSeries.from_wkt(df["extent"])
+        # only the center can be encoded as 'xy'
+        df["extent"] = _decode_geometries(df["extent"], None if geometry_encoding == "xy" else geometry_encoding)
     return read_locations_gpd(df, crs=crs)
 
 
@@ -316,14 +580,25 @@ def read_locations_csv(*args, columns=None, index_col=None, crs=None, **kwargs):
     _shared_docs["write_csv"],
     first_arg="\nlocations : Locations\n",
     long="locations",
+    encoding_arg=_shared_docs["csv_geometry_encoding"],
     short="locs",
 )
-def write_locations_csv(locations, filename, *args, **kwargs):
-    pd.DataFrame.to_csv(locations.to_wkt(rounding_precision=-1, trim=False), filename, index=True, *args, **kwargs)
+def write_locations_csv(locations, filename, *args, geometry_encoding="wkt", **kwargs):
+    pd.DataFrame.to_csv(_encode_geometries(locations, geometry_encoding), filename, index=True, *args, **kwargs)
 
 
 @_index_warning_default_none
-def read_trips_csv(*args, columns=None, tz=None, index_col=None, geom_col=None, crs=None, **kwargs):
+def read_trips_csv(
+    *args,
+    columns=None,
+    tz=None,
+    index_col=None,
+    geom_col=None,
+    crs=None,
+    datetime_format=None,
+    geometry_encoding=None,
+    **kwargs,
+):
     """
     Read trips from csv file.
 
@@ -344,12 +619,18 @@ def read_trips_csv(*args, columns=None, tz=None, index_col=None, geom_col=None,
     tz : str, optional
         pytz compatible timezone string. If None UTC is assumed.
 
+    datetime_format : str, optional
+        Format of the timestamps, e.g., "%Y-%m-%d %H:%M:%S" (passed to pd.to_datetime()) or "ISO8601".
+        Use "epoch" for seconds since 1970-01-01 (UTC), or "epoch_ms", "epoch_us" and "epoch_ns" for finer units.
+        If None, ISO 8601 and epoch timestamps are detected from the first rows and parsed with a fast path,
+        other formats are inferred by pandas.
+
     index_col : str, optional
         column name to be used as index. If None the default index is assumed
         as unique identifier.
 
     geom_col : str, default None
-        Name of the column containing the geometry as WKT.
+        Name of the column containing the geometry as WKT (or WKB hex).
         If None no geometry gets added.
 
     crs : pyproj.crs or str, optional
@@ -357,6 +638,10 @@ def read_trips_csv(*args, columns=None, tz=None, index_col=None, geom_col=None,
         by pyproj.CRS.from_user_input(), such as an authority string
         (eg “EPSG:4326”) or a WKT string. Ignored if geom_col is None.
 
+    geometry_encoding : {'wkt', 'wkb_hex', 'xy'}, optional
+        Encoding of the geometries as written by the csv writers. If None, 'xy' is detected from the
+        "longitude" and "latitude" columns in the header, 'wkt' and 'wkb_hex' from the first value.
+
     kwargs
         Additional keyword arguments passed to pd.read_csv().
 
@@ -386,25 +671,31 @@ def read_trips_csv(*args, columns=None, tz=None, index_col=None, geom_col=None,
     trips = pd.read_csv(*args, index_col=index_col, **kwargs)
     trips.rename(columns=columns, inplace=True)
 
-    trips["started_at"] = pd.to_datetime(trips["started_at"])
-    trips["finished_at"] = pd.to_datetime(trips["finished_at"])
+    trips["started_at"] = _parse_datetime(trips["started_at"], datetime_format, tz, "started_at")
+    trips["finished_at"] = _parse_datetime(trips["finished_at"], datetime_format, tz, "finished_at")
 
     if geom_col is not None:
-        trips[geom_col] = gpd.GeoSeries.from_wkt(trips[geom_col])
+        _decode_geometry_column(trips, geom_col, geometry_encoding)
 
     return read_trips_gpd(trips, geom_col=geom_col, crs=crs, tz=tz)
 
 
-@doc(_shared_docs["write_csv"], first_arg="\ntrips : Trips\n", long="trips", short="trips")
-def write_trips_csv(trips, filename, *args, **kwargs):
+@doc(
+    _shared_docs["write_csv"],
+    first_arg="\ntrips : Trips\n",
+    long="trips",
+    short="trips",
+    encoding_arg=_shared_docs["csv_geometry_encoding"],
+)
+def write_trips_csv(trips, filename, *args, geometry_encoding="wkt", **kwargs):
     if isinstance(trips, GeoDataFrame):
-        trips = trips.to_wkt(rounding_precision=-1, trim=False)
+        trips = _encode_geometries(trips, geometry_encoding)
     # static call necessary as TripsDataFrame has a to_csv method as well.
     pd.DataFrame.to_csv(trips, filename, index=True, *args, **kwargs)
 
 
 @_index_warning_default_none
-def read_tours_csv(*args, columns=None, index_col=None, tz=None, **kwargs):
+def read_tours_csv(*args, columns=None, index_col=None, tz=None, datetime_format=None, trips_sep="|", **kwargs):
     """
     Read tours from csv file.
 
@@ -424,6 +715,15 @@ def read_tours_csv(*args, columns=None, index_col=None, tz=None, **kwargs):
     tz : str, optional
         pytz compatible timezone string. If None UTC is assumed.
 
+    datetime_format : str, optional
+        Format of the timestamps, e.g., "%Y-%m-%d %H:%M:%S" (passed to pd.to_datetime()) or "ISO8601".
+        Use "epoch" for seconds since 1970-01-01 (UTC), or "epoch_ms", "epoch_us" and "epoch_ns" for finer units.
+        If None, ISO 8601 and epoch timestamps are detected from the first rows and parsed with a fast path,
+        other formats are inferred by pandas.
+
+    trips_sep : str, default "|"
+        Separator of the trip ids in the column "trips", if they are not written as list (e.g., "[1, 2, 3]").
+
     kwargs
         Additional keyword arguments passed to pd.read_csv().
 
@@ -436,16 +736,67 @@ def read_tours_csv(*args, columns=None, index_col=None, tz=None, **kwargs):
     >>> trackintel.read_tours_csv('data.csv', columns={'uuid':'user_id'})
     """
     columns = {} if columns is None else columns
-    kwargs.setdefault("converters", {}).setdefault("trips", ast.literal_eval)
+    kwargs.setdefault("converters", {}).setdefault("trips", str)
     tours = pd.read_csv(*args, index_col=index_col, **kwargs)
     tours.rename(columns=columns, inplace=True)
+    if "trips" in tours.columns:
+        tours["trips"] = _parse_trips(tours["trips"], trips_sep)
 
-    tours["started_at"] = pd.to_datetime(tours["started_at"])
-    tours["finished_at"] = pd.to_datetime(tours["finished_at"])
+    tours["started_at"] = _parse_datetime(tours["started_at"], datetime_format, tz, "started_at")
+    tours["finished_at"] = _parse_datetime(tours["finished_at"], datetime_format, tz, "finished_at")
 
     return read_tours_gpd(tours, tz=tz)
 
 
-@doc(_shared_docs["write_csv"], first_arg="\ntours : Tours\n", long="tours", short="tours")
-def write_tours_csv(tours, filename, *args, **kwargs):
+@doc(
+    _shared_docs["write_csv"],
+    first_arg="\ntours : Tours\n",
+    long="tours",
+    short="tours",
+    encoding_arg=_shared_docs["csv_trips_sep"],
+)
+def write_tours_csv(tours, filename, *args, trips_sep=None, **kwargs):
+    if "trips" in tours.columns:
+        if trips_sep is None:
+            trips = [np.asarray(t).tolist() if pd.api.types.is_list_like(t) else t for t in tours["trips"]]
+        else:
+            trips = [_join_trips(t, trips_sep) for t in tours["trips"]]
+        tours = pd.DataFrame(tours).assign(trips=trips)
     pd.DataFrame.to_csv(tours, filename, index=True, *args, **kwargs)
+
+
+def _join_trips(trip_ids, sep):
+    """Join the trip ids of a tour by sep, missing values are written as empty string."""
+    if pd.api.types.is_list_like(trip_ids):
+        return sep.join(map(str, trip_ids))
+    return "" if pd.isna(trip_ids) else str(trip_ids)
+
+
+def _parse_trips(trips, sep):
+    """
+    Parse the trip ids of tours to lists, read as list literal (e.g., "[1, 2]") or joined by `sep` (e.g., "1|2").
+
+    The ids are split and cast to integers vectorized, which is considerably faster than ast.literal_eval.
+    """
+    values = trips.fillna("").astype(str).reset_index(drop=True)
+    is_literal = values.str.startswith("[").any()
+    if is_literal:
+        values = values.str.strip("[] ")
+        sep = ","
+    # the index of the exploded tokens is the position of their tour, empty strings become empty lists
+    tokens = values.str.split(sep, regex=False).explode()
+    tokens = tokens[tokens.str.strip() != ""]
+    try:
+        ids = tokens.astype("int64")
+    except ValueError as err:
+        if is_literal:
+            # e.g., lists of strings or floats
+            return trips.map(ast.literal_eval)
+        raise ValueError(f"Cannot parse the trip ids of the column 'trips' as integers: {err}") from err
+
+    # regroup by index, the tokens are still in order of the tours
+    counts = np.bincount(ids.index.to_numpy(), minlength=len(values))
+    ends = np.cumsum(counts)
+    ids = ids.tolist()
+    trips_list = [ids[start:end] for start, end in zip((ends - counts).tolist(), ends.tolist())]
+    return pd.Series(trips_list, index=trips.index, name=trips.name, dtype=object)
@@ -1,4 +1,5 @@
 import warnings
+import numpy as np
 import pandas as pd
 import geopandas as gpd
 
@@ -410,6 +411,9 @@ def _localize_timestamp(dt_series, pytz_tzinfo, col_name):
     """
     Add timezone info to timestamp.
 
+    Naive timestamps are localized to the timezone, timestamps that already carry timezone information are converted
+    to it.
+
     Parameters
     ----------
     dt_series : pandas.Series
@@ -430,16 +434,29 @@ def _localize_timestamp(dt_series, pytz_tzinfo, col_name):
         warnings.warn(f"Assuming UTC timezone for column {col_name}")
         pytz_tzinfo = "utc"
 
-    def localize(ts, tz):
-        """Localize ts if tz is not set else leave it be"""
-        ts = pd.Timestamp(ts)
-        if ts.tz is not None:
-            return ts
-        return pd.Timestamp.tz_localize(ts, tz)
-
-    # localize all datetimes without a timezone
-    dt_series = dt_series.apply(localize, tz=pytz_tzinfo)
-    # create a Timeseries (utc=False will create warning)
-    dt_series = pd.to_datetime(dt_series, utc=True)
-    # convert it back to right tz
-    return dt_series.dt.tz_convert(pytz_tzinfo)
+    if not pd.api.types.is_datetime64_any_dtype(dt_series.dtype):
+        try:
+            dt_series = pd.to_datetime(dt_series)
+        except ValueError:
+            # mix of naive and timezone aware timestamps (or of formats)
+            return _localize_mixed_timestamp(dt_series, pytz_tzinfo)
+
+    if isinstance(dt_series.dtype, pd.DatetimeTZDtype):
+        dt_series = dt_series.dt.tz_convert(pytz_tzinfo)
+    elif pd.api.types.is_datetime64_dtype(dt_series.dtype):
+        dt_series = dt_series.dt.tz_localize(pytz_tzinfo)
+    else:
+        # timestamps with different utc offsets
+        dt_series = pd.to_datetime(dt_series, utc=True).dt.tz_convert(pytz_tzinfo)
+    return dt_series.dt.as_unit("ns")
+
+
+def _localize_mixed_timestamp(dt_series, tz):
+    """Localize the naive timestamps and convert the timezone aware timestamps of an object series."""
+    timestamps = pd.Series([pd.Timestamp(ts) for ts in dt_series], index=dt_series.index, dtype=object)
+    is_naive = np.array([ts.tz is None for ts in timestamps])
+    ns = np.empty(len(timestamps), dtype=np.int64)
+    ns[is_naive] = pd.DatetimeIndex(timestamps[is_naive].tolist()).as_unit("ns").tz_localize(tz).asi8
+    ns[~is_naive] = pd.to_datetime(timestamps[~is_naive].tolist(), utc=True).as_unit("ns").asi8
+    dt_series = pd.Series(pd.to_datetime(ns, utc=True), index=dt_series.index, name=dt_series.name)
+    return dt_series.dt.tz_convert(tz)
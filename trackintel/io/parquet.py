@@ -0,0 +1,422 @@
+import io
+import json
+from functools import reduce
+from operator import and_
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+
+import trackintel as ti
+from trackintel import Locations, Positionfixes, Staypoints, Tours, Triplegs, Trips
+from trackintel.model.locations import _required_columns as _locs_required_columns
+from trackintel.model.positionfixes import _required_columns as _pfs_required_columns
+from trackintel.model.staypoints import _required_columns as _sp_required_columns
+from trackintel.model.tours import _required_columns as _tours_required_columns
+from trackintel.model.triplegs import _required_columns as _tpls_required_columns
+from trackintel.model.trips import _required_columns as _trips_required_columns
+from trackintel.model.util import _shared_docs, doc
+
+# key of the trackintel metadata in the parquet schema
+_METADATA_KEY = b"trackintel"
+
+# columns that are always read
+_REQUIRED_COLUMNS = {
+    "positionfixes": _pfs_required_columns,
+    "staypoints": _sp_required_columns,
+    "triplegs": _tpls_required_columns,
+    "locations": _locs_required_columns,
+    "trips": _trips_required_columns,
+    "tours": _tours_required_columns,
+}
+
+# column the rows are sorted by (after user_id) and the time window is applied to
+_TIME_COLUMN = {
+    "positionfixes": "tracked_at",
+    "staypoints": "started_at",
+    "triplegs": "started_at",
+    "locations": None,
+    "trips": "started_at",
+    "tours": "started_at",
+}
+
+
+def _time_window_doc(long, time_col):
+    return f"""
+start, end : datetime-like, optional
+    Only read the {long} with '{time_col}' in [start, end). Timezone naive values are interpreted in the timezone
+    of '{time_col}'.
+"""
+
+
+@doc(
+    _shared_docs["read_parquet"],
+    long="positionfixes",
+    short="pfs",
+    model="Positionfixes",
+    time_window=_time_window_doc("positionfixes", "tracked_at"),
+    example_window=', start="2023-01-01", end="2023-02-01"',
+)
+def read_positionfixes_parquet(path, columns=None, user_ids=None, start=None, end=None, validate=None, **kwargs):
+    return _read_parquet(path, "positionfixes", Positionfixes, columns, user_ids, start, end, validate, **kwargs)
+
+
+@doc(
+    _shared_docs["write_parquet"],
+    first_arg="\npositionfixes : Positionfixes\n",
+    long="positionfixes",
+    short="pfs",
+    sort_keys="'user_id' and 'tracked_at'",
+)
+def write_positionfixes_parquet(
+    positionfixes, path, index=True, compression="snappy", row_group_size=100_000, sort=True, **kwargs
+):
+    _write_parquet(positionfixes, path, "positionfixes", index, compression, row_group_size, sort, **kwargs)
+
+
+@doc(
+    _shared_docs["read_parquet"],
+    long="staypoints",
+    short="sp",
+    model="Staypoints",
+    time_window=_time_window_doc("staypoints", "started_at"),
+    example_window=', start="2023-01-01", end="2023-02-01"',
+)
+def read_staypoints_parquet(path, columns=None, user_ids=None, start=None, end=None, validate=None, **kwargs):
+    return _read_parquet(path, "staypoints", Staypoints, columns, user_ids, start, end, validate, **kwargs)
+
+
+@doc(
+    _shared_docs["write_parquet"],
+    first_arg="\nstaypoints : Staypoints\n",
+    long="staypoints",
+    short="sp",
+    sort_keys="'user_id' and 'started_at'",
+)
+def write_staypoints_parquet(
+    staypoints, path, index=True, compression="snappy", row_group_size=100_000, sort=True, **kwargs
+):
+    _write_parquet(staypoints, path, "staypoints", index, compression, row_group_size, sort, **kwargs)
+
+
+@doc(
+    _shared_docs["read_parquet"],
+    long="triplegs",
+    short="tpls",
+    model="Triplegs",
+    time_window=_time_window_doc("triplegs", "started_at"),
+    example_window=', start="2023-01-01", end="2023-02-01"',
+)
+def read_triplegs_parquet(path, columns=None, user_ids=None, start=None, end=None, validate=None, **kwargs):
+    return _read_parquet(path, "triplegs", Triplegs, columns, user_ids, start, end, validate, **kwargs)
+
+
+@doc(
+    _shared_docs["write_parquet"],
+    first_arg="\ntriplegs : Triplegs\n",
+    long="triplegs",
+    short="tpls",
+    sort_keys="'user_id' and 'started_at'",
+)
+def write_triplegs_parquet(
+    triplegs, path, index=True, compression="snappy", row_group_size=100_000, sort=True, **kwargs
+):
+    _write_parquet(triplegs, path, "triplegs", index, compression, row_group_size, sort, **kwargs)
+
+
+@doc(
+    _shared_docs["read_parquet"],
+    long="locations",
+    short="locs",
+    model="Locations",
+    time_window="",
+    example_window="",
+)
+def read_locations_parquet(path, columns=None, user_ids=None, validate=None, **kwargs):
+    return _read_parquet(path, "locations", Locations, columns, user_ids, None, None, validate, **kwargs)
+
+
+@doc(
+    _shared_docs["write_parquet"],
+    first_arg="\nlocations : Locations\n",
+    long="locations",
+    short="locs",
+    sort_keys="'user_id'",
+)
+def write_locations_parquet(
+    locations, path, index=True, compression="snappy", row_group_size=100_000, sort=True, **kwargs
+):
+    _write_parquet(locations, path, "locations", index, compression, row_group_size, sort, **kwargs)
+
+
+@doc(
+    _shared_docs["read_parquet"],
+    long="trips",
+    short="trips",
+    model="Trips",
+    time_window=_time_window_doc("trips", "started_at"),
+    example_window=', start="2023-01-01", end="2023-02-01"',
+)
+def read_trips_parquet(path, columns=None, user_ids=None, start=None, end=None, validate=None, **kwargs):
+    return _read_parquet(path, "trips", Trips, columns, user_ids, start, end, validate, **kwargs)
+
+
+@doc(
+    _shared_docs["write_parquet"],
+    first_arg="\ntrips : Trips\n",
+    long="trips",
+    short="trips",
+    sort_keys="'user_id' and 'started_at'",
+)
+def write_trips_parquet(trips, path, index=True, compression="snappy", row_group_size=100_000, sort=True, **kwargs):
+    _write_parquet(trips, path, "trips", index, compression, row_group_size, sort, **kwargs)
+
+
+@doc(
+    _shared_docs["read_parquet"],
+    long="tours",
+    short="tours",
+    model="Tours",
+    time_window=_time_window_doc("tours", "started_at"),
+    example_window=', start="2023-01-01", end="2023-02-01"',
+)
+def read_tours_parquet(path, columns=None, user_ids=None, start=None, end=None, validate=None, **kwargs):
+    tours = _read_parquet(path, "tours", Tours, columns, user_ids, start, end, validate, **kwargs)
+    if "trips" in tours.columns:
+        # pyarrow returns list columns as numpy arrays
+        tours["trips"] = tours["trips"].map(np.ndarray.tolist, na_action="ignore")
+    return tours
+
+
+@doc(
+    _shared_docs["write_parquet"],
+    first_arg="\ntours : Tours\n",
+    long="tours",
+    short="tours",
+    sort_keys="'user_id' and 'started_at'",
+)
+def write_tours_parquet(tours, path, index=True, compression="snappy", row_group_size=100_000, sort=True, **kwargs):
+    _write_parquet(tours, path, "tours", index, compression, row_group_size, sort, **kwargs)
+
+
+def _write_parquet(data, path, model, index, compression, row_group_size, sort, **kwargs):
+    """Write a (Geo)DataFrame to parquet and add the trackintel metadata to the schema.
+
+    Parameters
+    ----------
+    data : DataFrame or GeoDataFrame
+        The trackintel model to write.
+
+    path : str or path-like
+        The file to write to.
+
+    model : str
+        Name of the trackintel model, stored in the metadata.
+
+    index : bool, optional
+        Write the index as column.
+
+    compression : str, optional
+        Compression used for the data.
+
+    row_group_size : int
+        Maximum number of rows per row group.
+
+    sort : bool
+        Sort by user and time and align the row groups to users.
+
+    kwargs
+        Additional keyword arguments passed to pyarrow.parquet.ParquetWriter().
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if sort:
+        user_codes, order = _sort_order(data, _TIME_COLUMN[model])
+        if order is not None:
+            data = data.take(order)
+            user_codes = user_codes[order]
+        bounds = _row_group_bounds(user_codes, row_group_size)
+    else:
+        bounds = [(0, len(data))]
+
+    if isinstance(data, gpd.GeoDataFrame):
+        table = _geodataframe_to_arrow(data, index)
+    else:
+        table = pa.Table.from_pandas(data, preserve_index=index)
+    metadata = dict(table.schema.metadata or {})
+    metadata[_METADATA_KEY] = json.dumps({"model": model, "version": ti.__version__}).encode("utf-8")
+    table = table.replace_schema_metadata(metadata)
+
+    with pq.ParquetWriter(path, table.schema, compression=compression, **kwargs) as writer:
+        for start, stop in bounds:
+            writer.write_table(table.slice(start, stop - start), row_group_size=row_group_size)
+
+
+def _geodataframe_to_arrow(data, index):
+    """Convert a GeoDataFrame to a pyarrow Table with the geo metadata of GeoParquet.
+
+    Uses `GeoDataFrame.to_arrow` (geopandas >= 1.0) and falls back to writing the GeoDataFrame to an in-memory
+    parquet file for older versions of geopandas.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    # call the GeoDataFrame methods explicitly, the trackintel models overwrite `to_parquet`
+    if hasattr(gpd.GeoDataFrame, "to_arrow"):
+        table = gpd.GeoDataFrame.to_arrow(data, index=index)
+        # geopandas returns an object implementing the Arrow PyCapsule interface
+        return table if isinstance(table, pa.Table) else pa.table(table)
+    buffer = io.BytesIO()
+    gpd.GeoDataFrame.to_parquet(data, buffer, index=index, compression=None)
+    return pq.read_table(buffer)
+
+
+def _sort_order(data, time_col):
+    """Return the user codes of every row and the order that sorts by user and time (None if already sorted)."""
+    user_codes, _ = pd.factorize(data["user_id"], sort=True)
+    if len(data) == 0:
+        return user_codes, None
+    keys = [user_codes]
+    if time_col is not None:
+        keys.insert(0, data[time_col].array.asi8)
+    order = np.lexsort(keys)
+    if np.array_equal(order, np.arange(len(order))):
+        return user_codes, None
+    return user_codes, order
+
+
+def _row_group_bounds(user_codes, row_group_size):
+    """Split sorted rows into row groups of at most 'row_group_size' rows without splitting users.
+
+    A user with more rows than 'row_group_size' forms its own group, that is split further by the writer.
+
+    Parameters
+    ----------
+    user_codes : np.ndarray
+        Sorted user codes of all rows.
+
+    row_group_size : int
+        Maximum number of rows per row group.
+
+    Returns
+    -------
+    list of tuple
+        (start, stop) positions of the row groups.
+    """
+    user_ends = np.append(np.flatnonzero(user_codes[1:] != user_codes[:-1]) + 1, len(user_codes))
+    bounds = []
+    start = end = 0
+    for user_end in user_ends:
+        if user_end - start > row_group_size and end > start:
+            bounds.append((start, end))
+            start = end
+        if user_end - start > row_group_size:
+            bounds.append((start, user_end))
+            start = user_end
+        end = user_end
+    if end > start:
+        bounds.append((start, end))
+    return bounds
+
+
+def _read_parquet(path, model, model_class, columns, user_ids, start, end, validate, **kwargs):
+    """Read a (Geo)DataFrame from parquet and create the trackintel model.
+
+    Parameters
+    ----------
+    path : str or path-like
+        The file to read.
+
+    model : str
+        Name of the trackintel model.
+
+    model_class : class
+        Class of the trackintel model.
+
+    columns : list of str, optional
+        Only read these columns (and the required ones).
+
+    user_ids : list-like, optional
+        Only read the rows of these users.
+
+    start, end : datetime-like, optional
+        Only read the rows with time in [start, end).
+
+    validate : bool, optional
+        Validate the model. If None, the validation is skipped if the file was written by trackintel for this model.
+
+    kwargs
+        Additional keyword arguments passed to geopandas.read_parquet() or pandas.read_parquet().
+
+    Returns
+    -------
+    DataFrame or GeoDataFrame
+        An instance of model_class.
+    """
+    import pyarrow.parquet as pq
+
+    schema = pq.read_schema(path)
+    metadata = schema.metadata or {}
+    if validate is None:
+        validate = _read_metadata(metadata).get("model") != model
+
+    if columns is not None:
+        kwargs["columns"] = _select_columns(schema, metadata, columns, _REQUIRED_COLUMNS[model])
+    filters = _build_filters(schema, user_ids, _TIME_COLUMN[model], start, end)
+    if filters is not None:
+        kwargs["filters"] = filters
+
+    if b"geo" in metadata:
+        data = gpd.read_parquet(path, **kwargs)
+    else:
+        data = pd.read_parquet(path, **kwargs)
+    return model_class(data, validate=validate)
+
+
+def _select_columns(schema, metadata, columns, required_columns):
+    """Return the columns to read in the order of the file, including the required and geometry columns."""
+    missing = [c for c in columns if c not in schema.names]
+    if missing:
+        raise KeyError(f"Columns {missing} are not in the file, it has [{', '.join(schema.names)}].")
+    selected = set(columns) | set(required_columns)
+    if b"geo" in metadata:
+        selected.add(json.loads(metadata[b"geo"])["primary_column"])
+    return [c for c in schema.names if c in selected]
+
+
+def _build_filters(schema, user_ids, time_col, start, end):
+    """Return the filter expression for the users and the time window [start, end) (None if no filter is set)."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    filters = []
+    if user_ids is not None:
+        user_type = schema.field("user_id").type
+        filters.append(pc.field("user_id").isin(pa.array(list(user_ids), type=user_type)))
+    if start is not None:
+        filters.append(pc.field(time_col) >= _timestamp_scalar(start, schema.field(time_col).type))
+    if end is not None:
+        filters.append(pc.field(time_col) < _timestamp_scalar(end, schema.field(time_col).type))
+    if not filters:
+        return None
+    return reduce(and_, filters)
+
+
+def _timestamp_scalar(value, arrow_type):
+    """Convert value to an arrow timestamp scalar comparable with a column of arrow_type."""
+    import pyarrow as pa
+
+    ts = pd.Timestamp(value)
+    if ts.tz is None and arrow_type.tz is not None:
+        ts = ts.tz_localize(arrow_type.tz)
+    elif ts.tz is not None and arrow_type.tz is None:
+        ts = ts.tz_convert(None)
+    return pa.scalar(ts, type=arrow_type)
+
+
+def _read_metadata(metadata):
+    """Return the trackintel metadata of a parquet schema (empty if not written by trackintel)."""
+    if _METADATA_KEY not in metadata:
+        return {}
+    return json.loads(metadata[_METADATA_KEY])
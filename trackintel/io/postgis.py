@@ -1,5 +1,8 @@
-from functools import wraps
-from inspect import signature
+import os
+from collections import OrderedDict
+from functools import partial, wraps
+from inspect import isgenerator, signature
+from threading import Lock
 
 import geopandas as gpd
 from geopandas.io.sql import _get_srid_from_crs
@@ -7,15 +10,77 @@ from shapely import wkb
 import pandas as pd
 from geoalchemy2 import Geometry
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Connection
 from sqlalchemy.types import JSON
 
 import trackintel as ti
 from trackintel.io.util import _index_warning_default_none
 from trackintel.model.util import doc, _shared_docs
 
+_engines = OrderedDict()
+_engines_lock = Lock()
+_engine_options = {"cache_size": 8, "engine_kws": {}}
+
+
+def set_engine_options(cache_size=8, **engine_kws):
+    """
+    Set the options of the engines that are created for connection strings.
+
+    The PostGIS functions create one engine per connection string and reuse it, together with its pool of
+    connections, in later calls. The engines are kept in a least recently used cache. Setting the options
+    disposes all cached engines.
+
+    Parameters
+    ----------
+    cache_size : int, default 8
+        Maximal number of cached engines. The least recently used engine is disposed if more are needed.
+
+    engine_kws
+        Keyword arguments passed to sqlalchemy.create_engine(), e.g., the pool settings 'pool_size',
+        'max_overflow', 'pool_recycle' or 'pool_pre_ping'. Calling the function without arguments restores
+        the defaults of sqlalchemy.
+
+    Examples
+    --------
+    >>> ti.io.set_engine_options(pool_size=10, pool_pre_ping=True)
+    >>> for user_id in user_ids:
+    ...     pfs = ti.io.read_positionfixes_postgis(f"SELECT * FROM pfs WHERE user_id = {user_id}", conn_string)
+    """
+    if cache_size < 1:
+        raise ValueError(f"cache_size must be at least 1 but is {cache_size}.")
+    with _engines_lock:
+        _engine_options["cache_size"] = cache_size
+        _engine_options["engine_kws"] = engine_kws
+        while _engines:
+            _engines.popitem()[1].dispose()
+
+
+def _get_engine(conn_string):
+    """Return the cached engine of the connection string, create it if not cached."""
+    with _engines_lock:
+        engine = _engines.pop(conn_string, None)
+        if engine is None:
+            engine = create_engine(conn_string, **_engine_options["engine_kws"])
+        # most recently used engines are at the end
+        _engines[conn_string] = engine
+        while len(_engines) > _engine_options["cache_size"]:
+            _engines.popitem(last=False)[1].dispose()
+    return engine
+
+
+def _clear_engines_after_fork():
+    """Drop the engines in a forked process, the pooled connections belong to the parent."""
+    for engine in _engines.values():
+        engine.dispose(close=False)
+    _engines.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_clear_engines_after_fork)
+
 
 def _handle_con_string(func):
-    """Decorator function to create a `Connection` out of a connection string."""
+    """Decorator function to create a `Connection` out of a connection string (with a cached engine)."""
 
     @wraps(func)  # copy all metadata
     def wrapper(*args, **kwargs):
@@ -26,8 +91,7 @@ def _handle_con_string(func):
         if not isinstance(con, str):
             return func(*args, **kwargs)
 
-        engine = create_engine(con)
-        con = engine.connect()
+        con = _get_engine(con).connect()
 
         # overwrite con argument with open connection
         bound_values.arguments["con"] = con
@@ -35,13 +99,54 @@ def _handle_con_string(func):
         kwargs = bound_values.kwargs
         try:
             result = func(*args, **kwargs)
-        finally:
+        except BaseException:
             con.close()
+            raise
+        if isgenerator(result):
+            # chunks are read lazily, keep the connection open until the generator is done
+            return _close_when_done(result, con)
+        con.close()
         return result
 
     return wrapper
 
 
+def _close_when_done(generator, con):
+    """Yield from the generator and close the connection once it is exhausted or closed."""
+    try:
+        yield from generator
+    finally:
+        con.close()
+
+
+def _read_sql(read, sql, con, chunksize, convert, **kwargs):
+    """
+    Read a query with `read` and convert the result with `convert`.
+
+    If chunksize is set, a generator over the converted chunks is returned. For sqlalchemy connectables the
+    rows are fetched with a server-side cursor, such that only the current chunk is held in memory.
+    """
+    if chunksize is None:
+        return convert(read(sql, con, **kwargs))
+    return _read_sql_chunks(read, sql, con, chunksize, convert, **kwargs)
+
+
+def _read_sql_chunks(read, sql, con, chunksize, convert, **kwargs):
+    """Generator over the converted chunks of a query, see `_read_sql`."""
+    stream_results = None
+    if isinstance(con, Connection):
+        stream_results = con.get_execution_options().get("stream_results", False)
+    # SQLAlchemy < 2 returns a branched connection, SQLAlchemy >= 2 changes the connection in place
+    stream_con = con.execution_options(stream_results=True)
+    try:
+        for chunk in read(sql, stream_con, chunksize=chunksize, **kwargs):
+            yield convert(chunk)
+    finally:
+        if stream_con is con and stream_results is not None:
+            # restore the execution options of the connection
+            con.execution_options(stream_results=stream_results)
+
+
 @_index_warning_default_none
 @_handle_con_string
 def read_positionfixes_postgis(
@@ -92,8 +197,10 @@ def read_positionfixes_postgis(
         List of parameters to pass to execute method.
 
     chunksize : int, default None
-        If specified, return an iterator where chunksize is the number
-        of rows to include in each chunk.
+        If specified, return an iterator of Positionfixes where chunksize is the number
+        of rows to include in each chunk. Every chunk is validated on its own.
+        Sqlalchemy connectables fetch the rows with a server-side cursor,
+        such that only the current chunk is held in memory.
 
     read_gpd_kws : dict, default None
         Further keyword arguments as available in trackintels trackintel.io.read_positionfixes_gpd().
@@ -102,8 +209,8 @@ def read_positionfixes_postgis(
 
     Returns
     -------
-    GeoDataFrame
-        A GeoDataFrame containing the positionfixes.
+    GeoDataFrame or iterator
+        A GeoDataFrame containing the positionfixes, an iterator if 'chunksize' is set.
 
     Examples
     --------
@@ -112,18 +219,19 @@ def read_positionfixes_postgis(
     ...                                        index_col="id",
                                                read_gpd_kws={"user_id"="USER", "tracked_at": "time"})
     """
-    pfs = gpd.GeoDataFrame.from_postgis(
+    return _read_sql(
+        gpd.GeoDataFrame.from_postgis,
         sql,
         con,
+        chunksize,
+        partial(ti.io.read_positionfixes_gpd, **(read_gpd_kws or {})),
         geom_col=geom_col,
         crs=crs,
         index_col=index_col,
         coerce_float=coerce_float,
         parse_dates=parse_dates,
         params=params,
-        chunksize=chunksize,
     )
-    return ti.io.read_positionfixes_gpd(pfs, **(read_gpd_kws or {}))
 
 
 @doc(
@@ -189,8 +297,10 @@ def read_triplegs_postgis(
         List of parameters to pass to execute method.
 
     chunksize : int, default None
-        If specified, return an iterator where chunksize is the number
-        of rows to include in each chunk.
+        If specified, return an iterator of Triplegs where chunksize is the number
+        of rows to include in each chunk. Every chunk is validated on its own.
+        Sqlalchemy connectables fetch the rows with a server-side cursor,
+        such that only the current chunk is held in memory.
 
     read_gpd_kws : dict, default None
         Further keyword arguments as available in trackintels trackintel.io.read_triplegs_gpd().
@@ -199,8 +309,8 @@ def read_triplegs_postgis(
 
     Returns
     -------
-    GeoDataFrame
-        A GeoDataFrame containing the triplegs.
+    GeoDataFrame or iterator
+        A GeoDataFrame containing the triplegs, an iterator if 'chunksize' is set.
 
     Examples
     --------
@@ -208,18 +318,19 @@ def read_triplegs_postgis(
     >>> tpls = ti.io.read_triplegs_postgis("SELECT * FROM triplegs", con, geom_col="geom", index_col="id",
     ...                                    read_gpd_kws={"user_id": "USER"})
     """
-    tpls = gpd.GeoDataFrame.from_postgis(
+    return _read_sql(
+        gpd.GeoDataFrame.from_postgis,
         sql,
         con,
+        chunksize,
+        partial(ti.io.read_triplegs_gpd, **(read_gpd_kws or {})),
         geom_col=geom_col,
         crs=crs,
         index_col=index_col,
         coerce_float=coerce_float,
         parse_dates=parse_dates,
         params=params,
-        chunksize=chunksize,
     )
-    return ti.io.read_triplegs_gpd(tpls, **(read_gpd_kws or {}))
 
 
 @doc(
@@ -295,8 +406,10 @@ def read_staypoints_postgis(
         List of parameters to pass to execute method.
 
     chunksize : int, default None
-        If specified, return an iterator where chunksize is the number
-        of rows to include in each chunk.
+        If specified, return an iterator of Staypoints where chunksize is the number
+        of rows to include in each chunk. Every chunk is validated on its own.
+        Sqlalchemy connectables fetch the rows with a server-side cursor,
+        such that only the current chunk is held in memory.
 
     read_gpd_kws : dict, default None
         Further keyword arguments as available in trackintels trackintel.io.read_staypoints_gpd().
@@ -306,8 +419,8 @@ def read_staypoints_postgis(
 
     Returns
     -------
-    GeoDataFrame
-        A GeoDataFrame containing the staypoints.
+    GeoDataFrame or iterator
+        A GeoDataFrame containing the staypoints, an iterator if 'chunksize' is set.
 
     Examples
     --------
@@ -315,20 +428,20 @@ def read_staypoints_postgis(
     >>> sp = ti.io.read_staypoints_postgis("SELECT * FROM staypoints", con, geom_col="geom", index_col="id",
     ...                                    read_gpd_kws={"user_id": "USER"})
     """
-    sp = gpd.GeoDataFrame.from_postgis(
+    return _read_sql(
+        gpd.GeoDataFrame.from_postgis,
         sql,
         con,
+        chunksize,
+        partial(ti.io.read_staypoints_gpd, **(read_gpd_kws or {})),
         geom_col=geom_col,
         crs=crs,
         index_col=index_col,
         coerce_float=coerce_float,
         parse_dates=parse_dates,
         params=params,
-        chunksize=chunksize,
     )
 
-    return ti.io.read_staypoints_gpd(sp, **(read_gpd_kws or {}))
-
 
 @doc(
     _shared_docs["write_postgis"],
@@ -404,8 +517,10 @@ def read_locations_postgis(
         List of parameters to pass to execute method.
 
     chunksize : int, default None
-        If specified, return an iterator where chunksize is the number
-        of rows to include in each chunk.
+        If specified, return an iterator of Locations where chunksize is the number
+        of rows to include in each chunk. Every chunk is validated on its own.
+        Sqlalchemy connectables fetch the rows with a server-side cursor,
+        such that only the current chunk is held in memory.
 
     extent : string, default None
         If specified read the extent column as geometry column.
@@ -417,8 +532,8 @@ def read_locations_postgis(
 
     Returns
     -------
-    GeoDataFrame
-        A GeoDataFrame containing the locations.
+    GeoDataFrame or iterator
+        A GeoDataFrame containing the locations, an iterator if 'chunksize' is set.
 
     Examples
     --------
@@ -427,21 +542,25 @@ def read_locations_postgis(
     ...                                     extent="extent, read_gpd_kws={"user_id": "USER"})
     )
     """
-    locs = gpd.GeoDataFrame.from_postgis(
+
+    def convert(locs):
+        if extent is not None:
+            locs[extent] = gpd.GeoSeries.from_wkb(locs[extent])
+        return ti.io.read_locations_gpd(locs, center=center, **(read_gpd_kws or {}))
+
+    return _read_sql(
+        gpd.GeoDataFrame.from_postgis,
         sql,
         con,
+        chunksize,
+        convert,
         geom_col=center,
         crs=crs,
         index_col=index_col,
         coerce_float=coerce_float,
         parse_dates=parse_dates,
         params=params,
-        chunksize=chunksize,
     )
-    if extent is not None:
-        locs[extent] = gpd.GeoSeries.from_wkb(locs[extent])
-
-    return ti.io.read_locations_gpd(locs, center=center, **(read_gpd_kws or {}))
 
 
 @doc(
@@ -531,8 +650,10 @@ def read_trips_postgis(
         List of parameters to pass to execute method.
 
     chunksize : int, default None
-        If specified, return an iterator where chunksize is the number
-        of rows to include in each chunk.
+        If specified, return an iterator of Trips where chunksize is the number
+        of rows to include in each chunk. Every chunk is validated on its own.
+        Sqlalchemy connectables fetch the rows with a server-side cursor,
+        such that only the current chunk is held in memory.
 
     read_gpd_kws : dict, default None
         Further keyword arguments as available in trackintels trackintel.io.read_trips_gpd().
@@ -542,8 +663,8 @@ def read_trips_postgis(
 
     Returns
     -------
-    GeoDataFrame
-        A GeoDataFrame containing the trips.
+    GeoDataFrame or iterator
+        A GeoDataFrame containing the trips, an iterator if 'chunksize' is set.
 
     Examples
     --------
@@ -554,29 +675,21 @@ def read_trips_postgis(
 
     """
     if geom_col is None:
-        trips = pd.read_sql(
-            sql,
-            con,
-            index_col=index_col,
-            coerce_float=coerce_float,
-            params=params,
-            parse_dates=parse_dates,
-            chunksize=chunksize,
-        )
+        read = pd.read_sql
     else:
-        trips = gpd.GeoDataFrame.from_postgis(
-            sql,
-            con,
-            geom_col=geom_col,
-            crs=crs,
-            index_col=index_col,
-            coerce_float=coerce_float,
-            parse_dates=parse_dates,
-            params=params,
-            chunksize=chunksize,
-        )
+        read = partial(gpd.GeoDataFrame.from_postgis, geom_col=geom_col, crs=crs)
 
-    return ti.io.read_trips_gpd(trips, **(read_gpd_kws or {}))
+    return _read_sql(
+        read,
+        sql,
+        con,
+        chunksize,
+        partial(ti.io.read_trips_gpd, **(read_gpd_kws or {})),
+        index_col=index_col,
+        coerce_float=coerce_float,
+        parse_dates=parse_dates,
+        params=params,
+    )
 
 
 @doc(
@@ -664,8 +777,10 @@ def read_tours_postgis(
         List of parameters to pass to execute method.
 
     chunksize : int, default None
-        If specified, return an iterator where chunksize is the number
-        of rows to include in each chunk.
+        If specified, return an iterator of Tours where chunksize is the number
+        of rows to include in each chunk. Every chunk is validated on its own.
+        Sqlalchemy connectables fetch the rows with a server-side cursor,
+        such that only the current chunk is held in memory.
 
     read_gpd_kws : dict, default None
         Further keyword arguments as available in trackintels trackintel.io.read_tours_gpd().
@@ -674,7 +789,8 @@ def read_tours_postgis(
 
     Returns
     -------
-    Tours
+    Tours or iterator
+        An iterator if 'chunksize' is set.
 
     Examples
     --------
@@ -683,29 +799,21 @@ def read_tours_postgis(
                                          read_gpd_kws={"user_id": "USER"})
     """
     if geom_col is None:
-        tours = pd.read_sql(
-            sql,
-            con,
-            index_col=index_col,
-            coerce_float=coerce_float,
-            params=params,
-            parse_dates=parse_dates,
-            chunksize=chunksize,
-        )
+        read = pd.read_sql
     else:
-        tours = gpd.GeoDataFrame.from_postgis(
-            sql,
-            con,
-            geom_col=geom_col,
-            crs=crs,
-            index_col=index_col,
-            coerce_float=coerce_float,
-            parse_dates=parse_dates,
-            params=params,
-            chunksize=chunksize,
-        )
+        read = partial(gpd.GeoDataFrame.from_postgis, geom_col=geom_col, crs=crs)
 
-    return ti.io.read_tours_gpd(tours, **(read_gpd_kws or {}))
+    return _read_sql(
+        read,
+        sql,
+        con,
+        chunksize,
+        partial(ti.io.read_tours_gpd, **(read_gpd_kws or {})),
+        index_col=index_col,
+        coerce_float=coerce_float,
+        parse_dates=parse_dates,
+        params=params,
+    )
 
 
 @doc(
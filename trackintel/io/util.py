@@ -1,7 +1,19 @@
+import re
 import warnings
 from functools import wraps
 from inspect import signature
 
+import numpy as np
+import pandas as pd
+
+from trackintel.io.from_geopandas import _localize_timestamp
+
+# ISO 8601 timestamps, e.g., "2023-01-31 12:00:00+01:00" or "2023-01-31T12:00:00.5Z"
+_ISO8601 = re.compile(r"^\d{4}-\d{2}-\d{2}([T ]\d{2}:\d{2}(:\d{2}(\.\d{1,9})?)?)?(Z|[+-]\d{2}:?\d{2})?$")
+
+# epoch formats and their unit
+_EPOCH_UNITS = {"epoch": "s", "epoch_s": "s", "epoch_ms": "ms", "epoch_us": "us", "epoch_ns": "ns"}
+
 
 def _index_warning_default_none(func):
     """Decorator function that warns if index_col None is not set explicit."""
@@ -17,3 +29,137 @@ def _index_warning_default_none(func):
         return func(*args, **kwargs)
 
     return wrapper
+
+
+def _parse_datetime(dt_series, datetime_format=None, tz=None, col_name=None):
+    """
+    Parse timestamps as read from a csv file and localize them.
+
+    Parameters
+    ----------
+    dt_series : pd.Series
+        Timestamps as strings or numbers (epoch).
+
+    datetime_format : str, optional
+        strftime format passed to pd.to_datetime(), "ISO8601" or one of "epoch" ("epoch_s"), "epoch_ms",
+        "epoch_us", "epoch_ns". If None, ISO 8601 and epoch timestamps are detected by :func:`_detect_datetime_format`.
+
+    tz : str, optional
+        pytz compatible timezone string. If None, the timestamps are not localized.
+
+    col_name : str, optional
+        Column name for informative warning message.
+
+    Returns
+    -------
+    pd.Series
+        The parsed timestamps. If the timestamps cannot be parsed at once (e.g. because of a mix of formats),
+        they are only parsed by the localization, or returned unparsed if tz is None.
+    """
+    if not pd.api.types.is_datetime64_any_dtype(dt_series.dtype):
+        if datetime_format is None:
+            datetime_format = _detect_datetime_format(dt_series)
+        try:
+            if datetime_format in _EPOCH_UNITS:
+                dt_series = pd.to_datetime(dt_series, unit=_EPOCH_UNITS[datetime_format], utc=True)
+            elif datetime_format == "ISO8601":
+                dt_series = _parse_iso8601(dt_series)
+            else:
+                dt_series = pd.to_datetime(dt_series, format=datetime_format)
+        except ValueError:
+            # mix of naive and timezone aware timestamps, handled by the localization
+            if datetime_format is not None and datetime_format != "ISO8601":
+                raise
+
+    if tz is None:
+        return dt_series
+    return _localize_timestamp(dt_series, tz, col_name)
+
+
+def _detect_datetime_format(dt_series, n_sample=100):
+    """
+    Detect ISO 8601 and epoch timestamps from the first valid values.
+
+    Parameters
+    ----------
+    dt_series : pd.Series
+        Timestamps as strings or numbers.
+
+    n_sample : int, default 100
+        Number of values that are checked.
+
+    Returns
+    -------
+    str or None
+        "ISO8601", "epoch_s", "epoch_ms", "epoch_us", "epoch_ns" or None if the format is not detected.
+        The unit of epoch timestamps is guessed from their magnitude.
+    """
+    sample = dt_series.iloc[: 10 * n_sample].dropna().iloc[:n_sample]
+    if len(sample) == 0:
+        return None
+    if pd.api.types.is_numeric_dtype(sample.dtype) and not pd.api.types.is_bool_dtype(sample.dtype):
+        magnitude = np.abs(sample.to_numpy()).max()
+        # 1e11 s is in the year 5138, thus larger values must be in a finer unit
+        for unit, limit in [("s", 1e11), ("ms", 1e14), ("us", 1e17)]:
+            if magnitude < limit:
+                return f"epoch_{unit}"
+        return "epoch_ns"
+    if all(isinstance(v, str) and _ISO8601.match(v) for v in sample):
+        return "ISO8601"
+    return None
+
+
+def _parse_iso8601(dt_series):
+    """
+    Parse ISO 8601 strings.
+
+    Strings with a utc offset are slow to parse with pandas, if all of them have the same length they are parsed
+    with numpy and the offsets are applied vectorized. Everything else is parsed by pd.to_datetime().
+    """
+    valid = dt_series.notna().to_numpy()
+    ns = _parse_iso8601_fixed_width(dt_series.to_numpy()[valid].astype(str))
+    if ns is None:
+        parsed = pd.to_datetime(dt_series, format="ISO8601")
+        if parsed.dtype == object:
+            # different utc offsets can only be represented in utc
+            parsed = pd.to_datetime(dt_series, format="ISO8601", utc=True)
+        return parsed
+    values = np.full(len(dt_series), np.iinfo(np.int64).min)  # NaT
+    values[valid] = ns
+    return pd.Series(values.view("M8[ns]"), index=dt_series.index, name=dt_series.name).dt.tz_localize("UTC")
+
+
+def _parse_iso8601_fixed_width(values):
+    """Parse ISO 8601 strings with utc offset of the same length to utc nanoseconds (None if not possible)."""
+    if len(values) == 0:
+        return None
+    width = values.dtype.itemsize // 4
+    # unicode code points of the characters
+    codes = values.view(np.uint32).reshape(len(values), width)
+    if (codes[:, -1] == 0).any():
+        return None  # shorter strings are padded
+
+    is_sign = (codes == ord("+")) | (codes == ord("-"))
+    if (codes[:, -1] == ord("Z")).all():
+        offset_len = 1
+    elif width > 16 and is_sign[:, -6].all() and (codes[:, -3] == ord(":")).all():
+        offset_len = 6
+    elif width > 15 and is_sign[:, -5].all():
+        offset_len = 5
+    else:
+        return None  # naive timestamps are parsed fast by pandas
+
+    local = np.ascontiguousarray(values.view("U1").reshape(len(values), width)[:, : width - offset_len])
+    try:
+        ns = local.view(f"U{width - offset_len}").ravel().astype("datetime64[ns]").view(np.int64)
+    except ValueError:
+        return None
+    if offset_len == 1:
+        return ns
+
+    digits = codes[:, [-4, -3, -2, -1] if offset_len == 5 else [-5, -4, -2, -1]].astype(np.int64) - ord("0")
+    if ((digits < 0) | (digits > 9)).any():
+        return None
+    minutes = (digits[:, 0] * 10 + digits[:, 1]) * 60 + digits[:, 2] * 10 + digits[:, 3]
+    sign = np.where(codes[:, -offset_len] == ord("-"), -1, 1)
+    return ns - sign * minutes * 60 * 10**9
@@ -53,7 +53,13 @@ class Locations(TrackintelBase, TrackintelGeoDataFrame):
             # One for extend and one for the center
             raise TypeError("The center geometry must be a Point (only first checked).")
 
-    @doc(_shared_docs["write_csv"], first_arg="", long="locations", short="locs")
+    @doc(
+        _shared_docs["write_csv"],
+        first_arg="",
+        long="locations",
+        short="locs",
+        encoding_arg=_shared_docs["csv_geometry_encoding"],
+    )
     def to_csv(self, filename, *args, **kwargs):
         ti.io.write_locations_csv(self, filename, *args, **kwargs)
 
@@ -63,10 +69,24 @@ class Locations(TrackintelBase, TrackintelGeoDataFrame):
     ):
         ti.io.write_locations_postgis(self, name, con, schema, if_exists, index, index_label, chunksize, dtype)
 
-    def spatial_filter(self, areas, method="within", re_project=False):
+    @doc(_shared_docs["write_parquet"], first_arg="", long="locations", short="locs", sort_keys="'user_id'")
+    def to_parquet(self, path, index=True, compression="snappy", row_group_size=100_000, sort=True, **kwargs):
+        ti.io.write_locations_parquet(
+            self, path, index=index, compression=compression, row_group_size=row_group_size, sort=sort, **kwargs
+        )
+
+    def spatial_filter(self, areas, method="within", re_project=False, area_col=None):
         """
         Filter Locations on a geo extent.
 
         See :func:`trackintel.geogr.spatial_filter` for full documentation.
         """
-        return ti.geogr.spatial_filter(self, areas, method=method, re_project=re_project)
+        return ti.geogr.spatial_filter(self, areas, method=method, re_project=re_project, area_col=area_col)
+
+    def tag_zones(self, zones, method="start", re_project=False, chunksize=100_000, n_jobs=1):
+        """
+        Tag Locations with the zone they lie in.
+
+        See :func:`trackintel.geogr.tag_zones` for full documentation.
+        """
+        return ti.geogr.tag_zones(self, zones, method=method, re_project=re_project, chunksize=chunksize, n_jobs=n_jobs)
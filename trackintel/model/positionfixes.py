@@ -144,6 +144,18 @@ class Positionfixes(TrackintelBase, TrackintelGeoDataFrame, gpd.GeoDataFrame):
     ):
         ti.io.write_positionfixes_postgis(self, name, con, schema, if_exists, index, index_label, chunksize, dtype)
 
+    @doc(
+        _shared_docs["write_parquet"],
+        first_arg="",
+        long="positionfixes",
+        short="pfs",
+        sort_keys="'user_id' and 'tracked_at'",
+    )
+    def to_parquet(self, path, index=True, compression="snappy", row_group_size=100_000, sort=True, **kwargs):
+        ti.io.write_positionfixes_parquet(
+            self, path, index=index, compression=compression, row_group_size=row_group_size, sort=sort, **kwargs
+        )
+
     def calculate_distance_matrix(self, Y=None, dist_metric="haversine", n_jobs=0, **kwds):
         """
         Calculate a distance matrix based on a specific distance metric.
@@ -152,6 +164,14 @@ class Positionfixes(TrackintelBase, TrackintelGeoDataFrame, gpd.GeoDataFrame):
         """
         return ti.geogr.calculate_distance_matrix(self, Y=Y, dist_metric=dist_metric, n_jobs=n_jobs, **kwds)
 
+    def tag_zones(self, zones, method="start", re_project=False, chunksize=100_000, n_jobs=1):
+        """
+        Tag Positionfixes with the zone they lie in.
+
+        See :func:`trackintel.geogr.tag_zones` for full documentation.
+        """
+        return ti.geogr.tag_zones(self, zones, method=method, re_project=re_project, chunksize=chunksize, n_jobs=n_jobs)
+
     def get_speed(self):
         """
         Compute speed per positionfix (in m/s)
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 import trackintel as ti
@@ -126,15 +127,29 @@ class Staypoints(TrackintelBase, TrackintelGeoDataFrame):
             self, method=method, time_threshold=time_threshold, activity_column_name=activity_column_name
         )
 
-    def spatial_filter(self, areas, method="within", re_project=False):
+    def spatial_filter(self, areas, method="within", re_project=False, area_col=None):
         """
         Filter Staypoints on a geo extent.
 
         See :func:`trackintel.geogr.spatial_filter` for full documentation.
         """
-        return ti.geogr.spatial_filter(self, areas, method=method, re_project=re_project)
+        return ti.geogr.spatial_filter(self, areas, method=method, re_project=re_project, area_col=area_col)
 
-    @doc(_shared_docs["write_csv"], first_arg="", long="staypoints", short="sp")
+    def tag_zones(self, zones, method="start", re_project=False, chunksize=100_000, n_jobs=1):
+        """
+        Tag Staypoints with the zone they lie in.
+
+        See :func:`trackintel.geogr.tag_zones` for full documentation.
+        """
+        return ti.geogr.tag_zones(self, zones, method=method, re_project=re_project, chunksize=chunksize, n_jobs=n_jobs)
+
+    @doc(
+        _shared_docs["write_csv"],
+        first_arg="",
+        long="staypoints",
+        short="sp",
+        encoding_arg=_shared_docs["csv_geometry_encoding"],
+    )
     def to_csv(self, filename, *args, **kwargs):
         ti.io.write_staypoints_csv(self, filename, *args, **kwargs)
 
@@ -144,6 +159,18 @@ class Staypoints(TrackintelBase, TrackintelGeoDataFrame):
     ):
         ti.io.write_staypoints_postgis(self, name, con, schema, if_exists, index, index_label, chunksize, dtype)
 
+    @doc(
+        _shared_docs["write_parquet"],
+        first_arg="",
+        long="staypoints",
+        short="sp",
+        sort_keys="'user_id' and 'started_at'",
+    )
+    def to_parquet(self, path, index=True, compression="snappy", row_group_size=100_000, sort=True, **kwargs):
+        ti.io.write_staypoints_parquet(
+            self, path, index=index, compression=compression, row_group_size=row_group_size, sort=sort, **kwargs
+        )
+
     def temporal_tracking_quality(self, granularity="all"):
         """
         Calculate per-user temporal tracking quality (temporal coverage).
@@ -168,10 +195,18 @@ class Staypoints(TrackintelBase, TrackintelGeoDataFrame):
         """
         return ti.analysis.radius_gyration(self, method, print_progress)
 
-    def jump_length(self):
+    def jump_length(self, dtype=np.float64):
         """
         Calculate jump length per user between consecutive staypoints.
 
         See :func:`trackintel.analysis.jump_length` for full documentation.
         """
-        return ti.analysis.jump_length(self)
+        return ti.analysis.jump_length(self, dtype=dtype)
+
+    def mobility_metrics(self, metrics=None, method="count", k=2, dtype=np.float64):
+        """
+        Calculate several mobility metrics per user at once.
+
+        See :func:`trackintel.analysis.mobility_metrics` for full documentation.
+        """
+        return ti.analysis.mobility_metrics(self, metrics=metrics, method=method, k=k, dtype=dtype)
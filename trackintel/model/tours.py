@@ -62,7 +62,13 @@ class Tours(TrackintelBase, TrackintelDataFrame):
             obj["finished_at"].dtype, pd.DatetimeTZDtype
         ), f"dtype of finished_at is {obj['finished_at'].dtype} but has to be datetime64 and timezone aware"
 
-    @doc(_shared_docs["write_csv"], first_arg="", long="tours", short="tours")
+    @doc(
+        _shared_docs["write_csv"],
+        first_arg="",
+        long="tours",
+        short="tours",
+        encoding_arg=_shared_docs["csv_trips_sep"],
+    )
     def to_csv(self, filename, *args, **kwargs):
         ti.io.write_tours_csv(self, filename, *args, **kwargs)
 
@@ -71,3 +77,15 @@ class Tours(TrackintelBase, TrackintelDataFrame):
         self, name, con, schema=None, if_exists="fail", index=True, index_label=None, chunksize=None, dtype=None
     ):
         ti.io.write_tours_postgis(self, name, con, schema, if_exists, index, index_label, chunksize, dtype)
+
+    @doc(
+        _shared_docs["write_parquet"],
+        first_arg="",
+        long="tours",
+        short="tours",
+        sort_keys="'user_id' and 'started_at'",
+    )
+    def to_parquet(self, path, index=True, compression="snappy", row_group_size=100_000, sort=True, **kwargs):
+        ti.io.write_tours_parquet(
+            self, path, index=index, compression=compression, row_group_size=row_group_size, sort=sort, **kwargs
+        )
@@ -36,6 +36,11 @@ class Triplegs(TrackintelBase, TrackintelGeoDataFrame):
     >>> triplegs.generate_trips()
     """
 
+    # stats of `calculate_tripleg_stats`, an internal name is neither a column nor propagated to new objects
+    _internal_names = TrackintelGeoDataFrame._internal_names + ["_stats_cache"]
+    _internal_names_set = set(_internal_names)
+    _stats_cache = None
+
     def __init__(self, *args, validate=True, **kwargs):
         super().__init__(*args, **kwargs)
         if validate:
@@ -71,7 +76,13 @@ class Triplegs(TrackintelBase, TrackintelGeoDataFrame):
         if obj.geometry.iloc[0].geom_type != "LineString":
             raise TypeError("The geometry must be a LineString (only first checked).")
 
-    @doc(_shared_docs["write_csv"], first_arg="", long="triplegs", short="tpls")
+    @doc(
+        _shared_docs["write_csv"],
+        first_arg="",
+        long="triplegs",
+        short="tpls",
+        encoding_arg=_shared_docs["csv_geometry_encoding"],
+    )
     def to_csv(self, filename, *args, **kwargs):
         ti.io.write_triplegs_csv(self, filename, *args, **kwargs)
 
@@ -81,6 +92,18 @@ class Triplegs(TrackintelBase, TrackintelGeoDataFrame):
     ):
         ti.io.write_triplegs_postgis(self, name, con, schema, if_exists, index, index_label, chunksize, dtype)
 
+    @doc(
+        _shared_docs["write_parquet"],
+        first_arg="",
+        long="triplegs",
+        short="tpls",
+        sort_keys="'user_id' and 'started_at'",
+    )
+    def to_parquet(self, path, index=True, compression="snappy", row_group_size=100_000, sort=True, **kwargs):
+        ti.io.write_triplegs_parquet(
+            self, path, index=index, compression=compression, row_group_size=row_group_size, sort=sort, **kwargs
+        )
+
     def calculate_distance_matrix(self, Y=None, dist_metric="haversine", n_jobs=0, **kwds):
         """
         Calculate a distance matrix based on a specific distance metric.
@@ -89,13 +112,21 @@ class Triplegs(TrackintelBase, TrackintelGeoDataFrame):
         """
         return ti.geogr.calculate_distance_matrix(self, Y=Y, dist_metric=dist_metric, n_jobs=n_jobs, **kwds)
 
-    def spatial_filter(self, areas, method="within", re_project=False):
+    def spatial_filter(self, areas, method="within", re_project=False, area_col=None):
         """
         Filter Triplegs on a geo extent.
 
         See :func:`trackintel.geogr.spatial_filter` for full documentation.
         """
-        return ti.geogr.spatial_filter(self, areas, method=method, re_project=re_project)
+        return ti.geogr.spatial_filter(self, areas, method=method, re_project=re_project, area_col=area_col)
+
+    def tag_zones(self, zones, method="start", re_project=False, chunksize=100_000, n_jobs=1):
+        """
+        Tag Triplegs with the zone they lie in.
+
+        See :func:`trackintel.geogr.tag_zones` for full documentation.
+        """
+        return ti.geogr.tag_zones(self, zones, method=method, re_project=re_project, chunksize=chunksize, n_jobs=n_jobs)
 
     def generate_trips(self, staypoints, gap_threshold=15, add_geometry=True):
         """
@@ -121,6 +152,14 @@ class Triplegs(TrackintelBase, TrackintelGeoDataFrame):
         """
         return ti.analysis.calculate_modal_split(self, freq=freq, metric=metric, per_user=per_user, norm=norm)
 
+    def calculate_modal_split_cube(self):
+        """
+        Aggregate triplegs per user, day and mode.
+
+        See :func:`trackintel.analysis.calculate_modal_split_cube` for full documentation.
+        """
+        return ti.analysis.calculate_modal_split_cube(self)
+
     def temporal_tracking_quality(self, granularity="all"):
         """
         Calculate per-user temporal tracking quality (temporal coverage).
@@ -129,6 +168,14 @@ class Triplegs(TrackintelBase, TrackintelGeoDataFrame):
         """
         return ti.analysis.temporal_tracking_quality(self, granularity=granularity)
 
+    def calculate_stats(self):
+        """
+        Calculate the length, duration and number of vertices of triplegs (cached).
+
+        See :func:`trackintel.geogr.calculate_tripleg_stats` for full documentation.
+        """
+        return ti.geogr.calculate_tripleg_stats(self)
+
     def get_speed(self, positionfixes=None, method="tpls_speed"):
         """
         Compute the average speed per positionfix for each tripleg (in m/s)
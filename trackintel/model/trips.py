@@ -110,7 +110,13 @@ class TripsDataFrame(TrackintelBase, TrackintelDataFrame):
             obj["finished_at"].dtype, pd.DatetimeTZDtype
         ), f"dtype of finished_at is {obj['finished_at'].dtype} but has to be datetime64 and timezone aware"
 
-    @doc(_shared_docs["write_csv"], first_arg="", long="trips", short="trips")
+    @doc(
+        _shared_docs["write_csv"],
+        first_arg="",
+        long="trips",
+        short="trips",
+        encoding_arg=_shared_docs["csv_geometry_encoding"],
+    )
     def to_csv(self, filename, *args, **kwargs):
         ti.io.write_trips_csv(self, filename, *args, **kwargs)
 
@@ -120,6 +126,18 @@ class TripsDataFrame(TrackintelBase, TrackintelDataFrame):
     ):
         ti.io.write_trips_postgis(self, name, con, schema, if_exists, index, index_label, chunksize, dtype)
 
+    @doc(
+        _shared_docs["write_parquet"],
+        first_arg="",
+        long="trips",
+        short="trips",
+        sort_keys="'user_id' and 'started_at'",
+    )
+    def to_parquet(self, path, index=True, compression="snappy", row_group_size=100_000, sort=True, **kwargs):
+        ti.io.write_trips_parquet(
+            self, path, index=index, compression=compression, row_group_size=row_group_size, sort=sort, **kwargs
+        )
+
     def temporal_tracking_quality(self, granularity="all"):
         """
         Calculate per-user temporal tracking quality (temporal coverage).
@@ -217,13 +217,13 @@ _shared_docs[
 Write {long} to csv file.
 
 Wraps the pandas to_csv function.
-Geometry get transformed to WKT before writing.
+Geometries get encoded as text (WKT by default) before writing.
 
 Parameters
 ----------{first_arg}
 filename : str
     The file to write to.
-
+{encoding_arg}
 args
     Additional arguments passed to pd.DataFrame.to_csv().
 
@@ -234,3 +234,104 @@ Examples
 --------
 >>> {short}.to_csv("export_{long}.csv")
 """
+
+_shared_docs[
+    "csv_geometry_encoding"
+] = """
+geometry_encoding : {'wkt', 'wkb_hex', 'xy'}, default 'wkt'
+    Encoding of the geometries. 'wkt' writes well-known text, 'wkb_hex' hex encoded well-known binary,
+    which is smaller and faster to write and read. 'xy' writes Point geometries as "longitude" and "latitude"
+    columns (other geometry columns as 'wkb_hex'). The csv readers detect the encoding automatically.
+"""
+
+_shared_docs[
+    "csv_trips_sep"
+] = """
+trips_sep : str, optional
+    If set, the trip ids of the column "trips" are written joined by 'trips_sep' (e.g., "1|2|3") instead of as
+    list (e.g., "[1, 2, 3]"). Joined ids are smaller and faster to read. :func:`trackintel.io.read_tours_csv`
+    reads both forms, its 'trips_sep' must match (default "|").
+"""
+
+_shared_docs[
+    "write_parquet"
+] = """
+Write {long} to a GeoParquet file.
+
+Geometries are stored as WKB together with their crs, timestamps keep their timezone. The model type is stored
+in the file metadata, such that reading the file back with :func:`trackintel.io.read_{long}_parquet` can skip the
+validation.
+
+Parameters
+----------{first_arg}
+path : str or path-like
+    The file to write to.
+
+index : bool, default True
+    Write the index as column. If False, the index is dropped. If None, a RangeIndex is only stored as metadata,
+    which is lost when reading with filters.
+
+compression : {{'snappy', 'gzip', 'brotli', 'zstd', None}}, default 'snappy'
+    Compression used for the data.
+
+row_group_size : int, default 100000
+    Maximum number of rows per row group.
+
+sort : bool, default True
+    Sort the {long} by {sort_keys} before writing and start a new row group only between users
+    (unless a single user exceeds 'row_group_size'). This allows reading single users or time windows without
+    decoding the whole file. The index is kept, only the order of the rows changes.
+
+kwargs
+    Additional keyword arguments passed to pyarrow.parquet.ParquetWriter().
+
+Notes
+-----
+Requires the optional dependency pyarrow.
+
+Examples
+--------
+>>> {short}.to_parquet("export_{long}.parquet")
+>>> ti.io.write_{long}_parquet({short}, "export_{long}.parquet", row_group_size=10_000)
+"""
+
+_shared_docs[
+    "read_parquet"
+] = """
+Read {long} from a (Geo)Parquet file.
+
+The filters are pushed down to the row group statistics of the file, row groups that cannot contain matching
+rows are never decoded. Write the file with :func:`trackintel.io.write_{long}_parquet` to have row groups aligned
+to users.
+
+Parameters
+----------
+path : str or path-like
+    The file to read.
+
+columns : list of str, optional
+    Only read these columns. The columns required by {model} and the geometry are always read.
+
+user_ids : list-like, optional
+    Only read the {long} of these users.
+{time_window}
+validate : bool, optional
+    Validate the {long}. If None, the validation is skipped for files written by trackintel from {long}.
+
+kwargs
+    Additional keyword arguments passed to geopandas.read_parquet() (or pandas.read_parquet() for files without
+    geometry).
+
+Returns
+-------
+{short} : {model}
+
+Notes
+-----
+Requires the optional dependency pyarrow.
+
+Examples
+--------
+>>> trackintel.read_{long}_parquet("data.parquet")
+>>> trackintel.read_{long}_parquet("data.parquet", columns=[], user_ids=[0, 1]{example_window})
+"""
@@ -2,6 +2,8 @@ from .positionfixes import generate_staypoints
 from .positionfixes import generate_triplegs
 
 from .util import calc_temp_overlap
+from .util import calc_temp_overlap_array
+from .util import interval_join
 from .util import applyParallel
 
 from .staypoints import generate_locations
@@ -19,5 +21,7 @@ __all__ = [
     "generate_trips",
     "generate_tours",
     "calc_temp_overlap",
+    "calc_temp_overlap_array",
+    "interval_join",
     "applyParallel",
 ]
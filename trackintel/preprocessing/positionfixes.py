@@ -5,11 +5,10 @@ import geopandas as gpd
 import numpy as np
 import pandas as pd
 from shapely.geometry import LineString
-from tqdm import tqdm
 
 from trackintel import Positionfixes, Staypoints, Triplegs
-from trackintel.geogr import check_gdf_planar, point_haversine_dist
-from trackintel.preprocessing.util import _explode_agg, angle_centroid_multipoints, applyParallel
+from trackintel.geogr import check_gdf_planar, kernels
+from trackintel.preprocessing.util import _explode_agg, _interval_join_pos, angle_centroid_multipoints, applyParallel
 
 
 def generate_staypoints(
@@ -34,13 +33,14 @@ def generate_staypoints(
     method : {'sliding'}
         Method to create staypoints. 'sliding' applies a sliding window over the data.
 
-    distance_metric : {'haversine'}
-        The distance metric used by the applied method.
+    distance_metric : {'haversine', 'equirectangular'}
+        The distance metric used by the applied method. 'equirectangular' is a faster approximation of
+        'haversine' that is accurate enough for thresholds below a few kilometers.
 
     dist_threshold : float, default 100
         The distance threshold for the 'sliding' method, i.e., how far someone has to travel to
-        generate a new staypoint. Units depend on the dist_func parameter. If 'distance_metric' is 'haversine' the
-        unit is in meters
+        generate a new staypoint. Units depend on the dist_func parameter. If 'distance_metric' is 'haversine'
+        or 'equirectangular' the unit is in meters
 
     time_threshold : float, default 5.0 (minutes)
         The time threshold for the 'sliding' method in minutes.
@@ -195,7 +195,8 @@ def generate_triplegs(
         `gap_threshold` minutes, a new tripleg will be generated.
 
     print_progress: boolean, default False
-        Show the progress bar for assigning staypoints to positionfixes if set to True.
+        Has no effect as staypoints are assigned to positionfixes of all users at once, only kept for backwards
+        compatibility.
 
     Returns
     -------
@@ -249,36 +250,22 @@ def generate_triplegs(
         # - step 2: Find first positionfix after a staypoint
         # (relevant if the pfs of sp are not provided, and we can only infer the pfs after sp through time)
         if case == 2:
-            # initialize the index list of pfs where a tpl will begin
-            insert_index_ls = []
+            # step 1
+            # All positionfixes with timestamp between staypoints are assigned the value 0
+            pfs_pos, _ = _interval_join_pos(
+                pfs, staypoints, "user_id", "tracked_at", ["started_at", "finished_at"], how="within", closed="left"
+            )
             pfs["staypoint_id"] = pd.NA
+            pfs.iloc[np.unique(pfs_pos), pfs.columns.get_loc("staypoint_id")] = 0
 
-            # initalize the variable 'disable' to control display of progress bar.
-            disable = not print_progress
-
-            for user_id_this in tqdm(pfs["user_id"].unique(), disable=disable):
-                sp_user = staypoints[staypoints["user_id"] == user_id_this]
-                pfs_user = pfs[pfs["user_id"] == user_id_this]
-
-                # step 1
-                # All positionfixes with timestamp between staypoints are assigned the value 0
-                # Intersect all positionfixes of a user with all staypoints of the same user
-                intervals = pd.IntervalIndex.from_arrays(sp_user["started_at"], sp_user["finished_at"], closed="left")
-                is_in_interval = pfs_user["tracked_at"].apply(lambda x: intervals.contains(x).any()).astype("bool")
-                pfs.loc[is_in_interval[is_in_interval].index, "staypoint_id"] = 0
-
-                # step 2
-                # Identify first positionfix after a staypoint
-                # find index of closest positionfix with equal or greater timestamp.
-                tracked_at_sorted = pfs_user["tracked_at"].sort_values()
-                insert_position_user = tracked_at_sorted.searchsorted(sp_user["finished_at"])
-                insert_index_user = tracked_at_sorted.iloc[insert_position_user].index
-
-                # store the insert insert_position_user in an array
-                insert_index_ls.extend(list(insert_index_user))
-            #
+            # step 2
+            # Identify first positionfix after a staypoint
+            # find closest positionfix with equal or greater timestamp.
+            _, pfs_pos = _interval_join_pos(
+                staypoints, pfs, "user_id", "finished_at", "tracked_at", how="following", closed="left"
+            )
             cond_staypoints_case2 = pd.Series(False, index=pfs.index)
-            cond_staypoints_case2.loc[insert_index_ls] = True
+            cond_staypoints_case2.iloc[pfs_pos] = True
 
         # initialize tripleg_id with pd.NA and fill all pfs that belong to staypoints with -1
         # pd.NA will be replaced later with tripleg ids
@@ -401,11 +388,19 @@ def generate_triplegs(
 def _generate_staypoints_sliding_user(
     df, geo_col, elevation_flag, dist_threshold, time_threshold, gap_threshold, distance_metric, include_last=False
 ):
-    """User level staypoint generation using sliding method, see generate_staypoints() function for parameter meaning."""
+    """User level staypoint generation using sliding method.
+
+    See generate_staypoints() function for parameter meaning.
+    """
     if distance_metric == "haversine":
-        dist_func = point_haversine_dist
+        dist_func = kernels.haversine_scalar
+    elif distance_metric == "equirectangular":
+        dist_func = kernels.equirectangular_scalar
     else:
-        raise ValueError("distance_metric unknown. We only support ['haversine']. " f"You passed {distance_metric}")
+        raise ValueError(
+            "distance_metric unknown. We only support ['haversine', 'equirectangular']. "
+            f"You passed {distance_metric}"
+        )
 
     df = df.sort_index(kind="stable").sort_values(by=["tracked_at"], kind="stable")
 
@@ -427,7 +422,7 @@ def _generate_staypoints_sliding_user(
             start = curr
             continue
 
-        delta_dist = dist_func(x[start], y[start], x[curr], y[curr], float_flag=True)
+        delta_dist = dist_func(x[start], y[start], x[curr], y[curr])
         if delta_dist >= dist_threshold:
             # we want the staypoint to have long enough duration
             if (df["tracked_at"].iloc[curr] - df["tracked_at"].iloc[start]) >= time_threshold:
@@ -6,7 +6,7 @@ import warnings
 
 from trackintel import Staypoints, Locations
 from trackintel.geogr import meters_to_decimal_degrees, check_gdf_planar
-from trackintel.preprocessing.util import applyParallel, angle_centroid_multipoints
+from trackintel.preprocessing.util import _datetime_ns, _interval_join_pos, angle_centroid_multipoints, applyParallel
 
 
 def generate_locations(
@@ -274,22 +274,18 @@ def merge_staypoints(staypoints, triplegs, max_time_gap="10min", agg={}):
     sp_merge = staypoints.copy()
     index_name = staypoints.index.name
 
-    # concat sp and tpls to get information whether there is a tripleg between to staypoints
-    tpls_merge = triplegs.copy()
-    tpls_merge["type"] = "tripleg"
-    sp_merge["type"] = "staypoint"
-    # convert datatypes in order to preserve the datatypes (especially ints) despite of NaNs during concat
+    # convert datatypes in order to preserve the datatypes (especially ints) despite of NaNs
     sp_merge = sp_merge.convert_dtypes()
-
-    # a joined dataframe sp_tpls is constructed to add the columns 'type' and 'next_type' to the 'sp_merge' table
-    # concat and sort by time
-    sp_tpls = pd.concat([sp_merge, tpls_merge]).sort_values(by=["user_id", "started_at"])
+    sp_merge = sp_merge.sort_values(by=["user_id", "started_at"])
     # TODO: we want to make tpls as argumtent optional and adapt this logic here. See issue #463.
-    sp_tpls.index.rename(index_name, inplace=True)
-    # get information whether the there is a tripleg after a staypoint
-    sp_tpls["next_type"] = sp_tpls["type"].shift(-1)
-    # get only staypoints, but with next type information
-    sp_merge = sp_tpls[sp_tpls["type"] == "staypoint"]
+    # get information whether there is a tripleg between a staypoint and the next staypoint
+    # -> the first tripleg starting after the staypoint starts before the next staypoint
+    sp_pos, tpls_pos = _interval_join_pos(sp_merge, triplegs, "user_id", "started_at", "started_at", how="following")
+    no_time = np.iinfo(np.int64).max
+    next_tpls_started_at = np.full(len(sp_merge), no_time)
+    next_tpls_started_at[sp_pos] = _datetime_ns(triplegs["started_at"])[tpls_pos]
+    next_sp_started_at = np.append(_datetime_ns(sp_merge["started_at"])[1:], no_time)
+    sp_merge["tripleg_between"] = next_tpls_started_at < next_sp_started_at
 
     # reset index and make temporary index
     sp_merge = sp_merge.reset_index()
@@ -314,7 +310,7 @@ def merge_staypoints(staypoints, triplegs, max_time_gap="10min", agg={}):
         cond1 = sp_merge["next_started_at"] - sp_merge["finished_at"] <= max_time_gap  # time constraint
         cond2 = sp_merge["location_id"] == sp_merge["next_location_id"]
         cond3 = sp_merge["index_temp"] != sp_merge["next_id"]  # already merged
-        cond4 = sp_merge["next_type"] != "tripleg"  # no tripleg inbetween two staypoints
+        cond4 = ~sp_merge["tripleg_between"]  # no tripleg inbetween two staypoints
         cond = cond0 & cond1 & cond2 & cond3 & cond4
 
         # assign index to next row
@@ -44,6 +44,233 @@ def calc_temp_overlap(start_1, end_1, start_2, end_2):
     return temp_overlap / dur
 
 
+def calc_temp_overlap_array(start_1, end_1, start_2, end_2, pairwise=False, user_1=None, user_2=None):
+    """
+    Calculate the portion of the first time spans that overlap with the second ones.
+
+    Array version of :func:`calc_temp_overlap`.
+
+    Parameters
+    ----------
+    start_1, end_1 : datetime, pd.Series or array-like of datetimes
+        start and end of the first time spans
+
+    start_2, end_2 : datetime, pd.Series or array-like of datetimes
+        start and end of the second time spans
+
+    pairwise : bool, default False
+        If False, the time spans are compared element-wise and must be broadcastable against each other.
+        If True, every first time span is compared against every second time span.
+
+    user_1, user_2 : array-like, optional
+        Only used if `pairwise` is True. The users of the first and second time spans, pairs of time spans of
+        different users get a missing ratio.
+
+    Returns
+    -------
+    np.ndarray
+        The ratios by which the first time spans overlap with the second ones. Of shape (len(start_1), len(start_2))
+        if `pairwise` is True.
+
+    Notes
+    -----
+    Timezone aware datetimes are compared in UTC. The pairwise comparison needs memory quadratic in the number of
+    time spans, use :func:`interval_join` to only find the overlapping pairs of large datasets.
+
+    Examples
+    --------
+    >>> ti.preprocessing.calc_temp_overlap_array(tpls["started_at"], tpls["finished_at"], start, end)
+    >>> ti.preprocessing.calc_temp_overlap_array(
+    ...     sp["started_at"], sp["finished_at"], sp["started_at"], sp["finished_at"], pairwise=True
+    ... )
+    """
+    start_1, end_1, start_2, end_2 = (_datetime_ns(t) for t in (start_1, end_1, start_2, end_2))
+    if pairwise:
+        start_1, end_1 = start_1[:, None], end_1[:, None]
+
+    overlap = np.minimum(end_1, end_2) - np.maximum(start_1, start_2)
+    dur = np.broadcast_to(end_1 - start_1, overlap.shape)
+    # either invalid or division 0 for dur <= 0
+    ratio = np.divide(overlap, dur, out=np.zeros(overlap.shape), where=dur > 0)
+    np.maximum(ratio, 0, out=ratio)
+
+    if pairwise and user_1 is not None and user_2 is not None:
+        ratio[np.asarray(user_1)[:, None] != np.asarray(user_2)] = np.nan
+    return ratio
+
+
+def interval_join(
+    left,
+    right,
+    by="user_id",
+    left_on=("started_at", "finished_at"),
+    right_on=("started_at", "finished_at"),
+    how="overlap",
+    closed="left",
+):
+    """
+    Join timestamps or intervals of two DataFrames based on time.
+
+    Only rows with the same value in the column `by` (e.g., the same user) are joined. The rows of `right` are
+    sorted per group and the matches are found with binary searches instead of comparing all pairs.
+
+    Parameters
+    ----------
+    left, right : DataFrame
+        The DataFrames to join, e.g., positionfixes, staypoints, triplegs or labels.
+
+    by : str or None, default "user_id"
+        Column the join is partitioned by. If None, all rows are joined against each other.
+
+    left_on, right_on : str or tuple of str, default ("started_at", "finished_at")
+        The column with the timestamps, or the columns with the start and the end of the intervals.
+        The expected columns depend on `how`.
+
+    how : {'overlap', 'within', 'preceding', 'following'}, default 'overlap'
+        - `overlap`: intervals of `left` with the overlapping intervals of `right`.
+        - `within`: timestamps of `left` with the intervals of `right` they lie in.
+        - `preceding`: timestamps of `left` with the latest earlier timestamp of `right`.
+        - `following`: timestamps of `left` with the earliest later timestamp of `right`.
+
+    closed : {'left', 'right', 'both', 'neither'}, default 'left'
+        Whether the intervals are closed on the left side, the right side, both or neither.
+
+        - `overlap`: intervals that only touch overlap if `closed` is 'both'.
+        - `within`: whether timestamps on the start or the end of an interval lie in it.
+        - `preceding`: equal timestamps match if the right side is closed.
+        - `following`: equal timestamps match if the left side is closed.
+
+    Returns
+    -------
+    pd.DataFrame
+        The columns `left` and `right` contain the index labels of the matched rows, sorted by the position
+        in `left` and then by the start of `right`. Rows of `left` without match are not returned.
+
+    Notes
+    -----
+    The join runs in O((n + m) log(n + m)) plus the size of the result. For `overlap` and `within` all
+    intervals of `right` that start within the duration of the longest interval of the group before the
+    timestamp (start) are checked, thus single very long intervals slow down the join. Rows with a missing value
+    in `by` and intervals that end before they start are never matched.
+
+    Examples
+    --------
+    >>> ti.preprocessing.interval_join(triplegs, labels)
+    >>> ti.preprocessing.interval_join(pfs, sp, left_on="tracked_at", how="within")
+    >>> ti.preprocessing.interval_join(sp, pfs, left_on="finished_at", right_on="tracked_at", how="following")
+    """
+    left_pos, right_pos = _interval_join_pos(left, right, by, left_on, right_on, how=how, closed=closed)
+    return pd.DataFrame({"left": left.index[left_pos], "right": right.index[right_pos]})
+
+
+def _interval_join_pos(left, right, by, left_on, right_on, how="overlap", closed="left"):
+    """Positions of the matched rows of `left` and `right`, see :func:`interval_join`."""
+    if how not in ["overlap", "within", "preceding", "following"]:
+        raise ValueError(
+            f"how unknown. We only support ['overlap', 'within', 'preceding', 'following']. You passed {how}"
+        )
+    if closed not in ["left", "right", "both", "neither"]:
+        raise ValueError(f"closed unknown. We only support ['left', 'right', 'both', 'neither']. You passed {closed}")
+
+    if by is None:
+        left_group = np.zeros(len(left), dtype=np.int64)
+        right_group = np.zeros(len(right), dtype=np.int64)
+    else:
+        codes, _ = pd.factorize(pd.concat([left[by], right[by]], ignore_index=True))
+        left_group, right_group = codes[: len(left)], codes[len(left) :]
+
+    if how == "overlap":
+        left_start, left_end = (_datetime_ns(left[c]) for c in left_on)
+    else:
+        left_start = left_end = _datetime_ns(left[left_on])
+    if how in ["overlap", "within"]:
+        right_start, right_end = (_datetime_ns(right[c]) for c in right_on)
+    else:
+        right_start = right_end = _datetime_ns(right[right_on])
+
+    # rows with a missing group (code -1) or with an interval that ends before it starts never match
+    left_keep = np.flatnonzero((left_group >= 0) & (left_end >= left_start))
+    right_keep = np.flatnonzero((right_group >= 0) & (right_end >= right_start))
+    left_pos, right_pos = _interval_join_arrays(
+        left_group[left_keep],
+        left_start[left_keep],
+        left_end[left_keep],
+        right_group[right_keep],
+        right_start[right_keep],
+        right_end[right_keep],
+        how,
+        closed,
+    )
+    return left_keep[left_pos], right_keep[right_pos]
+
+
+def _interval_join_arrays(left_group, left_start, left_end, right_group, right_start, right_end, how, closed):
+    """Positions of the matched rows given the group codes and timestamps (in ns), see :func:`interval_join`."""
+    closed_left = closed in ["left", "both"]
+    closed_right = closed in ["right", "both"]
+
+    # sort right by group and start
+    order = np.lexsort((right_start, right_group))
+    right_group, right_start = right_group[order], right_start[order]
+
+    if how == "preceding":
+        pos = _group_searchsorted(right_group, right_start, left_group, left_start, closed_right) - 1
+        return _nearest_match(pos, left_group, right_group, order)
+    if how == "following":
+        pos = _group_searchsorted(right_group, right_start, left_group, left_start, not closed_left)
+        return _nearest_match(pos, left_group, right_group, order)
+
+    right_end = right_end[order]
+    if how == "overlap":
+        # an interval overlaps if it starts before the end and ends after the start of the left interval
+        end_inclusive = start_inclusive = closed == "both"
+    else:
+        end_inclusive, start_inclusive = closed_left, closed_right
+    # -> search all intervals starting within [left_start - longest right interval of group, left_end)
+    n_groups = max(left_group.max(initial=-1), right_group.max(initial=-1)) + 1
+    max_duration = np.zeros(n_groups, dtype=np.int64)
+    np.maximum.at(max_duration, right_group, right_end - right_start)
+    first = _group_searchsorted(right_group, right_start, left_group, left_start - max_duration[left_group])
+    last = _group_searchsorted(right_group, right_start, left_group, left_end, end_inclusive)
+
+    counts = last - first
+    left_pos = np.repeat(np.arange(len(left_group)), counts)
+    right_pos = np.repeat(first - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+    if start_inclusive:
+        match = right_end[right_pos] >= left_start[left_pos]
+    else:
+        match = right_end[right_pos] > left_start[left_pos]
+    return left_pos[match], order[right_pos[match]]
+
+
+def _nearest_match(pos, left_group, right_group, order):
+    """Keep the positions that lie within the group of the left row."""
+    valid = (pos >= 0) & (pos < len(right_group))
+    valid[valid] = right_group[pos[valid]] == left_group[valid]
+    return np.flatnonzero(valid), order[pos[valid]]
+
+
+def _group_searchsorted(group, values, query_group, query_values, inclusive=False):
+    """Vectorized searchsorted within groups.
+
+    Returns the number of elements smaller than (or equal to if `inclusive`) the query value within all groups up to
+    the query group. `group` and `values` must be sorted lexicographically. The values are replaced by their rank,
+    such that the group and the value can be combined into a single int64 key.
+    """
+    unique = np.unique(values)
+    n = len(unique) + 1
+    key = group * n + np.searchsorted(unique, values)
+    query_key = query_group * n + np.searchsorted(unique, query_values, side="right" if inclusive else "left")
+    return np.searchsorted(key, query_key)
+
+
+def _datetime_ns(values):
+    """Return datetimes as int64 nanoseconds since the epoch (in UTC for timezone aware datetimes)."""
+    if np.ndim(values) == 0:
+        return np.int64(pd.Timestamp(values).value)
+    return pd.DatetimeIndex(values).asi8
+
+
 def applyParallel(dfGrouped, func, n_jobs, print_progress, **kwargs):
     """
     Funtion warpper to parallelize funtions after .groupby().